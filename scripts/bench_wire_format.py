@@ -0,0 +1,66 @@
+"""
+Compare XML vs JSON wire formats of lawService.do on large statutes:
+payload size, decode time (best of N) and peak decode memory.
+
+Usage:
+    OPEN_LAW_ID=... python scripts/bench_wire_format.py [MST ...] [--repeat N]
+
+Defaults to a few large statutes (민법, 형법, 상법 MSTs may change over time;
+pass current MSTs from search_korean_law if these 404).
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+from korean_law_mcp.api_client import KoreanLawClient
+from korean_law_mcp.utils import _parse_articles
+from korean_law_mcp.wire import FORMATS, JSON_DECODER, decode
+
+DEFAULT_MSTS = ["265307", "258943", "260491"]
+
+def fetch(client: KoreanLawClient, mst: str, fmt: str) -> bytes:
+    params = {"OC": client.user_id, "target": "law", "type": fmt, "MST": mst}
+    response = client.session.get(f"{client.BASE_URL}/DRF/lawService.do", params=params, timeout=client.timeout)
+    response.raise_for_status()
+    return response.content
+
+def measure(body: bytes, fmt: str, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        data = decode(body, fmt)
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    data = decode(body, fmt)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    root = data.get('법령') or {}
+    return best, peak, len(_parse_articles(root)) if isinstance(root, dict) else 0
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("msts", nargs="*", default=DEFAULT_MSTS)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    client = KoreanLawClient(cache=None)
+    print(f"JSON decoder: {JSON_DECODER}")
+    print(f"{'MST':>8} {'format':>6} {'bytes':>10} {'decode ms':>10} {'peak MB':>8} {'articles':>8}")
+    for mst in args.msts:
+        for fmt in FORMATS:
+            try:
+                body = fetch(client, mst, fmt)
+                seconds, peak, articles = measure(body, fmt, args.repeat)
+            except Exception as e:
+                print(f"{mst:>8} {fmt:>6} error: {e}")
+                continue
+            print(f"{mst:>8} {fmt:>6} {len(body):>10} {seconds * 1000:>10.1f} {peak / 2**20:>8.1f} {articles:>8}")
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,277 @@
+import logging
 import os
+import threading
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 import xmltodict
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from typing import Callable, Optional, Dict, Any, Tuple, Iterator
 from dotenv import load_dotenv
+from .cache import ResponseCache, get_default_cache, cache_key
+from .singleflight import SingleFlight
+from .throttle import get_throttle
+from .retry import RetryPolicy, DeadlineExceeded
+from .wire import WIRE_FORMAT, FORMATS, decode
+from .mirror import Mirror, get_default_mirror, OFFLINE
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger("korean-law-mcp")
+
+# Connection pool / timeout settings (override via environment)
+POOL_SIZE = int(os.getenv("KOREAN_LAW_POOL_SIZE", "20"))
+CONNECT_TIMEOUT = float(os.getenv("KOREAN_LAW_CONNECT_TIMEOUT", "5"))
+READ_TIMEOUT = float(os.getenv("KOREAN_LAW_READ_TIMEOUT", "30"))
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+# Attempts run here so a call can give up at its deadline (or hedge) without waiting on a stuck socket
+_attempt_pool = ThreadPoolExecutor(max_workers=POOL_SIZE * 2, thread_name_prefix="law-http")
+
+def create_session(pool_size: Optional[int] = None) -> requests.Session:
+    """
+    Build a keep-alive HTTP session with a bounded connection pool.
+    Requests beyond the pool size wait for a free connection instead of
+    opening throwaway sockets, so every call reuses an established TLS connection.
+    """
+    size = pool_size or POOL_SIZE
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=size, pool_maxsize=size, pool_block=True)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    })
+    return session
+
+def get_session() -> requests.Session:
+    """
+    Return the process-wide session shared by every KoreanLawClient.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+    return _session
+
+def _is_error_payload(data: Dict[str, Any]) -> bool:
+    """
+    The API answers misses with HTTP 200 and a bare message
+    (e.g. <Law>일치하는 법령이 없습니다.</Law>); such bodies must not be cached.
+    """
+    if len(data) != 1:
+        return False
+    root = next(iter(data.values()))
+    return root is None or isinstance(root, str)
+
+def _is_congestion(exc: BaseException) -> bool:
+    """
+    Errors that mean law.go.kr is overloaded or throttling us (as opposed to a bad request).
+    """
+    if isinstance(exc, (requests.Timeout, requests.ConnectionError)):
+        return True
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        return exc.response.status_code == 429 or exc.response.status_code >= 500
+    return False
+
 class KoreanLawClient:
     BASE_URL = "https://www.law.go.kr"
     
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None,
+                 timeout: Optional[Tuple[float, float]] = None,
+                 cache: Optional[ResponseCache] = None, wire_format: Optional[str] = None,
+                 mirror: Optional[Mirror] = None):
         self.user_id = os.getenv("OPEN_LAW_ID")
         if not self.user_id:
             raise ValueError("OPEN_LAW_ID environment variable is not set")
+        # Shared pool by default; pass a dedicated session (see create_session) to isolate one.
+        self.session = session or get_session()
+        # (connect, read) timeout in seconds
+        self.timeout = timeout or (CONNECT_TIMEOUT, READ_TIMEOUT)
+        # Persistent response cache (None when disabled via KOREAN_LAW_CACHE=0)
+        self.cache = cache if cache is not None else get_default_cache()
+        # Local copy of law.go.kr filled by `korean-law-mirror sync` (None if never synced)
+        self.mirror = mirror if mirror is not None else get_default_mirror()
+        # Identical concurrent requests share one upstream fetch and one parse
+        self.inflight = SingleFlight()
+        # Per-OC-key token bucket + adaptive concurrency limit shared by all clients of this key
+        self.throttle = get_throttle(self.user_id, _is_congestion)
+        # Deadline budget, jittered retries and p95 hedging (see retry.RetryPolicy)
+        self.retry = RetryPolicy()
+        # 'XML' or 'JSON' on the wire; either way callers get the xmltodict shape (see wire.decode)
+        self.wire_format = (wire_format or WIRE_FORMAT).upper()
+        if self.wire_format not in FORMATS:
+            raise ValueError(f"Unsupported wire format: {wire_format}")
+
+    def _get(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Perform a GET, coalescing identical in-flight requests.
+        The returned dict may be shared with concurrent callers; do not mutate it.
+        """
+        endpoint = url.rsplit("/", 1)[-1]
+        if self.wire_format != "XML":
+            params = {**params, "type": self.wire_format}
+        return self.inflight.do(cache_key(endpoint, params), self._fetch, url, endpoint, params)
+
+    def _fetch(self, url: str, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fetch through the response cache and pooled session, and decode the body.
+        """
+        fmt = params.get("type", "XML")
+        if self.cache:
+            body = self.cache.get(endpoint, params)
+            if body is not None:
+                return decode(body, fmt)
+        if self.mirror:
+            # Mirrored documents are stored as fetched by the sync (XML)
+            body = self.mirror.lookup(endpoint, params)
+            if body is not None:
+                return decode(body, "XML")
+            if OFFLINE and endpoint == "lawSearch.do":
+                listing = self.mirror.search(params)
+                if listing is not None:
+                    return listing
+
+        try:
+            content = self.retry.call(
+                endpoint,
+                lambda remaining, sent: self._send(url, params, remaining, sent),
+                _attempt_pool,
+                _is_congestion,
+                throttled=True,
+            )
+        except Exception:
+            # law.go.kr unreachable: answer searches from the mirror's listings if we have them
+            listing = self.mirror.search(params) if self.mirror and endpoint == "lawSearch.do" else None
+            if listing is None:
+                raise
+            logger.warning(f"{endpoint} failed; answering from the local mirror")
+            return listing
+        
+        # Parse XML/JSON to Dict
+        data = decode(content, fmt)
+        if self.cache and not _is_error_payload(data):
+            self.cache.put(endpoint, params, content)
+        return data
+
+    def _fetch_raw(self, endpoint: str, params: Dict[str, Any]) -> bytes:
+        """
+        Raw XML body through the throttle/retry path, bypassing cache, mirror and coalescing
+        (used by the mirror sync).
+        """
+        url = f"{self.BASE_URL}/DRF/{endpoint}"
+        params = {"OC": self.user_id, "type": "XML", **params}
+        return self.retry.call(
+            endpoint,
+            lambda remaining, sent: self._send(url, params, remaining, sent),
+            _attempt_pool,
+            _is_congestion,
+            throttled=True,
+        )
+
+    def _send(self, url: str, params: Dict[str, Any], remaining: float,
+              sent: Optional[Callable[[], None]] = None) -> bytes:
+        """
+        One HTTP attempt under the throttle, with the read timeout capped by the remaining budget.
+        `sent` is called once the throttle lets the request go (see RetryPolicy).
+        """
+        connect, read = self.timeout
+        with self.throttle.slot():
+            if sent is not None:
+                sent()
+            response = self.session.get(url, params=params, timeout=(connect, max(0.1, min(read, remaining))))
+            response.raise_for_status()
+        return response.content
+
+    def _open_stream(self, url: str, params: Dict[str, Any], remaining: float,
+                     sent: Optional[Callable[[], None]] = None) -> requests.Response:
+        """
+        One streaming attempt: returns the response as soon as its headers have arrived.
+        The throttle slot (and its latency sample) covers only the wait for the headers,
+        not the time the caller spends parsing the body.
+        """
+        connect, read = self.timeout
+        with self.throttle.slot():
+            if sent is not None:
+                sent()
+            response = self.session.get(url, params=params, stream=True,
+                                        timeout=(connect, max(0.1, min(read, remaining))))
+            try:
+                response.raise_for_status()
+            except Exception:
+                response.close()
+                raise
+        return response
+
+    def _stream(self, url: str, params: Dict[str, Any], chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Yield the raw response body in chunks without building it in memory first.
+        Served from the response cache or the mirror when possible. A body read to the end is
+        cached; if the caller stops early the connection is simply closed.
+        Opening the stream goes through the retry policy (retries and deadline, no hedging),
+        so it is retried only before the first byte. The whole body must then arrive within
+        what is left of the deadline: a server that trickles bytes is cut off with
+        DeadlineExceeded rather than holding the worker.
+        """
+        endpoint = url.rsplit("/", 1)[-1]
+        body = self.cache.get(endpoint, params) if self.cache else None
+        if body is None and self.mirror:
+            body = self.mirror.lookup(endpoint, params)
+        if body is not None:
+            view = memoryview(body)
+            for start in range(0, len(view), chunk_size):
+                yield bytes(view[start:start + chunk_size])
+            return
+
+        started = time.monotonic()
+        response = self.retry.call(
+            f"{endpoint} (stream)",
+            lambda remaining, sent: self._open_stream(url, params, remaining, sent),
+            _attempt_pool,
+            _is_congestion,
+            throttled=True,
+            hedge=False,
+        )
+        timed_out = threading.Event()
+
+        def cut_off():
+            timed_out.set()
+            # Unblocks a read stuck in the socket (urllib3 >= 2.3); close() otherwise
+            shutdown = getattr(response.raw, "shutdown", None)
+            (shutdown or response.close)()
+
+        watchdog = threading.Timer(max(0.0, self.retry.deadline - (time.monotonic() - started)), cut_off)
+        watchdog.daemon = True
+        watchdog.start()
+        received = [] if self.cache else None
+        try:
+            with response:
+                for chunk in response.iter_content(chunk_size):
+                    if timed_out.is_set():
+                        break
+                    if received is not None:
+                        received.append(chunk)
+                    yield chunk
+        except Exception:
+            if timed_out.is_set():
+                raise DeadlineExceeded(f"{endpoint} body not received within {self.retry.deadline:.1f}s")
+            raise
+        finally:
+            watchdog.cancel()
+        if timed_out.is_set():
+            raise DeadlineExceeded(f"{endpoint} body not received within {self.retry.deadline:.1f}s")
+
+        if received is not None:
+            body = b"".join(received)
+            # Bare "not found" messages are tiny; only those need a parse to rule out
+            if len(body) > 2048 or not _is_error_payload(xmltodict.parse(body)):
+                self.cache.put(endpoint, params, body)
 
     def search_law(self, query: str, target: str = "law") -> Dict[str, Any]:
         """
@@ -30,12 +288,7 @@ class KoreanLawClient:
             "query": query
         }
         
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        
-        # Parse XML to Dict
-        data = xmltodict.parse(response.content)
-        return data
+        return self._get(url, params)
 
     def get_law_detail(self, law_id: str) -> Dict[str, Any]:
         """
@@ -50,15 +303,27 @@ class KoreanLawClient:
             "MST": law_id
         }
         
-        response = requests.get(url, params=params)
-        response.raise_for_status()
+        return self._get(url, params)
+
+    def stream_law_detail(self, law_id: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Stream the raw XML of a law (statute) by MST in chunks.
+        Feed it to streaming.iter_law_sections to decode one article at a time.
+        """
+        url = f"{self.BASE_URL}/DRF/lawService.do"
+        params = {
+            "OC": self.user_id,
+            "target": "law",
+            "type": "XML",
+            "MST": law_id
+        }
         
-        data = xmltodict.parse(response.content)
-        return data
+        return self._stream(url, params, chunk_size)
 
-    def get_precedent_detail(self, prec_id: str) -> Dict[str, Any]:
+    def get_precedent_detail(self, prec_id: str, key: str = "ID") -> Dict[str, Any]:
         """
         Get details of a specific precedent.
+        key: 'ID' (default) or 'MST' - some older precedents are only addressable by MST.
         """
         # Endpoint: /DRF/lawService.do?OC={user_id}&target=prec&type=XML&ID={prec_id}
         url = f"{self.BASE_URL}/DRF/lawService.do"
@@ -66,14 +331,10 @@ class KoreanLawClient:
             "OC": self.user_id,
             "target": "prec",
             "type": "XML",
-            "ID": prec_id
+            key: prec_id
         }
         
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        
-        data = xmltodict.parse(response.content)
-        return data
+        return self._get(url, params)
 
     def get_admin_rule_detail(self, adm_id: str) -> Dict[str, Any]:
         """
@@ -88,10 +349,7 @@ class KoreanLawClient:
             "ID": adm_id
         }
         
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        
-        return xmltodict.parse(response.content)
+        return self._get(url, params)
 
     def get_prec_const_detail(self, detc_id: str) -> Dict[str, Any]:
         """
@@ -106,10 +364,7 @@ class KoreanLawClient:
             "ID": detc_id
         }
         
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        
-        return xmltodict.parse(response.content)
+        return self._get(url, params)
 
     def get_autonomous_law_detail(self, ordin_id: str) -> Dict[str, Any]:
         """
@@ -125,10 +380,7 @@ class KoreanLawClient:
             "MST": ordin_id
         }
         
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        
-        return xmltodict.parse(response.content)
+        return self._get(url, params)
 
     def get_legal_term_list(self, query: str) -> Dict[str, Any]:
         """
@@ -143,10 +395,7 @@ class KoreanLawClient:
             "query": query
         }
         
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        
-        return xmltodict.parse(response.content)
+        return self._get(url, params)
 
     def get_legal_term_detail(self, term_id: str) -> Dict[str, Any]:
         """
@@ -162,10 +411,7 @@ class KoreanLawClient:
             "MST": term_id # Verified in docs: Uses MST
         }
         
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        
-        return xmltodict.parse(response.content)
+        return self._get(url, params)
 
     def get_statutory_interpretation_list(self, query: str) -> Dict[str, Any]:
         """
@@ -180,10 +426,7 @@ class KoreanLawClient:
             "query": query
         }
         
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        
-        return xmltodict.parse(response.content)
+        return self._get(url, params)
 
     def get_statutory_interpretation_detail(self, interp_id: str) -> Dict[str, Any]:
         """
@@ -198,10 +441,7 @@ class KoreanLawClient:
             "ID": interp_id # Verified in docs: Uses ID (sometimes MST, will try ID first)
         }
         
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        
-        return xmltodict.parse(response.content)
+        return self._get(url, params)
 
     def get_law_history(self, law_id: str) -> Dict[str, Any]:
         """
@@ -217,10 +457,7 @@ class KoreanLawClient:
             "MST": law_id
         }
         
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        
-        return xmltodict.parse(response.content)
+        return self._get(url, params)
 
     def get_old_new_comparison(self, law_id: str) -> Dict[str, Any]:
         """
@@ -236,10 +473,7 @@ class KoreanLawClient:
             "MST": law_id
         }
         
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        
-        return xmltodict.parse(response.content)
+        return self._get(url, params)
 
 
 if __name__ == "__main__":
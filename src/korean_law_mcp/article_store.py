@@ -0,0 +1,442 @@
+import logging
+import mmap
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable, Iterator, Optional
+
+from .cache import CACHE_DIR, CACHE_ENABLED
+
+logger = logging.getLogger("korean-law-mcp")
+
+# On-disk article store for laws we have parsed (override via environment)
+ARTICLE_STORE_ENABLED = os.getenv("KOREAN_LAW_ARTICLE_STORE", "1" if CACHE_ENABLED else "0").lower() not in ("0", "false", "off", "no")
+ARTICLE_STORE_DIR = os.getenv("KOREAN_LAW_ARTICLE_STORE_DIR", CACHE_DIR)
+ARTICLE_STORE_MAX_MB = float(os.getenv("KOREAN_LAW_ARTICLE_STORE_MAX_MB", "256"))
+
+# Eviction trims the stored laws to this fraction of the limit, so it does not run on every write
+_LOW_WATER = 0.8
+# A full segment file is rewritten once less than this fraction of it is still in use
+_COMPACT_BELOW = 0.5
+
+# Fields of one stored article, in the order get()/articles() return them
+# (no, title, full_text, kind, branch) -- the constructor order of utils.Article
+ArticleRow = tuple[str, str, str, str, str]
+
+class ArticleStore:
+    """
+    Article texts of whole laws in append-only segment files, read through mmap.
+
+    A law (MST) is written once as a single UTF-8 block: its article texts joined by
+    newlines, in order. An SQLite index maps the MST to its segment and block and each
+    (article number, branch number) to a byte range inside it, so one article is
+    one small slice of a mapping and a whole law is one contiguous slice.
+    Nothing is unpickled or re-parsed, and every process reading the files shares
+    the OS page cache.
+
+    An MST names one promulgated version, so stored laws never change; writers in
+    several processes are serialised by the index's write transaction.
+
+    The store is kept under max_bytes: storing a newer version of a law (same name,
+    later `version`) drops the older ones, and past the limit the least recently read
+    laws are evicted. A segment that is mostly dead space has its remaining laws copied
+    into the current segment and is deleted. Segment files are never rewritten in place,
+    so a reader that mapped one before it was deleted still reads valid bytes.
+    """
+    def __init__(self, directory: Optional[str] = None, max_bytes: Optional[int] = None):
+        directory = directory or ARTICLE_STORE_DIR
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_bytes = int(max_bytes if max_bytes is not None else ARTICLE_STORE_MAX_MB * 1024 * 1024)
+        # New laws go to a fresh segment once the current one reaches this size
+        self.segment_bytes = max(64 * 1024, self.max_bytes // 4)
+        self.data_path = self._segment_path(0)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(directory, "articles.idx"),
+                                     check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS laws ("
+            " law_id TEXT PRIMARY KEY, name TEXT, offset INTEGER, length INTEGER, count INTEGER)"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(laws)")}
+        for column, ddl in (("segment", "INTEGER DEFAULT 0"), ("version", "TEXT DEFAULT ''"), ("used", "REAL DEFAULT 0")):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE laws ADD COLUMN {column} {ddl}")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS laws_name ON laws (name)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS segments (segment INTEGER PRIMARY KEY)")
+        self._conn.execute("INSERT OR IGNORE INTO segments VALUES (0)")
+        # art_no / art_branch are the numeric lookup key; NULL when the number is not numeric
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS articles ("
+            " law_id TEXT, seq INTEGER, art_no INTEGER, art_branch INTEGER,"
+            " no TEXT, branch TEXT, title TEXT, kind TEXT, offset INTEGER, length INTEGER,"
+            " PRIMARY KEY (law_id, seq))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS articles_key ON articles (law_id, art_no, art_branch)")
+        # Reference graph per law; a row in ref_laws means the graph was saved (it may have no edges)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS ref_laws (law_id TEXT PRIMARY KEY)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS refs ("
+            " law_id TEXT, seq INTEGER, src_no INTEGER, src_branch INTEGER,"
+            " target_law TEXT, art_no INTEGER, art_branch INTEGER, PRIMARY KEY (law_id, seq))"
+        )
+        # segment -> (open file, mmap or None)
+        self._files: dict = {}
+        # law_id -> last read time, written to the index with the next write transaction
+        self._used: dict = {}
+        self.reads = 0
+        self.evicted = 0
+        self.compactions = 0
+
+    def _segment_path(self, segment: int) -> str:
+        name = "articles.dat" if segment == 0 else f"articles.{segment}.dat"
+        return os.path.join(self.directory, name)
+
+    def _file(self, segment: int):
+        # Caller holds self._lock
+        entry = self._files.get(segment)
+        if entry is None:
+            path = self._segment_path(segment)
+            # Only the segment being written to may be created; an old one may have been compacted away
+            f = open(path, "a+b") if segment == self._active_segment() else open(path, "rb")
+            entry = self._files[segment] = [f, None]
+        return entry
+
+    def _active_segment(self) -> int:
+        return self._conn.execute("SELECT MAX(segment) FROM segments").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            for f, mapping in self._files.values():
+                if mapping is not None:
+                    mapping.close()
+                f.close()
+            self._files.clear()
+            self._conn.close()
+
+    # --- writing ---
+
+    def has(self, law_id: str) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM laws WHERE law_id = ?", (str(law_id),)).fetchone() is not None
+
+    def put_law(self, law_id: str, name: str, articles: Iterable[tuple[Optional[tuple[int, int]], ArticleRow]],
+                version: str = "") -> bool:
+        """
+        Store a law given (key, (no, title, full_text, kind, branch)) per article, in order.
+        `version` orders versions of the same law (e.g. the enforcement date); stored
+        versions with the same name and an older version are dropped.
+        Returns False if the law was already stored.
+        """
+        law_id = str(law_id)
+        articles = list(articles)
+        doomed: list = []
+        with self._lock:
+            # BEGIN IMMEDIATE takes the write lock, so the append offset is ours until COMMIT
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if self._conn.execute("SELECT 1 FROM laws WHERE law_id = ?", (law_id,)).fetchone():
+                    self._conn.execute("ROLLBACK")
+                    return False
+                self._flush_used()
+                rows = []
+                chunks = []
+                pos = 0
+                for seq, (key, (no, title, text, kind, branch)) in enumerate(articles):
+                    if seq:
+                        chunks.append(b"\n")
+                        pos += 1
+                    raw = text.encode("utf-8")
+                    art_no, art_branch = key if key is not None else (None, None)
+                    rows.append([law_id, seq, art_no, art_branch, no, branch, title, kind, pos, len(raw)])
+                    chunks.append(raw)
+                    pos += len(raw)
+                segment, start = self._append(b"".join(chunks))
+                for row in rows:
+                    row[8] += start
+                self._conn.executemany("INSERT INTO articles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+                self._conn.execute(
+                    "INSERT INTO laws (law_id, name, offset, length, count, segment, version, used)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (law_id, name, start, pos, len(rows), segment, version, time.time()),
+                )
+                if version:
+                    superseded = self._conn.execute(
+                        "SELECT law_id FROM laws WHERE name = ? AND law_id != ? AND version < ?",
+                        (name, law_id, version),
+                    ).fetchall()
+                    self._drop([old for old, in superseded])
+                self._evict(keep=law_id)
+                doomed = self._compact()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                # Bytes already appended stay as unreferenced padding until their segment is compacted
+                self._conn.execute("ROLLBACK")
+                raise
+            self._forget_segments(doomed)
+        return True
+
+    def _append(self, block: bytes) -> tuple[int, int]:
+        # Caller holds self._lock and the write transaction
+        segment = self._active_segment()
+        path = self._segment_path(segment)
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        if size and size + len(block) > self.segment_bytes:
+            segment += 1
+            self._conn.execute("INSERT INTO segments VALUES (?)", (segment,))
+        f = self._file(segment)[0]
+        if "a" not in f.mode:
+            # Opened read-only while another process was still writing to it
+            f.close()
+            del self._files[segment]
+            f = self._file(segment)[0]
+        f.seek(0, os.SEEK_END)
+        start = f.tell()
+        f.write(block)
+        f.flush()
+        return segment, start
+
+    def _flush_used(self) -> None:
+        # Caller holds self._lock and the write transaction
+        if self._used:
+            self._conn.executemany("UPDATE laws SET used = ? WHERE law_id = ?",
+                                   [(used, law_id) for law_id, used in self._used.items()])
+            self._used.clear()
+
+    def _drop(self, law_ids: list) -> None:
+        # Caller holds self._lock and the write transaction
+        for law_id in law_ids:
+            for table in ("laws", "articles", "refs", "ref_laws"):
+                self._conn.execute(f"DELETE FROM {table} WHERE law_id = ?", (law_id,))
+
+    def _evict(self, keep: str) -> None:
+        # Caller holds self._lock and the write transaction
+        live = self._conn.execute("SELECT COALESCE(SUM(length), 0) FROM laws").fetchone()[0]
+        if live <= self.max_bytes:
+            return
+        target = self.max_bytes * _LOW_WATER
+        victims = []
+        for law_id, length in self._conn.execute(
+            "SELECT law_id, length FROM laws WHERE law_id != ? ORDER BY used", (keep,)
+        ).fetchall():
+            if live <= target:
+                break
+            victims.append(law_id)
+            live -= length
+        self._drop(victims)
+        self.evicted += len(victims)
+
+    def _compact(self) -> list:
+        """
+        Move the laws of mostly-dead segments into the active one and forget those segments.
+        Returns the segments whose files can be deleted once the transaction commits.
+        """
+        # Caller holds self._lock and the write transaction
+        active = self._active_segment()
+        doomed = []
+        for segment, in self._conn.execute("SELECT segment FROM segments WHERE segment != ?", (active,)).fetchall():
+            path = self._segment_path(segment)
+            size = os.path.getsize(path) if os.path.exists(path) else 0
+            laws = self._conn.execute(
+                "SELECT law_id, offset, length FROM laws WHERE segment = ?", (segment,)
+            ).fetchall()
+            if sum(length for _, _, length in laws) >= size * _COMPACT_BELOW:
+                continue
+            for law_id, offset, length in laws:
+                block = self._read(segment, offset, length).encode("utf-8")
+                new_segment, start = self._append(block)
+                active = new_segment
+                self._conn.execute("UPDATE articles SET offset = offset + ? WHERE law_id = ?", (start - offset, law_id))
+                self._conn.execute("UPDATE laws SET segment = ?, offset = ? WHERE law_id = ?", (new_segment, start, law_id))
+            self._conn.execute("DELETE FROM segments WHERE segment = ?", (segment,))
+            doomed.append(segment)
+            self.compactions += 1
+        return doomed
+
+    def _forget_segments(self, segments: list) -> None:
+        # Caller holds self._lock; the transaction that dropped the segments has committed
+        for segment in segments:
+            entry = self._files.pop(segment, None)
+            if entry is not None:
+                if entry[1] is not None:
+                    entry[1].close()
+                entry[0].close()
+            try:
+                os.remove(self._segment_path(segment))
+            except OSError as e:
+                logger.warning(f"Could not remove compacted article segment {segment}: {e}")
+
+    def put_references(self, law_id: str, edges: Iterable[tuple[tuple[int, int], tuple[Optional[str], tuple[int, int]]]]) -> None:
+        """
+        Save a law's reference graph as (source key, (target law or None, target key)) pairs.
+        """
+        law_id = str(law_id)
+        rows = [(law_id, seq, src[0], src[1], target_law, key[0], key[1])
+                for seq, (src, (target_law, key)) in enumerate(edges)]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("DELETE FROM refs WHERE law_id = ?", (law_id,))
+                self._conn.executemany("INSERT INTO refs VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+                self._conn.execute("INSERT OR IGNORE INTO ref_laws VALUES (?)", (law_id,))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def get_references(self, law_id: str) -> Optional[list]:
+        """
+        The saved (source key, (target law, target key)) pairs in order, or None if never saved.
+        """
+        law_id = str(law_id)
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM ref_laws WHERE law_id = ?", (law_id,)).fetchone() is None:
+                return None
+            rows = self._conn.execute(
+                "SELECT src_no, src_branch, target_law, art_no, art_branch FROM refs WHERE law_id = ? ORDER BY seq",
+                (law_id,),
+            ).fetchall()
+        return [((src_no, src_branch), (target_law, (art_no, art_branch)))
+                for src_no, src_branch, target_law, art_no, art_branch in rows]
+
+    # --- reading ---
+
+    def _read(self, segment: int, offset: int, length: int) -> str:
+        # Caller holds self._lock
+        if length == 0:
+            return ""
+        end = offset + length
+        entry = self._file(segment)
+        if entry[1] is None or len(entry[1]) < end:
+            # The file grew (here or in another process) since it was mapped
+            if entry[1] is not None:
+                entry[1].close()
+            entry[1] = mmap.mmap(entry[0].fileno(), 0, access=mmap.ACCESS_READ)
+        self.reads += 1
+        # Decode straight from the mapped pages; release the views so the map can be replaced
+        with memoryview(entry[1]) as view, view[offset:end] as part:
+            return str(part, "utf-8")
+
+    def _law(self, law_id: str) -> Optional[tuple]:
+        # Caller holds self._lock
+        row = self._conn.execute(
+            "SELECT name, segment, offset, length FROM laws WHERE law_id = ?", (law_id,)
+        ).fetchone()
+        if row is not None:
+            self._used[law_id] = time.time()
+        return row
+
+    def _retrying(self, read):
+        """
+        Run a read, once more if its segment was compacted away between the index
+        lookup and the file access (by a writer in another process).
+        """
+        try:
+            return read()
+        except FileNotFoundError:
+            return read()
+
+    def law_name(self, law_id: str) -> Optional[str]:
+        """
+        The stored law's name, or None if the law is not stored.
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT name FROM laws WHERE law_id = ?", (str(law_id),)).fetchone()
+        return row[0] if row else None
+
+    def get(self, law_id: str, key: tuple[int, int]) -> tuple[Optional[str], Optional[ArticleRow]]:
+        """
+        (law name, article) for a numeric (article, branch) key, preferring a content
+        article ('조문') over a header with the same number.
+        The name is None if the law is not stored; the article is None if it has no such number.
+        """
+        law_id = str(law_id)
+
+        def read():
+            with self._lock:
+                law = self._law(law_id)
+                if law is None:
+                    return None, None
+                row = self._conn.execute(
+                    "SELECT no, branch, title, kind, offset, length FROM articles"
+                    " WHERE law_id = ? AND art_no = ? AND art_branch = ?"
+                    " ORDER BY kind != '조문', seq LIMIT 1",
+                    (law_id, key[0], key[1]),
+                ).fetchone()
+                if row is None:
+                    return law[0], None
+                no, branch, title, kind, offset, length = row
+                return law[0], (no, title, self._read(law[1], offset, length), kind, branch)
+        return self._retrying(read)
+
+    def articles(self, law_id: str) -> Iterator[ArticleRow]:
+        """
+        Every stored article of a law, in order (nothing if the law is not stored).
+        """
+        law_id = str(law_id)
+
+        def read():
+            with self._lock:
+                law = self._law(law_id)
+                if law is None:
+                    return []
+                rows = self._conn.execute(
+                    "SELECT no, branch, title, kind, offset, length FROM articles WHERE law_id = ? ORDER BY seq",
+                    (law_id,),
+                ).fetchall()
+                # Map the block now, so a later compaction cannot take the file away mid-iteration
+                self._read(law[1], law[2], law[3])
+                return [(law[1], row) for row in rows]
+        for segment, (no, branch, title, kind, offset, length) in self._retrying(read):
+            with self._lock:
+                text = self._read(segment, offset, length)
+            yield no, title, text, kind, branch
+
+    def law_text(self, law_id: str) -> tuple[Optional[str], Optional[str]]:
+        """
+        (name, all article texts joined by newlines) with a single read, or (None, None).
+        """
+        law_id = str(law_id)
+
+        def read():
+            with self._lock:
+                row = self._law(law_id)
+                if row is None:
+                    return None, None
+                return row[0], self._read(row[1], row[2], row[3])
+        return self._retrying(read)
+
+    def stats(self) -> dict:
+        with self._lock:
+            laws, articles, live = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(count), 0), COALESCE(SUM(length), 0) FROM laws"
+            ).fetchone()
+            segments = [segment for segment, in self._conn.execute("SELECT segment FROM segments")]
+        size = sum(os.path.getsize(self._segment_path(s)) for s in segments if os.path.exists(self._segment_path(s)))
+        return {"laws": laws, "articles": articles, "bytes": size, "live_bytes": live, "max_bytes": self.max_bytes,
+                "segments": len(segments), "evicted": self.evicted, "compactions": self.compactions, "reads": self.reads}
+
+_default_store: Optional[ArticleStore] = None
+_default_failed = False
+_default_lock = threading.Lock()
+
+def get_default_store() -> Optional[ArticleStore]:
+    """
+    Return the shared article store, or None when disabled (KOREAN_LAW_ARTICLE_STORE=0)
+    or when the store directory is not usable.
+    """
+    global _default_store, _default_failed
+    if not ARTICLE_STORE_ENABLED or _default_failed:
+        return None
+    if _default_store is None:
+        with _default_lock:
+            if _default_store is None and not _default_failed:
+                try:
+                    _default_store = ArticleStore()
+                except (OSError, sqlite3.Error) as e:
+                    logger.warning(f"Article store disabled: {e}")
+                    _default_failed = True
+    return _default_store
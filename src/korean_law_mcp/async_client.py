@@ -0,0 +1,244 @@
+import asyncio
+import os
+import time
+import httpx
+from typing import Callable, Optional, Dict, Any, AsyncIterator
+from .api_client import KoreanLawClient, POOL_SIZE, CONNECT_TIMEOUT, READ_TIMEOUT, STREAM_CHUNK_SIZE
+from .cache import cache_key
+from .singleflight import AsyncSingleFlight
+from .throttle import AsyncThrottle, AsyncAdaptiveLimiter, get_bucket, MAX_CONCURRENCY
+from .retry import RetryPolicy, DeadlineExceeded
+from .wire import WIRE_FORMAT, FORMATS, decode
+
+# Bodies larger than this are parsed in a worker thread so the event loop stays responsive.
+PARSE_OFFLOAD_BYTES = 256 * 1024
+
+def _is_congestion(exc: BaseException) -> bool:
+    """
+    Errors that mean law.go.kr is overloaded or throttling us (as opposed to a bad request).
+    """
+    if isinstance(exc, httpx.TransportError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code == 429 or exc.response.status_code >= 500
+    return False
+
+class AsyncKoreanLawClient:
+    """
+    asyncio counterpart of KoreanLawClient with the same method surface.
+    Every method is a coroutine returning the same parsed dict as its sync twin.
+
+    Usage:
+        async with AsyncKoreanLawClient() as client:
+            data = await client.search_law("민법")
+    """
+    BASE_URL = KoreanLawClient.BASE_URL
+
+    def __init__(self, max_concurrency: Optional[int] = None, pool_size: Optional[int] = None,
+                 http_client: Optional[httpx.AsyncClient] = None, wire_format: Optional[str] = None):
+        self.user_id = os.getenv("OPEN_LAW_ID")
+        if not self.user_id:
+            raise ValueError("OPEN_LAW_ID environment variable is not set")
+        size = pool_size or POOL_SIZE
+        # httpx negotiates gzip/deflate and keeps connections alive within the pool limits
+        self.http = http_client or httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=size, max_keepalive_connections=size),
+            timeout=httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT),
+        )
+        # Shares the OC key's token bucket with sync clients; the adaptive in-flight
+        # limit (capped at max_concurrency) is per client since it is bound to one event loop.
+        self.throttle = AsyncThrottle(
+            get_bucket(self.user_id),
+            AsyncAdaptiveLimiter(max_limit=max_concurrency or MAX_CONCURRENCY),
+            _is_congestion,
+        )
+        # Identical concurrent requests share one upstream fetch and one parse
+        self.inflight = AsyncSingleFlight()
+        # Deadline budget, jittered retries and p95 hedging (see retry.RetryPolicy)
+        self.retry = RetryPolicy()
+        # 'XML' or 'JSON' on the wire; either way callers get the xmltodict shape (see wire.decode)
+        self.wire_format = (wire_format or WIRE_FORMAT).upper()
+        if self.wire_format not in FORMATS:
+            raise ValueError(f"Unsupported wire format: {wire_format}")
+
+    async def __aenter__(self) -> "AsyncKoreanLawClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.http.aclose()
+
+    async def _get(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Perform a GET, coalescing identical in-flight requests.
+        The returned dict may be shared with concurrent callers; do not mutate it.
+        """
+        params = {"type": self.wire_format, **params}
+        return await self.inflight.do(cache_key(endpoint, params), self._fetch, endpoint, params)
+
+    async def _fetch(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Perform a GET (with deadline, retries and hedging) and decode the body.
+        """
+        url = f"{self.BASE_URL}/DRF/{endpoint}"
+        params = {"OC": self.user_id, **params}
+        content = await self.retry.acall(
+            endpoint,
+            lambda remaining, sent: self._send(url, params, remaining, sent),
+            _is_congestion,
+            throttled=True,
+        )
+
+        fmt = params["type"]
+        if len(content) > PARSE_OFFLOAD_BYTES:
+            return await asyncio.to_thread(decode, content, fmt)
+        return decode(content, fmt)
+
+    async def _send(self, url: str, params: Dict[str, Any], remaining: float,
+                    sent: Optional[Callable[[], None]] = None) -> bytes:
+        """
+        One HTTP attempt under the rate limit / concurrency bound.
+        `sent` is called once the throttle lets the request go (see RetryPolicy).
+        """
+        async with self.throttle.slot():
+            if sent is not None:
+                sent()
+            timeout = httpx.Timeout(min(READ_TIMEOUT, max(0.1, remaining)), connect=CONNECT_TIMEOUT)
+            response = await self.http.get(url, params=params, timeout=timeout)
+            response.raise_for_status()
+            return response.content
+
+    async def _open_stream(self, url: str, params: Dict[str, Any], remaining: float,
+                           sent: Optional[Callable[[], None]] = None) -> httpx.Response:
+        """
+        One streaming attempt: returns the response as soon as its headers have arrived.
+        The throttle slot (and its latency sample) covers only the wait for the headers,
+        not the time the caller spends consuming the body.
+        """
+        async with self.throttle.slot():
+            if sent is not None:
+                sent()
+            timeout = httpx.Timeout(min(READ_TIMEOUT, max(0.1, remaining)), connect=CONNECT_TIMEOUT)
+            request = self.http.build_request("GET", url, params=params, timeout=timeout)
+            response = await self.http.send(request, stream=True)
+            try:
+                response.raise_for_status()
+            except BaseException:
+                await response.aclose()
+                raise
+        return response
+
+    async def _stream(self, endpoint: str, params: Dict[str, Any],
+                      chunk_size: int = STREAM_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """
+        Yield the raw response body in chunks. Opening the stream goes through the retry
+        policy (retries and deadline, no hedging), so it is retried only before the first
+        byte; the whole body must then arrive within what is left of the deadline, or
+        DeadlineExceeded is raised.
+        """
+        url = f"{self.BASE_URL}/DRF/{endpoint}"
+        params = {"OC": self.user_id, "type": "XML", **params}
+        started = time.monotonic()
+        response = await self.retry.acall(
+            f"{endpoint} (stream)",
+            lambda remaining, sent: self._open_stream(url, params, remaining, sent),
+            _is_congestion,
+            throttled=True,
+            hedge=False,
+        )
+        try:
+            chunks = response.aiter_bytes(chunk_size)
+            while True:
+                remaining = self.retry.deadline - (time.monotonic() - started)
+                try:
+                    chunk = await asyncio.wait_for(chunks.__anext__(), max(0.0, remaining))
+                except StopAsyncIteration:
+                    break
+                except asyncio.TimeoutError:
+                    raise DeadlineExceeded(f"{endpoint} body not received within {self.retry.deadline:.1f}s")
+                yield chunk
+        finally:
+            await response.aclose()
+
+    async def search_law(self, query: str, target: str = "law") -> Dict[str, Any]:
+        """
+        Search for laws/regulations.
+        Target: 'law' (statute), 'prec' (precedent), etc.
+        """
+        return await self._get("lawSearch.do", {"target": target, "query": query})
+
+    async def get_law_detail(self, law_id: str) -> Dict[str, Any]:
+        """
+        Get details of a specific law (statute) by MST.
+        """
+        return await self._get("lawService.do", {"target": "law", "MST": law_id})
+
+    async def stream_law_detail(self, law_id: str, chunk_size: int = STREAM_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """
+        Stream the raw XML of a law (statute) by MST in chunks.
+        """
+        async for chunk in self._stream("lawService.do", {"target": "law", "MST": law_id}, chunk_size):
+            yield chunk
+
+    async def get_precedent_detail(self, prec_id: str, key: str = "ID") -> Dict[str, Any]:
+        """
+        Get details of a specific precedent.
+        key: 'ID' (default) or 'MST'.
+        """
+        return await self._get("lawService.do", {"target": "prec", key: prec_id})
+
+    async def get_admin_rule_detail(self, adm_id: str) -> Dict[str, Any]:
+        """
+        Get details of an administrative rule (admrul).
+        """
+        return await self._get("lawService.do", {"target": "admrul", "ID": adm_id})
+
+    async def get_prec_const_detail(self, detc_id: str) -> Dict[str, Any]:
+        """
+        Get details of a Constitutional Court decision (detc).
+        """
+        return await self._get("lawService.do", {"target": "detc", "ID": detc_id})
+
+    async def get_autonomous_law_detail(self, ordin_id: str) -> Dict[str, Any]:
+        """
+        Get details of an autonomous law (ordin). Uses 'MST'.
+        """
+        return await self._get("lawService.do", {"target": "ordin", "MST": ordin_id})
+
+    async def get_legal_term_list(self, query: str) -> Dict[str, Any]:
+        """
+        Search for legal terms (Law Terms).
+        """
+        return await self._get("lawSearch.do", {"target": "lstrm", "query": query})
+
+    async def get_legal_term_detail(self, term_id: str) -> Dict[str, Any]:
+        """
+        Get details of a legal term. Uses 'MST'.
+        """
+        return await self._get("lawService.do", {"target": "lstrm", "MST": term_id})
+
+    async def get_statutory_interpretation_list(self, query: str) -> Dict[str, Any]:
+        """
+        Search for statutory interpretations (expc).
+        """
+        return await self._get("lawSearch.do", {"target": "expc", "query": query})
+
+    async def get_statutory_interpretation_detail(self, interp_id: str) -> Dict[str, Any]:
+        """
+        Get details of a statutory interpretation.
+        """
+        return await self._get("lawService.do", {"target": "expc", "ID": interp_id})
+
+    async def get_law_history(self, law_id: str) -> Dict[str, Any]:
+        """
+        Get revision history of a law (lsHistory).
+        """
+        return await self._get("lawService.do", {"target": "lsHistory", "MST": law_id})
+
+    async def get_old_new_comparison(self, law_id: str) -> Dict[str, Any]:
+        """
+        Get old/new article comparison for a law (신구조문대비, lsOnC).
+        """
+        return await self._get("lawService.do", {"target": "lsOnC", "MST": law_id})
@@ -0,0 +1,272 @@
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Hashable
+
+logger = logging.getLogger("korean-law-mcp")
+
+# On-disk cache location and limits (override via environment)
+CACHE_DIR = os.getenv("KOREAN_LAW_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "korean-law-mcp"))
+CACHE_ENABLED = os.getenv("KOREAN_LAW_CACHE", "1").lower() not in ("0", "false", "off", "no")
+CACHE_MAX_MB = float(os.getenv("KOREAN_LAW_CACHE_MAX_MB", "256"))
+
+# In-process cache of parsed laws
+LAW_CACHE_MAX_MB = float(os.getenv("KOREAN_LAW_LAW_CACHE_MB", "128"))
+
+DAY = 24 * 60 * 60
+
+# TTLs (seconds) by kind of data.
+# A law fetched by MST (법령일련번호) is one specific promulgated version and never changes;
+# search listings change whenever something is promulgated, so they go stale quickly.
+TTL_IMMUTABLE = 365 * DAY
+TTL_DETAIL = 7 * DAY
+TTL_HISTORY = 1 * DAY
+TTL_SEARCH = 6 * 60 * 60
+
+# Targets whose MST identifies a fixed version of the text
+VERSIONED_TARGETS = {"law", "ordin"}
+
+def ttl_for(endpoint: str, params: Dict[str, Any]) -> float:
+    """
+    Pick a TTL for a request based on what kind of data it returns.
+    """
+    if endpoint == "lawSearch.do":
+        return TTL_SEARCH
+    target = params.get("target")
+    if target in ("lsHistory", "lsOnC"):
+        return TTL_HISTORY
+    if target in VERSIONED_TARGETS and "MST" in params:
+        return TTL_IMMUTABLE
+    return TTL_DETAIL
+
+def cache_key(endpoint: str, params: Dict[str, Any]) -> str:
+    """
+    Build a stable key from the endpoint and request parameters (target, ID/MST, query, ...).
+    The API key (OC) is excluded so rotating it does not invalidate the cache.
+    """
+    parts = [f"{k}={params[k]}" for k in sorted(params) if k != "OC"]
+    return endpoint + "?" + "&".join(parts)
+
+class ResponseCache:
+    """
+    Persistent SQLite cache of raw API responses.
+    Bodies are stored zlib-compressed; entries expire by TTL and the least recently
+    used ones are evicted once the total stored size exceeds max_bytes.
+    Safe to share between threads (and between processes via SQLite WAL).
+    """
+    def __init__(self, path: Optional[str] = None, max_bytes: Optional[int] = None):
+        if path is None:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            path = os.path.join(CACHE_DIR, "responses.sqlite")
+        self.path = path
+        self.max_bytes = int(max_bytes if max_bytes is not None else CACHE_MAX_MB * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, endpoint TEXT, target TEXT, body BLOB,"
+            " size INTEGER, created REAL, expires REAL, accessed REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed)")
+        self.total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, endpoint: str, params: Dict[str, Any]) -> Optional[bytes]:
+        key = cache_key(endpoint, params)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT body, expires FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None or row[1] < now:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return zlib.decompress(row[0])
+
+    def put(self, endpoint: str, params: Dict[str, Any], body: bytes, ttl: Optional[float] = None) -> None:
+        key = cache_key(endpoint, params)
+        now = time.time()
+        expires = now + (ttl if ttl is not None else ttl_for(endpoint, params))
+        blob = zlib.compress(body)
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, endpoint, params.get("target"), blob, len(blob), now, expires, now),
+            )
+            self.total_bytes += len(blob) - (old[0] if old else 0)
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """
+        Drop expired entries, then least recently used ones, until under 90% of max_bytes.
+        Caller must hold the lock.
+        """
+        self._conn.execute("DELETE FROM responses WHERE expires < ?", (time.time(),))
+        target = self.max_bytes * 0.9
+        self.total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY accessed").fetchall()
+        doomed = []
+        for key, size in rows:
+            if self.total_bytes <= target:
+                break
+            doomed.append((key,))
+            self.total_bytes -= size
+        if doomed:
+            self._conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+            self.evictions += len(doomed)
+            logger.info(f"Response cache evicted {len(doomed)} entries")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self.total_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+def estimate_size(obj: Any) -> int:
+    """
+    Rough resident size in bytes of a tree of dicts/lists/tuples/strings
+    (and __slots__ records holding them).
+    """
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(estimate_size(k) + estimate_size(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(estimate_size(v) for v in obj)
+    slots = getattr(type(obj), '__slots__', None)
+    if slots:
+        return sys.getsizeof(obj) + sum(estimate_size(getattr(obj, name, None)) for name in slots)
+    return sys.getsizeof(obj)
+
+class LRUCache:
+    """
+    Thread-safe in-memory LRU bounded by the total (approximate) byte weight of its values.
+    Entries put with a ttl (seconds) expire and read as misses afterwards.
+    """
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[2] is not None and entry[2] <= time.time():
+                self._data.pop(key)
+                self.total_bytes -= entry[1]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: int, ttl: Optional[float] = None) -> None:
+        if size > self.max_bytes:
+            return
+        expires = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.total_bytes -= old[1]
+            self._data[key] = (value, size, expires)
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._data.popitem(last=False)
+                self.total_bytes -= evicted_size
+                self.evictions += 1
+
+    def reweigh(self, key: Hashable, value: Any, size: int) -> bool:
+        """
+        Update the weight of `value` if it is still the entry for `key` (evicting others
+        as needed), without re-inserting it if it has been evicted or replaced meanwhile.
+        Returns False if it is no longer resident.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] is not value:
+                return False
+            if size > self.max_bytes:
+                self._data.pop(key)
+                self.total_bytes -= entry[1]
+                return False
+            self._data[key] = (value, size, entry[2])
+            self.total_bytes += size - entry[1]
+            while self.total_bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._data.popitem(last=False)
+                self.total_bytes -= evicted_size
+                self.evictions += 1
+            return key in self._data
+
+    def pop(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry is None:
+                return None
+            self.total_bytes -= entry[1]
+            return entry[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._data),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+_default_cache: Optional[ResponseCache] = None
+_default_failed = False
+_default_lock = threading.Lock()
+
+def get_default_cache() -> Optional[ResponseCache]:
+    """
+    Return the shared on-disk cache, or None when disabled (KOREAN_LAW_CACHE=0)
+    or when the cache directory is not writable.
+    """
+    global _default_cache, _default_failed
+    if not CACHE_ENABLED or _default_failed:
+        return None
+    if _default_cache is None:
+        with _default_lock:
+            if _default_cache is None and not _default_failed:
+                try:
+                    _default_cache = ResponseCache()
+                except (OSError, sqlite3.Error) as e:
+                    logger.warning(f"Response cache disabled: {e}")
+                    _default_failed = True
+    return _default_cache
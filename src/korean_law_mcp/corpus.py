@@ -0,0 +1,268 @@
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from .cache import CACHE_DIR, CACHE_ENABLED, DAY
+
+logger = logging.getLogger("korean-law-mcp")
+
+# Local full-text corpus of every statute / precedent / admin rule we have fetched
+CORPUS_ENABLED = os.getenv("KOREAN_LAW_CORPUS", "1" if CACHE_ENABLED else "0").lower() not in ("0", "false", "off", "no")
+# A category answered locally needs at least this many hits; otherwise it goes to the live API
+CORPUS_MIN_HITS = int(os.getenv("KOREAN_LAW_CORPUS_MIN_HITS", "3"))
+# Documents not fetched (or re-read) within this many seconds no longer answer searches
+CORPUS_TTL = float(os.getenv("KOREAN_LAW_CORPUS_TTL", str(DAY)))
+
+# Expired documents are deleted by add() at most this often (seconds)
+PRUNE_INTERVAL = 3600
+
+# Title matches count ten times as much as body matches
+TITLE_WEIGHT = 10.0
+BODY_WEIGHT = 1.0
+
+_TERM = re.compile(r'\w+')
+
+def to_match_query(query: str) -> Optional[str]:
+    """
+    Turn free text into an FTS5 MATCH expression: every word must appear, as a prefix,
+    so "권리" also matches 권리의 / 권리를 (Korean particles attach to the stem).
+    """
+    terms = _TERM.findall(query)
+    if not terms:
+        return None
+    return " AND ".join(f'"{t}"*' for t in terms)
+
+class CorpusIndex:
+    """
+    SQLite FTS5 index over fetched documents, ranked with FTS5's built-in BM25.
+    Documents are keyed by (kind, doc_id); re-adding one replaces it. A document added
+    with a `series` (e.g. every MST of one law) replaces the older versions in that
+    series, and only documents updated within `ttl` seconds are searched; expired ones
+    are deleted as new documents come in. A kind marked covered (a mirror sync indexed
+    every document of it) answers searches as complete until the TTL runs out.
+    Safe to share between threads.
+    """
+    def __init__(self, path: Optional[str] = None, ttl: float = CORPUS_TTL):
+        if path is None:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            path = os.path.join(CACHE_DIR, "corpus.sqlite")
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # unicode61 splits on whitespace/punctuation; the prefix index makes "term"* cheap
+        self._conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS docs USING fts5("
+            " title, body, kind UNINDEXED, doc_id UNINDEXED, meta UNINDEXED,"
+            " tokenize='unicode61', prefix='1 2 3')"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS doc_keys ("
+            " kind TEXT, doc_id TEXT, row INTEGER, updated REAL, PRIMARY KEY (kind, doc_id))"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(doc_keys)")}
+        for column in ("series", "version"):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE doc_keys ADD COLUMN {column} TEXT")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS doc_series ON doc_keys (kind, series)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS doc_updated ON doc_keys (updated)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS coverage (kind TEXT PRIMARY KEY, synced REAL)")
+        self.ttl = ttl
+        self._pruned = time.time()
+        self.pruned = 0
+        self.queries = 0
+        self.added = 0
+
+    def add(self, kind: str, doc_id: str, title: str, body: str, meta: Optional[Dict[str, Any]] = None,
+            series: Optional[str] = None, version: str = "") -> bool:
+        """
+        Index a document. With `series`, other documents of the series with an older (or
+        equal) `version` are dropped; if the series already holds a newer version, this
+        one is not indexed and False is returned.
+        """
+        doc_id = str(doc_id)
+        meta_json = json.dumps(meta or {}, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                replaced = []
+                if series:
+                    others = self._conn.execute(
+                        "SELECT doc_id, row, version FROM doc_keys WHERE kind = ? AND series = ? AND doc_id != ?",
+                        (kind, series, doc_id),
+                    ).fetchall()
+                    if any((other or "") > version for _, _, other in others):
+                        self._conn.execute("ROLLBACK")
+                        return False
+                    replaced = others
+                old = self._conn.execute(
+                    "SELECT row FROM doc_keys WHERE kind = ? AND doc_id = ?", (kind, doc_id)
+                ).fetchone()
+                if old is not None:
+                    self._conn.execute("DELETE FROM docs WHERE rowid = ?", (old[0],))
+                for other_id, row, _ in replaced:
+                    self._conn.execute("DELETE FROM docs WHERE rowid = ?", (row,))
+                    self._conn.execute("DELETE FROM doc_keys WHERE kind = ? AND doc_id = ?", (kind, other_id))
+                cur = self._conn.execute(
+                    "INSERT INTO docs (title, body, kind, doc_id, meta) VALUES (?, ?, ?, ?, ?)",
+                    (title or "", body or "", kind, doc_id, meta_json),
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO doc_keys (kind, doc_id, row, updated, series, version)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (kind, doc_id, cur.lastrowid, time.time(), series, version),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self.added += 1
+        if time.time() - self._pruned >= min(self.ttl, PRUNE_INTERVAL):
+            self.prune()
+        return True
+
+    def prune(self) -> int:
+        """
+        Delete documents not updated within the TTL; returns how many.
+        """
+        cutoff = time.time() - self.ttl
+        with self._lock:
+            self._pruned = time.time()
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute(
+                    "DELETE FROM docs WHERE rowid IN (SELECT row FROM doc_keys WHERE updated < ?)", (cutoff,)
+                )
+                removed = self._conn.execute("DELETE FROM doc_keys WHERE updated < ?", (cutoff,)).rowcount
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self.pruned += removed
+        if removed:
+            logger.info(f"Corpus: pruned {removed} expired documents")
+        return removed
+
+    def touch(self, kind: str, doc_id: str) -> bool:
+        """
+        Mark an indexed document as freshly seen without re-indexing it.
+        Returns False if it is not indexed.
+        """
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE doc_keys SET updated = ? WHERE kind = ? AND doc_id = ?", (time.time(), kind, str(doc_id))
+            )
+            return cur.rowcount > 0
+
+    def touch_many(self, kind: str, doc_ids: List[str]) -> List[str]:
+        """
+        touch() every document in one transaction; returns the ids that are not indexed.
+        """
+        now = time.time()
+        missing = []
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for doc_id in doc_ids:
+                    cur = self._conn.execute(
+                        "UPDATE doc_keys SET updated = ? WHERE kind = ? AND doc_id = ?", (now, kind, str(doc_id))
+                    )
+                    if cur.rowcount == 0:
+                        missing.append(str(doc_id))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return missing
+
+    def mark_covered(self, kind: str) -> None:
+        """
+        Record that every document of `kind` has just been indexed (or touched).
+        """
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO coverage VALUES (?, ?)", (kind, time.time()))
+
+    def covers(self, kind: str) -> bool:
+        """
+        True if a complete index of `kind` was recorded within the TTL, so a search
+        that finds little there would find little upstream too.
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT synced FROM coverage WHERE kind = ?", (kind,)).fetchone()
+        return row is not None and row[0] >= time.time() - self.ttl
+
+    def has(self, kind: str, doc_id: str) -> bool:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM doc_keys WHERE kind = ? AND doc_id = ?", (kind, str(doc_id))
+            ).fetchone() is not None
+
+    def search(self, query: str, kind: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        BM25-ranked hits: dicts with kind, doc_id, title, meta, snippet (best first).
+        Documents older than the TTL are left out.
+        """
+        match = to_match_query(query)
+        if match is None:
+            return []
+        sql = (
+            "SELECT docs.kind, docs.doc_id, title, meta, snippet(docs, 1, '**', '**', '…', 16)"
+            " FROM docs JOIN doc_keys ON doc_keys.row = docs.rowid"
+            " WHERE docs MATCH ? AND doc_keys.updated >= ?"
+        )
+        args: list = [match, time.time() - self.ttl]
+        if kind:
+            sql += " AND docs.kind = ?"
+            args.append(kind)
+        sql += f" ORDER BY bm25(docs, {TITLE_WEIGHT}, {BODY_WEIGHT}) LIMIT ?"
+        args.append(limit)
+        with self._lock:
+            self.queries += 1
+            try:
+                rows = self._conn.execute(sql, args).fetchall()
+            except sqlite3.OperationalError as e:
+                logger.warning(f"Corpus query failed for {query!r}: {e}")
+                return []
+        return [
+            {"kind": k, "doc_id": d, "title": t, "meta": json.loads(m or "{}"), "snippet": s}
+            for k, d, t, m, s in rows
+        ]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM docs")
+            self._conn.execute("DELETE FROM doc_keys")
+            self._conn.execute("DELETE FROM coverage")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self._conn.execute("SELECT kind, COUNT(*) FROM doc_keys GROUP BY kind").fetchall())
+        return {"documents": counts, "added": self.added, "pruned": self.pruned, "queries": self.queries}
+
+_default_corpus: Optional[CorpusIndex] = None
+_default_failed = False
+_default_lock = threading.Lock()
+
+def get_default_corpus() -> Optional[CorpusIndex]:
+    """
+    Return the shared corpus index, or None when disabled (KOREAN_LAW_CORPUS=0)
+    or when SQLite lacks FTS5 / the cache directory is not writable.
+    """
+    global _default_corpus, _default_failed
+    if not CORPUS_ENABLED or _default_failed:
+        return None
+    if _default_corpus is None:
+        with _default_lock:
+            if _default_corpus is None and not _default_failed:
+                try:
+                    _default_corpus = CorpusIndex()
+                except (OSError, sqlite3.Error) as e:
+                    logger.warning(f"Local search corpus disabled: {e}")
+                    _default_failed = True
+    return _default_corpus
@@ -0,0 +1,157 @@
+import concurrent.futures
+import logging
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .cache import TTL_SEARCH
+from .singleflight import SingleFlight
+
+logger = logging.getLogger("korean-law-mcp")
+
+# Related admin rules kept per act
+MAX_ADMIN_RULES = 10
+
+# A family whose refresh had a failed search is refreshed again after this many seconds
+RETRY_AFTER = 60
+
+# Runs the law and admin-rule searches of every refresh, so concurrent refreshes stay bounded together
+_search_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="law-family")
+
+# Levels of a law family below the act, by name suffix
+_LEVELS = (("decree", "시행령"), ("rule", "시행규칙"))
+_LEVEL_SUFFIX = re.compile(r'\s*(시행령|시행규칙)$')
+
+def base_name(name: str) -> str:
+    """
+    The act a law belongs to: "건축법 시행규칙" -> "건축법"; an act is its own base.
+    """
+    return _LEVEL_SUFFIX.sub('', name.strip())
+
+def _items(data: Optional[dict], root: str, item: str) -> list:
+    items = ((data or {}).get(root) or {}).get(item) or []
+    return items if isinstance(items, list) else [items]
+
+def _key(name: str) -> str:
+    return name.replace(' ', '')
+
+class LawFamily:
+    """
+    An act and what implements it: its enforcement decree (시행령), enforcement rule
+    (시행규칙) and related admin rules (행정규칙). Laws are (MST, name) pairs.
+    """
+    __slots__ = ('name', 'act', 'decree', 'rule', 'admin_rules', 'refreshed')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.act: Optional[tuple[str, str]] = None
+        self.decree: Optional[tuple[str, str]] = None
+        self.rule: Optional[tuple[str, str]] = None
+        self.admin_rules: List[tuple[str, str]] = []
+        # 0 until the family's own search has been run
+        self.refreshed = 0.0
+
+    def __repr__(self):
+        return f"LawFamily({self.name!r}, act={self.act}, decree={self.decree}, rule={self.rule}, admin_rules={len(self.admin_rules)})"
+
+class LawFamilyIndex:
+    """
+    Act name -> LawFamily, filled from law search listings.
+
+    Every listing passed to observe() updates the families of the laws in it (a search
+    for "건축법" lists 건축법, 건축법 시행령 and 건축법 시행규칙 together), so the index
+    grows as a side effect of ordinary searches. get() runs the act's own law and
+    admin-rule searches concurrently only when the family has not been refreshed
+    within the TTL; concurrent refreshes of one act share a single pair of searches.
+    """
+    def __init__(self, search: Callable[..., Dict[str, Any]], ttl: float = TTL_SEARCH):
+        self._search = search
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._families: Dict[str, LawFamily] = {}
+        self._refreshes = SingleFlight()
+        self.refreshes = 0
+
+    def _family(self, name: str) -> LawFamily:
+        # Caller holds self._lock
+        key = _key(name)
+        family = self._families.get(key)
+        if family is None:
+            family = self._families[key] = LawFamily(name)
+        return family
+
+    def observe(self, laws: Iterable[dict]) -> None:
+        """
+        Record (MST, name) of every current law in a lawSearch.do listing under its act.
+        """
+        with self._lock:
+            for item in laws:
+                name = item.get('법령명한글')
+                mst = item.get('법령일련번호')
+                # Historical versions (연혁) must not take the place of the law in force
+                if not name or not mst or item.get('현행연혁코드', '현행') != '현행':
+                    continue
+                family = self._family(base_name(name))
+                m = _LEVEL_SUFFIX.search(name)
+                if m is None:
+                    if _key(name) == _key(family.name):
+                        family.act = (mst, name)
+                elif m.group(1) == "시행령":
+                    family.decree = (mst, name)
+                else:
+                    family.rule = (mst, name)
+
+    def _observe_admin_rules(self, act_name: str, rules: Iterable[dict]) -> None:
+        found = []
+        for item in rules:
+            rule_id = item.get('행정규칙일련번호')
+            name = item.get('행정규칙명')
+            if rule_id and name:
+                found.append((rule_id, name))
+        with self._lock:
+            self._family(act_name).admin_rules = found[:MAX_ADMIN_RULES]
+
+    def refresh(self, act_name: str) -> LawFamily:
+        """
+        Search the act's laws and its admin rules (concurrently) and update the family.
+        """
+        act_name = base_name(act_name)
+        return self._refreshes.do(_key(act_name), self._refresh, act_name)
+
+    def _refresh(self, act_name: str) -> LawFamily:
+        laws = _search_pool.submit(self._search, act_name)
+        rules = _search_pool.submit(self._search, act_name, target="admrul")
+        complete = True
+        for future, label in ((laws, "law"), (rules, "admrul")):
+            try:
+                data = future.result()
+            except Exception as e:
+                logger.error(f"Law family search ({label}) failed for {act_name}: {e}")
+                complete = False
+                continue
+            if future is laws:
+                self.observe(_items(data, 'LawSearch', 'law'))
+            else:
+                self._observe_admin_rules(act_name, _items(data, 'AdmRulSearch', 'admrul'))
+        with self._lock:
+            family = self._family(act_name)
+            # A failed search keeps the members known so far and is retried soon, not after the TTL
+            family.refreshed = time.time() if complete else time.time() - self.ttl + RETRY_AFTER
+            self.refreshes += 1
+        return family
+
+    def get(self, name: str) -> LawFamily:
+        """
+        The family of an act (or of one of its decrees/rules), refreshed if stale.
+        """
+        act_name = base_name(name)
+        with self._lock:
+            family = self._families.get(_key(act_name))
+            fresh = family is not None and time.time() - family.refreshed < self.ttl
+        return family if fresh else self.refresh(act_name)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"families": len(self._families), "refreshes": self.refreshes,
+                "coalesced": self._refreshes.deduplicated}
@@ -0,0 +1,103 @@
+import json
+import logging
+import os
+import threading
+from collections import Counter
+from typing import Dict, List, Optional
+
+from .cache import CACHE_DIR
+
+logger = logging.getLogger("korean-law-mcp")
+
+# Where access counts survive restarts (override via environment)
+HOT_SET_PATH = os.getenv("KOREAN_LAW_HOT_SET_PATH", os.path.join(CACHE_DIR, "hot_laws.json"))
+# Counts from earlier runs are multiplied by this on every save, so old favourites fade
+HOT_SET_DECAY = 0.5
+# Names kept in the file
+HOT_SET_MAX = 200
+# Seconds between background saves, so a killed process loses little (0 = only at exit)
+HOT_SET_SAVE_INTERVAL = float(os.getenv("KOREAN_LAW_HOT_SET_SAVE_INTERVAL", "300"))
+
+class HotSet:
+    """
+    How often each law (by name) has been read, this run and (decayed) in earlier runs.
+    Names rather than MSTs are counted: an amendment gives a law a new MST, and the
+    next warm-up should load the current version.
+    """
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or HOT_SET_PATH
+        self._lock = threading.Lock()
+        self._counts: Counter = Counter()
+        self._previous: Dict[str, float] = self._load()
+        self._autosave: Optional[threading.Event] = None
+
+    def _load(self) -> Dict[str, float]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            return {str(k): float(v) for k, v in data.items()}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable hot set {self.path}: {e}")
+            return {}
+
+    def record(self, name: Optional[str]) -> None:
+        if not name or name == 'Unknown':
+            return
+        with self._lock:
+            self._counts[name] += 1
+
+    def scores(self) -> Dict[str, float]:
+        """
+        Decayed earlier counts plus this run's counts.
+        """
+        with self._lock:
+            scores = {name: count * HOT_SET_DECAY for name, count in self._previous.items()}
+            for name, count in self._counts.items():
+                scores[name] = scores.get(name, 0.0) + count
+        return scores
+
+    def top(self, n: int) -> List[str]:
+        """
+        The n most-read law names, as saved by the previous run(s).
+        """
+        previous = sorted(self._previous.items(), key=lambda item: (-item[1], item[0]))
+        return [name for name, _ in previous[:n]]
+
+    def save(self) -> None:
+        """
+        Write the scores atomically (temp file + rename); errors are logged, not raised.
+        """
+        scores = sorted(self.scores().items(), key=lambda item: (-item[1], item[0]))[:HOT_SET_MAX]
+        data = {name: round(score, 3) for name, score in scores if score >= 0.01}
+        tmp = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save hot set to {self.path}: {e}")
+
+    def start_autosave(self, interval: float = HOT_SET_SAVE_INTERVAL) -> None:
+        """
+        Save every `interval` seconds on a daemon thread until stop_autosave().
+        Saving is idempotent: each save writes this run's counts on top of the decayed earlier ones.
+        """
+        if interval <= 0 or self._autosave is not None:
+            return
+        stop = self._autosave = threading.Event()
+
+        def run():
+            while not stop.wait(interval):
+                self.save()
+        threading.Thread(target=run, name="hot-set-autosave", daemon=True).start()
+
+    def stop_autosave(self) -> None:
+        if self._autosave is not None:
+            self._autosave.set()
+            self._autosave = None
+
+# Shared recorder for every law read in this process
+hot_laws = HotSet()
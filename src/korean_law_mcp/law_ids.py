@@ -0,0 +1,103 @@
+import logging
+import os
+import re
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from .cache import LRUCache, TTL_SEARCH
+from .singleflight import SingleFlight
+
+logger = logging.getLogger("korean-law-mcp")
+
+# How long a law name keeps resolving to the same MST (override via environment)
+NAME_TTL = float(os.getenv("KOREAN_LAW_NAME_TTL", str(TTL_SEARCH)))
+# Entries are tiny; this bounds the cache at tens of thousands of names
+NAME_CACHE_BYTES = 4 * 1024 * 1024
+_ENTRY_SIZE = 200
+
+_IGNORED = re.compile(r'[\s「」]')
+
+def normalize_law_name(name: str) -> str:
+    """
+    Cache key for a law name: spacing and 「」 quotes do not matter.
+    """
+    return _IGNORED.sub('', name or '')
+
+def pick_law(items: list, query: str) -> Optional[dict]:
+    """
+    The listing entry a name most likely means: the exact name (current version first),
+    else the first act (법률), else the first hit.
+    """
+    if not items:
+        return None
+    key = normalize_law_name(query)
+    exact = [i for i in items if normalize_law_name(i.get('법령명한글', '')) == key]
+    if exact:
+        for item in exact:
+            if item.get('현행연혁코드') == '현행':
+                return item
+        return exact[0]
+    statutes = [i for i in items if i.get('법령구분명') == '법률']
+    return statutes[0] if statutes else items[0]
+
+class LawIdResolver:
+    """
+    Law name -> (MST, official name) of the law it currently means, cached for NAME_TTL.
+
+    Shared by every tool that starts from a law name. Besides its own searches it
+    learns from any law listing passed to observe(), so a name that has appeared in
+    a search result resolves without another round-trip. Concurrent misses for the
+    same name share one search.
+    """
+    def __init__(self, search: Callable[..., Dict[str, Any]], ttl: float = NAME_TTL,
+                 observers: Iterable[Callable[[list], None]] = ()):
+        self._search = search
+        # Also handed every listing this resolver fetches itself
+        self._observers = list(observers)
+        self.ttl = ttl
+        self._cache = LRUCache(NAME_CACHE_BYTES)
+        self._searches = SingleFlight()
+
+    def observe(self, items: Iterable[dict]) -> None:
+        """
+        Remember the exact name -> MST of every current law in a lawSearch.do listing.
+        """
+        for item in items:
+            name = item.get('법령명한글')
+            mst = item.get('법령일련번호')
+            if not name or not mst or item.get('현행연혁코드', '현행') != '현행':
+                continue
+            self._cache.put(normalize_law_name(name), (mst, name), _ENTRY_SIZE, self.ttl)
+
+    def resolve(self, name: str) -> Optional[tuple[str, str]]:
+        """
+        (MST, official name) for a law name or search phrase, or None if nothing matches.
+        Search failures propagate to the caller.
+        """
+        key = normalize_law_name(name)
+        if not key:
+            return None
+        hit = self._cache.get(key)
+        if hit is not None:
+            return hit
+        return self._searches.do(key, self._resolve_uncached, name, key)
+
+    def _resolve_uncached(self, name: str, key: str) -> Optional[tuple[str, str]]:
+        data = self._search(name)
+        items = (data.get('LawSearch') or {}).get('law') or []
+        if not isinstance(items, list): items = [items]
+        self.observe(items)
+        for observer in self._observers:
+            observer(items)
+        best = pick_law(items, name)
+        if best is None or not best.get('법령일련번호'):
+            return None
+        found = (best['법령일련번호'], best.get('법령명한글', name))
+        # Also remember the phrase as typed when it is not an exact law name
+        self._cache.put(key, found, _ENTRY_SIZE, self.ttl)
+        return found
+
+    def invalidate(self, name: str) -> None:
+        self._cache.pop(normalize_law_name(name))
+
+    def stats(self) -> Dict[str, Any]:
+        return self._cache.stats()
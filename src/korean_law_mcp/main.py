@@ -3,13 +3,42 @@ from .server import mcp
 from . import tools
 from . import resources
 from . import prompts
+from .hotset import hot_laws
+from .warmup import start_warmup
+import atexit
 import logging
+import os
+import signal
+import threading
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("korean-law-mcp")
 
+# Set by the signal handler; the save itself runs on a thread, outside signal context
+_stop_signal: list = []
+_stopping = threading.Event()
+
+def _on_stop_signal(signum, frame):
+    # hot_laws.save() takes a lock the interrupted main thread may hold, so it must not run here
+    _stop_signal.append(signum)
+    _stopping.set()
+
+def _save_and_exit() -> None:
+    # atexit does not run when a signal kills the process (e.g. SIGTERM from docker stop)
+    _stopping.wait()
+    hot_laws.save()
+    logging.shutdown()
+    os._exit(128 + _stop_signal[0])
+
 def main():
+    # Saved at exit, on SIGTERM/SIGINT and periodically, so the next start warms the laws that were actually read
+    atexit.register(hot_laws.save)
+    threading.Thread(target=_save_and_exit, name="hot-set-exit", daemon=True).start()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, _on_stop_signal)
+    hot_laws.start_autosave()
+    start_warmup()
     mcp.run()
 
 if __name__ == "__main__":
@@ -0,0 +1,392 @@
+import argparse
+import concurrent.futures
+import json
+import logging
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from typing import Any, Dict, Iterable, List, Optional
+
+import xmltodict
+
+from .cache import CACHE_DIR
+
+logger = logging.getLogger("korean-law-mcp")
+
+# Local mirror of law.go.kr (override via environment)
+MIRROR_PATH = os.getenv("KOREAN_LAW_MIRROR_PATH", os.path.join(CACHE_DIR, "mirror.sqlite"))
+MIRROR_ENABLED = os.getenv("KOREAN_LAW_MIRROR", "1").lower() not in ("0", "false", "off", "no")
+# Answer searches from the mirror without trying law.go.kr first
+OFFLINE = os.getenv("KOREAN_LAW_OFFLINE", "0").lower() in ("1", "true", "on", "yes")
+MIRROR_WORKERS = int(os.getenv("KOREAN_LAW_MIRROR_WORKERS", "8"))
+MIRROR_PROCESSES = int(os.getenv("KOREAN_LAW_MIRROR_PROCESSES", str(max(1, (os.cpu_count() or 2) - 1))))
+PAGE_SIZE = 100
+# Bodies larger than this are parsed in the process pool instead of the fetching thread
+PROCESS_PARSE_BYTES = 512 * 1024
+
+# Per target: search response root / item tag, the listing field holding the id, the
+# lawService.do parameter that takes it, the display name field, and the listing fields
+# whose change means the document changed.
+MIRROR_TARGETS: Dict[str, Dict[str, Any]] = {
+    "law": {"root": "LawSearch", "item": "law", "id": "법령일련번호", "key": "MST",
+            "name": "법령명한글", "stamp": ("공포일자", "시행일자")},
+    "prec": {"root": "PrecSearch", "item": "prec", "id": "판례일련번호", "key": "ID",
+             "name": "사건명", "stamp": ("선고일자",)},
+    "admrul": {"root": "AdmRulSearch", "item": "admrul", "id": "행정규칙일련번호", "key": "ID",
+               "name": "행정규칙명", "stamp": ("발령일자", "시행일자")},
+    "ordin": {"root": "OrdinSearch", "item": "law", "id": "자치법규일련번호", "key": "MST",
+              "name": "자치법규명", "stamp": ("공포일자", "시행일자")},
+    "detc": {"root": "DetcSearch", "item": "detc", "id": "헌재결정례일련번호", "key": "ID",
+             "name": "사건명", "stamp": ("종국일자",)},
+    "expc": {"root": "Expc", "item": "expc", "id": "법령해석일련번호", "key": "ID",
+             "name": "안건명", "stamp": ("회신일자",)},
+    "lstrm": {"root": "LawTermSearch", "item": "lawTerm", "id": "법령용어일련번호", "key": "MST",
+              "name": "법령용어명", "stamp": ()},
+}
+
+# Mirrored targets that feed the local search corpus (corpus kind per target)
+CORPUS_KINDS = {"law": "statute", "prec": "prec", "admrul": "admrul"}
+
+_TAG = re.compile(r'<[^>]+>')
+
+def _leaves(obj: Any) -> Iterable[str]:
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if not key.startswith('@'):
+                yield from _leaves(value)
+    elif isinstance(obj, list):
+        for value in obj:
+            yield from _leaves(value)
+    elif obj:
+        yield str(obj)
+
+def extract_text(body: bytes) -> str:
+    """
+    Plain text of every element of a lawService.do document, for the search corpus.
+    Top-level so it can run in a worker process.
+    """
+    text = "\n".join(_leaves(xmltodict.parse(body)))
+    return _TAG.sub(" ", text.replace("<![CDATA[", "").replace("]]>", ""))
+
+def _stamp(target: str, item: Dict[str, Any]) -> str:
+    return "|".join(str(item.get(f) or '') for f in MIRROR_TARGETS[target]["stamp"])
+
+def _items(target: str, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    conf = MIRROR_TARGETS[target]
+    root = data.get(conf["root"]) or {}
+    items = root.get(conf["item"]) if isinstance(root, dict) else None
+    if not items:
+        return []
+    return items if isinstance(items, list) else [items]
+
+class Mirror:
+    """
+    SQLite store of search listings and raw lawService.do bodies (zlib-compressed),
+    keyed by (target, id). A document whose listing stamp (공포일자/시행일자 ...) changes
+    loses its body and is re-fetched by the next sync.
+    Safe to share between threads.
+    """
+    def __init__(self, path: str = MIRROR_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS items ("
+            " target TEXT, id TEXT, name TEXT, stamp TEXT, listing TEXT, body BLOB, fetched REAL,"
+            " PRIMARY KEY (target, id))"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sync_state (target TEXT PRIMARY KEY, synced REAL, listed INTEGER)"
+        )
+        self.hits = 0
+
+    def put_listings(self, target: str, items: List[Dict[str, Any]]) -> List[str]:
+        """
+        Upsert listing rows; returns the ids whose body is missing or out of date.
+        """
+        id_field = MIRROR_TARGETS[target]["id"]
+        name_field = MIRROR_TARGETS[target]["name"]
+        stale = []
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for item in items:
+                    doc_id = str(item.get(id_field) or '')
+                    if not doc_id:
+                        continue
+                    stamp = _stamp(target, item)
+                    row = self._conn.execute(
+                        "SELECT stamp, body IS NOT NULL FROM items WHERE target = ? AND id = ?", (target, doc_id)
+                    ).fetchone()
+                    listing = json.dumps(item, ensure_ascii=False)
+                    if row is None:
+                        self._conn.execute(
+                            "INSERT INTO items VALUES (?, ?, ?, ?, ?, NULL, NULL)",
+                            (target, doc_id, item.get(name_field) or '', stamp, listing),
+                        )
+                        stale.append(doc_id)
+                    elif row[0] != stamp:
+                        self._conn.execute(
+                            "UPDATE items SET name = ?, stamp = ?, listing = ?, body = NULL WHERE target = ? AND id = ?",
+                            (item.get(name_field) or '', stamp, listing, target, doc_id),
+                        )
+                        stale.append(doc_id)
+                    else:
+                        self._conn.execute(
+                            "UPDATE items SET listing = ? WHERE target = ? AND id = ?", (listing, target, doc_id)
+                        )
+                        if not row[1]:
+                            stale.append(doc_id)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return stale
+
+    def put_body(self, target: str, doc_id: str, body: bytes) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE items SET body = ?, fetched = ? WHERE target = ? AND id = ?",
+                (zlib.compress(body), time.time(), target, str(doc_id)),
+            )
+
+    def mark_synced(self, target: str, listed: int) -> None:
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)", (target, time.time(), listed))
+
+    def get_body(self, target: str, doc_id: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM items WHERE target = ? AND id = ?", (target, str(doc_id))
+            ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        self.hits += 1
+        return zlib.decompress(row[0])
+
+    def lookup(self, endpoint: str, params: Dict[str, Any]) -> Optional[bytes]:
+        """
+        Raw body for a lawService.do request, if mirrored.
+        Only the parameter the mirror was keyed by (MST or ID) matches.
+        """
+        if endpoint != "lawService.do":
+            return None
+        conf = MIRROR_TARGETS.get(params.get("target"))
+        if conf is None or conf["key"] not in params:
+            return None
+        return self.get_body(params["target"], params[conf["key"]])
+
+    def is_synced(self, target: str) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM sync_state WHERE target = ?", (target,)).fetchone() is not None
+
+    def search(self, params: Dict[str, Any], limit: int = 20) -> Optional[Dict[str, Any]]:
+        """
+        Answer a lawSearch.do request from mirrored listings (name contains every query word),
+        in the same shape as the live response. None if the target was never synced.
+        """
+        target = params.get("target")
+        conf = MIRROR_TARGETS.get(target)
+        if conf is None or not self.is_synced(target):
+            return None
+        words = str(params.get("query") or "").split()
+        sql = "SELECT listing FROM items WHERE target = ?"
+        args: list = [target]
+        for word in words:
+            sql += " AND name LIKE ?"
+            args.append(f"%{word}%")
+        sql += " ORDER BY length(name), stamp DESC LIMIT ?"
+        args.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, args).fetchall()
+        self.hits += 1
+        items = [json.loads(r[0]) for r in rows]
+        result: Dict[str, Any] = {"totalCnt": str(len(items))}
+        if items:
+            result[conf["item"]] = items if len(items) > 1 else items[0]
+        return {conf["root"]: result}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT target, COUNT(*), COUNT(body) FROM items GROUP BY target"
+            ).fetchall()
+            synced = dict(self._conn.execute("SELECT target, synced FROM sync_state").fetchall())
+        return {
+            target: {"listed": listed, "fetched": fetched, "synced": synced.get(target)}
+            for target, listed, fetched in rows
+        } | {"hits": self.hits}
+
+class MirrorSync:
+    """
+    Fills a Mirror from law.go.kr: pages through lawSearch.do for each target, then
+    fetches the new or changed documents in parallel. Every request goes through the
+    client's per-key rate limit, retries and deadline. Large bodies are parsed for the
+    search corpus in a process pool.
+    """
+    def __init__(self, client, mirror: Mirror, corpus=None, workers: int = MIRROR_WORKERS,
+                 processes: int = MIRROR_PROCESSES):
+        self.client = client
+        self.mirror = mirror
+        self.corpus = corpus
+        self.workers = workers
+        self.processes = processes
+
+    def _list_page(self, target: str, page: int) -> Dict[str, Any]:
+        body = self.client._fetch_raw("lawSearch.do", {"target": target, "display": PAGE_SIZE, "page": page})
+        return xmltodict.parse(body)
+
+    def list_all(self, target: str, max_pages: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Every listing item for a target: page 1 gives totalCnt, the rest are fetched in parallel.
+        """
+        first = self._list_page(target, 1)
+        items = _items(target, first)
+        root = first.get(MIRROR_TARGETS[target]["root"]) or {}
+        total = int((root.get("totalCnt") if isinstance(root, dict) else 0) or len(items))
+        pages = max(1, -(-total // PAGE_SIZE))
+        if max_pages:
+            pages = min(pages, max_pages)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for data in pool.map(lambda p: self._list_page(target, p), range(2, pages + 1)):
+                items.extend(_items(target, data))
+        return items
+
+    def _fetch_body(self, target: str, doc_id: str) -> bytes:
+        key = MIRROR_TARGETS[target]["key"]
+        return self.client._fetch_raw("lawService.do", {"target": target, key: doc_id})
+
+    def sync_target(self, target: str, full: bool = False, max_pages: Optional[int] = None,
+                    process_pool: Optional[concurrent.futures.Executor] = None) -> Dict[str, int]:
+        listings = self.list_all(target, max_pages)
+        stale = self.mirror.put_listings(target, listings)
+        if full:
+            id_field = MIRROR_TARGETS[target]["id"]
+            stale = [str(item[id_field]) for item in listings if item.get(id_field)]
+        names = {str(item.get(MIRROR_TARGETS[target]["id"])): item.get(MIRROR_TARGETS[target]["name"]) or ''
+                 for item in listings}
+        kind = CORPUS_KINDS.get(target) if self.corpus is not None else None
+        fetched = failed = 0
+        pending = []
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(self._fetch_body, target, doc_id): doc_id for doc_id in stale}
+            for future in concurrent.futures.as_completed(futures):
+                doc_id = futures[future]
+                try:
+                    body = future.result()
+                except Exception as e:
+                    failed += 1
+                    logger.warning(f"Mirror: {target}:{doc_id} failed: {e}")
+                    continue
+                self.mirror.put_body(target, doc_id, body)
+                fetched += 1
+                if kind is None:
+                    continue
+                if process_pool is not None and len(body) > PROCESS_PARSE_BYTES:
+                    pending.append((doc_id, process_pool.submit(extract_text, body)))
+                else:
+                    self._index(kind, doc_id, names.get(doc_id, ''), lambda b=body: extract_text(b))
+
+        for doc_id, future in pending:
+            self._index(kind, doc_id, names.get(doc_id, ''), future.result)
+
+        if kind is not None:
+            # Unchanged documents stay searchable; ones the corpus lacks are indexed from the mirror
+            stale_ids = set(stale)
+            unchanged = [doc_id for doc_id in names if doc_id and doc_id not in stale_ids]
+            for doc_id in self.corpus.touch_many(kind, unchanged):
+                body = self.mirror.get_body(target, doc_id)
+                if body is not None:
+                    self._index(kind, doc_id, names.get(doc_id, ''), lambda b=body: extract_text(b))
+            if not max_pages and not failed:
+                self.corpus.mark_covered(kind)
+
+        self.mirror.mark_synced(target, len(listings))
+        return {"listed": len(listings), "fetched": fetched, "failed": failed}
+
+    def _index(self, kind: str, doc_id: str, title: str, get_text) -> None:
+        try:
+            self.corpus.add(kind, doc_id, title, get_text())
+        except Exception as e:
+            logger.warning(f"Mirror: could not index {kind}:{doc_id}: {e}")
+
+    def sync(self, targets: Optional[List[str]] = None, full: bool = False,
+             max_pages: Optional[int] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Sync the given targets (default: all). Incremental unless full=True:
+        only documents that are new or whose listing stamp changed are fetched.
+        """
+        report = {}
+        with concurrent.futures.ProcessPoolExecutor(max_workers=self.processes) as process_pool:
+            for target in targets or list(MIRROR_TARGETS):
+                started = time.monotonic()
+                report[target] = self.sync_target(target, full, max_pages, process_pool)
+                logger.info(f"Mirror: {target} {report[target]} in {time.monotonic() - started:.1f}s")
+        return report
+
+_default_mirror: Optional[Mirror] = None
+_default_failed = False
+_default_lock = threading.Lock()
+
+def get_default_mirror() -> Optional[Mirror]:
+    """
+    Return the shared mirror if one has been created (by `korean-law-mirror sync`),
+    else None. Disabled with KOREAN_LAW_MIRROR=0.
+    """
+    global _default_mirror, _default_failed
+    if not MIRROR_ENABLED or _default_failed or not os.path.exists(MIRROR_PATH):
+        return None
+    if _default_mirror is None:
+        with _default_lock:
+            if _default_mirror is None and not _default_failed:
+                try:
+                    _default_mirror = Mirror(MIRROR_PATH)
+                except (OSError, sqlite3.Error) as e:
+                    logger.warning(f"Mirror disabled: {e}")
+                    _default_failed = True
+    return _default_mirror
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    CLI: `korean-law-mirror sync [--targets law,prec] [--full]` (run daily for delta syncs),
+    `korean-law-mirror stats`.
+    """
+    parser = argparse.ArgumentParser(prog="korean-law-mirror", description="Mirror law.go.kr locally")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sync_cmd = sub.add_parser("sync", help="Fetch new and changed documents")
+    sync_cmd.add_argument("--targets", default=",".join(MIRROR_TARGETS),
+                          help="Comma-separated targets (default: all)")
+    sync_cmd.add_argument("--full", action="store_true", help="Re-fetch every document")
+    sync_cmd.add_argument("--max-pages", type=int, default=None, help="Limit listing pages per target")
+    sync_cmd.add_argument("--workers", type=int, default=MIRROR_WORKERS)
+    sub.add_parser("stats", help="Show mirror contents")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+    mirror = Mirror(MIRROR_PATH)
+    if args.command == "stats":
+        print(json.dumps(mirror.stats(), ensure_ascii=False, indent=2))
+        return
+
+    from .api_client import KoreanLawClient
+    from .corpus import get_default_corpus
+    targets = [t.strip() for t in args.targets.split(",") if t.strip()]
+    unknown = [t for t in targets if t not in MIRROR_TARGETS]
+    if unknown:
+        parser.error(f"unknown targets: {', '.join(unknown)}")
+    # _fetch_raw bypasses the response cache: bodies go straight into the mirror
+    client = KoreanLawClient(mirror=mirror)
+    report = MirrorSync(client, mirror, get_default_corpus(), workers=args.workers).sync(
+        targets, full=args.full, max_pages=args.max_pages)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,17 @@
 import mcp.types as types
-from .server import mcp
-from .utils import get_statute_detail_internal
+from .server import mcp, offload
+from .utils import get_statute_page_internal, PAGE_CHARS
 # Import the tool function to reuse its logic
 from .tools import search_korean_law
 
-@mcp.prompt()
+@offload(mcp.prompt(), pool="heavy")
 def summarize_law(law_id: str) -> list[types.PromptMessage]:
     """
     Create a prompt to summarize a specific law.
-    Fetches the full text of the law and asks the LLM to summarize it.
+    Fetches the first page of the law (PAGE_CHARS of articles, with a cursor to the rest)
+    and asks the LLM to summarize it.
     """
-    law_text = get_statute_detail_internal(law_id)
+    law_text = get_statute_page_internal(law_id)
     return [
         types.PromptMessage(
             role="user",
@@ -21,7 +22,7 @@ def summarize_law(law_id: str) -> list[types.PromptMessage]:
         )
     ]
 
-@mcp.prompt()
+@offload(mcp.prompt())
 def explain_legal_term(term: str) -> list[types.PromptMessage]:
     """
     Create a prompt to explain a legal term based on search results.
@@ -39,18 +40,19 @@ def explain_legal_term(term: str) -> list[types.PromptMessage]:
         )
     ]
 
-@mcp.prompt()
+@offload(mcp.prompt(), pool="heavy")
 def compare_laws(law_id_1: str, law_id_2: str) -> list[types.PromptMessage]:
     """
     Create a prompt to compare two laws or articles.
     Fetches both resources and asks for a comparison.
     """
-    text1 = get_statute_detail_internal(law_id_1)
+    # Each law gets half a page, so the prompt stays as large as one paged read
+    text1 = get_statute_page_internal(law_id_1, max_chars=PAGE_CHARS // 2)
     # If the user passed an Article ID pattern (though this generic fetcher might fail for article-specific patterns if not handled), 
     # for now we assume law_id. 
     # To support article comparison, we might need a smarter fetcher or just fetch full law.
     # Let's stick to law comparison for now.
-    text2 = get_statute_detail_internal(law_id_2)
+    text2 = get_statute_page_internal(law_id_2, max_chars=PAGE_CHARS // 2)
     
     return [
         types.PromptMessage(
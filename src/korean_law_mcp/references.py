@@ -0,0 +1,157 @@
+import os
+import re
+from typing import Iterable, Optional
+
+# Referenced-article text appended to a response is capped at this many characters
+REFERENCE_BUDGET = int(os.getenv("KOREAN_LAW_REFERENCE_BUDGET", "12000"))
+# Referenced articles are fetched concurrently on a shared pool of this many threads
+REFERENCE_WORKERS = int(os.getenv("KOREAN_LAW_REFERENCE_WORKERS", "4"))
+# Seconds one resolve_references call may spend fetching before answering with what it has
+REFERENCE_TIMEOUT = float(os.getenv("KOREAN_LAW_REFERENCE_TIMEOUT", "10"))
+
+# A reference target: (law name or None for the same law, (article number, branch number))
+Reference = tuple[Optional[str], tuple[int, int]]
+
+# An optional law qualifier followed by 제N조 / 제N조의M (항/호 suffixes are ignored):
+#   「학교폭력예방 및 대책에 관한 법률」 제5조, 건축법 시행령 제3조, 같은 법 제2조, 이 법 제7조
+_REFERENCE = re.compile(
+    r'(?:'
+    r'「(?P<quoted>[^」]+)」'
+    r'|(?P<same>같은\s*법|동법)'
+    r'|(?P<this>이\s*법)'
+    r'|(?<![가-힣])(?P<parent>법)(?=\s*제)'
+    r'|(?P<named>[가-힣]+법(?:률)?(?:\s*시행(?:령|규칙))?)'
+    r')?\s*제\s*(?P<no>\d+)\s*조(?:\s*의\s*(?P<branch>\d+))?'
+)
+
+def _same_law(name: str, law_name: Optional[str]) -> bool:
+    return bool(law_name) and name.replace(' ', '') == law_name.replace(' ', '')
+
+def extract_references(text: str, law_name: Optional[str] = None) -> list[Reference]:
+    """
+    Article references in a piece of legal text, in order of first mention, without duplicates.
+    A reference qualified by another law's name is external; an unqualified one, "이 법",
+    or one naming law_name itself refers to the same law (None). "같은 법"/"동법"
+    means the last law named before it. A bare "법 제N조" in a decree or rule points
+    at its parent act, which the text alone does not name, so it is left out.
+    """
+    refs: list[Reference] = []
+    seen = set()
+    last_named = None
+    for m in _REFERENCE.finditer(text):
+        name = m.group('quoted') or m.group('named')
+        if name:
+            name = name.strip()
+            target = None if _same_law(name, law_name) else name
+            last_named = target
+        elif m.group('same'):
+            target = last_named
+        elif m.group('parent'):
+            continue
+        else:
+            target = None
+        ref = (target, (int(m.group('no')), int(m.group('branch') or 0)))
+        if ref not in seen:
+            seen.add(ref)
+            refs.append(ref)
+    return refs
+
+class ReferenceGraph:
+    """
+    Adjacency list of one law: source article key -> referenced (law, article) targets.
+    Built once from the structured articles and kept with the parsed law.
+    """
+    __slots__ = ('edges',)
+
+    def __init__(self, articles: Iterable = (), law_name: Optional[str] = None):
+        self.edges: dict[tuple[int, int], tuple[Reference, ...]] = {}
+        for art in articles:
+            key = art.key
+            if key is None or art.kind != '조문':
+                continue
+            # An article's own heading ("제20조(목적)") is not a reference
+            targets = tuple(ref for ref in extract_references(art.full_text, law_name) if ref != (None, key))
+            if targets:
+                self.edges[key] = self.edges.get(key, ()) + targets
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple[tuple[int, int], Reference]]) -> "ReferenceGraph":
+        """
+        Rebuild from (source key, target) pairs, e.g. as saved by ArticleStore.put_references.
+        """
+        graph = cls()
+        adjacency: dict = {}
+        for source, target in edges:
+            adjacency.setdefault(source, []).append(target)
+        graph.edges = {source: tuple(targets) for source, targets in adjacency.items()}
+        return graph
+
+    def pairs(self) -> Iterable[tuple[tuple[int, int], Reference]]:
+        for source, targets in self.edges.items():
+            for target in targets:
+                yield source, target
+
+    def targets(self, key: tuple[int, int]) -> tuple[Reference, ...]:
+        return self.edges.get(key, ())
+
+    def external(self) -> list[Reference]:
+        """
+        Every reference to another law, in article order, without duplicates.
+        """
+        seen = set()
+        refs = []
+        for targets in self.edges.values():
+            for ref in targets:
+                if ref[0] is not None and ref not in seen:
+                    seen.add(ref)
+                    refs.append(ref)
+        return refs
+
+    @property
+    def size(self) -> int:
+        # Rough weight for law_cache accounting
+        return 64 * len(self.edges) + sum(96 * len(t) for t in self.edges.values())
+
+# "법 제20조", "법 제20조의2제1항제3호": a decree or rule citing its act ("영 ..." for
+# a rule citing the decree). Not "같은 법 제5조" / "동 법 제5조" (the law named just
+# before) or a quoted name followed by the word, as in "「건축법」 법 제5조"
+_PARENT_REFERENCE = {
+    parent: re.compile(
+        rf'(?<![가-힣」])(?<!」\s)(?<!같은\s)(?<!같은\s\s)(?<!동\s)(?<!동\s\s){parent}\s*제\s*(?P<no>\d+)\s*조(?:\s*의\s*(?P<branch>\d+))?'
+        r'(?:\s*제\s*\d+\s*항)?(?:\s*제\s*\d+\s*호)?'
+    )
+    for parent in ("법", "영")
+}
+
+class DelegationIndex:
+    """
+    For a decree (or rule): parent article key -> the articles citing it, as
+    (decree article, cited provision) pairs in article order, e.g.
+    (20, 2) -> [(<제5조>, "법 제20조의2제1항")]. parent is "법" for the act, "영" for
+    the decree (as cited from a rule). Built once and kept with the parsed decree.
+    """
+    __slots__ = ('citations',)
+
+    def __init__(self, articles: Iterable, parent: str = "법"):
+        self.citations: dict[tuple[int, int], list] = {}
+        pattern = _PARENT_REFERENCE[parent]
+        for art in articles:
+            if art.kind != '조문':
+                continue
+            cited = {}
+            for m in pattern.finditer(art.full_text):
+                key = (int(m.group('no')), int(m.group('branch') or 0))
+                # Keep the most specific wording per parent article
+                provision = parent + " " + re.sub(r'\s+', '', m.group(0))[len(parent):]
+                if key not in cited or len(provision) > len(cited[key]):
+                    cited[key] = provision
+            for key, provision in cited.items():
+                self.citations.setdefault(key, []).append((art, provision))
+
+    def citing(self, key: tuple[int, int]) -> list:
+        return self.citations.get(key, [])
+
+    @property
+    def size(self) -> int:
+        # Rough weight for law_cache accounting (articles are shared with the law)
+        return 64 * len(self.citations) + sum(80 * len(c) for c in self.citations.values())
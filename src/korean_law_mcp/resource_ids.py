@@ -0,0 +1,100 @@
+import concurrent.futures
+import logging
+import os
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from .cache import LRUCache
+
+logger = logging.getLogger("korean-law-mcp")
+
+# How long an ID the API did not know keeps answering "not found" without a fetch
+NOT_FOUND_TTL = float(os.getenv("KOREAN_LAW_NOT_FOUND_TTL", "600"))
+# Entries are tiny; this bounds the memory at tens of thousands of IDs
+ID_MEMORY_BYTES = 4 * 1024 * 1024
+_ENTRY_SIZE = 100
+
+# Seconds the preferred lookup of a multi-kind ID runs alone before the fallbacks start
+FALLBACK_HEDGE_AFTER = float(os.getenv("KOREAN_LAW_FALLBACK_HEDGE_AFTER", "1.0"))
+# Threads running fallback lookups, shared by every request
+FALLBACK_WORKERS = int(os.getenv("KOREAN_LAW_FALLBACK_WORKERS", "6"))
+
+_MISSING = "-"
+
+class ResourceIdMemory:
+    """
+    (resource type, ID) -> how the ID was last found ("ID", "MST", "detc" ...), kept
+    until evicted, or that it was not found, kept for NOT_FOUND_TTL.
+
+    Types are read_legal_resource's: statute, prec, admrul, const, ordin, term, interp.
+    Only an answer from the API counts as not found; fetch errors are never remembered.
+    """
+    def __init__(self, not_found_ttl: float = NOT_FOUND_TTL):
+        self.not_found_ttl = not_found_ttl
+        self._cache = LRUCache(ID_MEMORY_BYTES)
+
+    def kind(self, r_type: str, r_id: str) -> Optional[str]:
+        """
+        The ID kind that worked last time, or None if unknown (or not found).
+        """
+        hit = self._cache.get((r_type, str(r_id)))
+        return None if hit is None or hit == _MISSING else hit
+
+    def found(self, r_type: str, r_id: str, kind: str) -> None:
+        self._cache.put((r_type, str(r_id)), kind, _ENTRY_SIZE)
+
+    def missing(self, r_type: str, r_id: str) -> bool:
+        """
+        True if the API recently answered that this ID does not exist.
+        """
+        return self._cache.get((r_type, str(r_id))) == _MISSING
+
+    def not_found(self, r_type: str, r_id: str) -> None:
+        if self.not_found_ttl > 0:
+            self._cache.put((r_type, str(r_id)), _MISSING, _ENTRY_SIZE, self.not_found_ttl)
+
+    def forget(self, r_type: str, r_id: str) -> None:
+        self._cache.pop((r_type, str(r_id)))
+
+    def stats(self) -> Dict[str, Any]:
+        return self._cache.stats()
+
+def race(strategies: List[tuple[Hashable, Callable[[], Any]]], valid: Callable[[Hashable, Any], bool],
+         executor: concurrent.futures.Executor,
+         hedge_after: Optional[float] = None) -> tuple[Optional[Hashable], Any, Optional[Exception]]:
+    """
+    Run (kind, fetch) strategies and return (kind, result, error) for the first valid
+    result in list order: a later strategy wins only once every earlier one has finished
+    without a valid result, so a faster fallback never overrides the preferred lookup.
+
+    With `hedge_after`, the first strategy runs alone, and the others start once it has
+    answered without a valid result or has not answered within hedge_after seconds;
+    otherwise all of them start at once. Returns as soon as the winner is decided; the
+    rest keep running in the background. With no valid result, kind and result are None
+    and `error` is the first exception a strategy raised, if any (the ID may exist after all).
+    """
+    futures = [executor.submit(strategies[0][1])]
+    if len(strategies) > 1:
+        if hedge_after is not None:
+            try:
+                result = futures[0].result(timeout=hedge_after)
+                if valid(strategies[0][0], result):
+                    return strategies[0][0], result, None
+            except Exception:
+                # Still running, or failed (reported below); either way the fallbacks start now
+                pass
+        futures += [executor.submit(fetch) for _, fetch in strategies[1:]]
+    error = None
+    try:
+        for (kind, _), future in zip(strategies, futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.warning(f"Lookup by {kind} failed: {e}")
+                error = error or e
+                continue
+            if valid(kind, result):
+                return kind, result, None
+        return None, None, error
+    finally:
+        for future in futures:
+            future.cancel()
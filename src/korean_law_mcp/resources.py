@@ -1,7 +1,7 @@
 import logging
-from .server import mcp
+from .server import mcp, offload
 from .utils import (
-    get_statute_detail_internal,
+    get_statute_page_internal,
     get_statute_article_internal,
     get_precedent_detail_internal,
     get_admin_rule_detail_internal,
@@ -11,37 +11,55 @@ from .utils import (
 
 logger = logging.getLogger("korean-law-mcp")
 
-@mcp.resource("law://statute/{id}")
+@offload(mcp.resource("law://statute/{id}"))
 def read_statute_resource(id: str) -> str:
-    """Read full text of a statute (Law)"""
+    """Read the text of a statute (Law), first page; long laws end with a continuation cursor"""
     logger.info(f"Reading statute resource: {id}")
-    return get_statute_detail_internal(id)
+    return get_statute_page_internal(id)
 
-@mcp.resource("law://statute/{id}/art/{art_no}")
+@offload(mcp.resource("law://statute/{id}/page/{cursor}"))
+def read_statute_page_resource(id: str, cursor: str) -> str:
+    """Read the next page of a statute, using the cursor from the previous page"""
+    logger.info(f"Reading statute page: {id} ({cursor})")
+    return get_statute_page_internal(id, cursor=cursor)
+
+@offload(mcp.resource("law://statute/{id}/arts/{start}-{end}"))
+def read_statute_articles_resource(id: str, start: str, end: str) -> str:
+    """Read a range of articles from a statute (e.g. law://statute/123/arts/100-120)"""
+    logger.info(f"Reading statute articles: {id} Art {start}-{end}")
+    return get_statute_page_internal(id, article_range=f"{start}-{end}")
+
+@offload(mcp.resource("law://statute/{id}/art/{art_no}"))
 def read_statute_article_resource(id: str, art_no: str) -> str:
     """Read a specific article from a statute"""
     logger.info(f"Reading statute article: {id} Art {art_no}")
     return get_statute_article_internal(id, art_no)
 
-@mcp.resource("law://prec/{id}")
+@offload(mcp.resource("law://prec/{id}"))
 def read_precedent_resource(id: str) -> str:
     """Read content of a precedent (Case Law)"""
     logger.info(f"Reading precedent resource: {id}")
     return get_precedent_detail_internal(id)
 
-@mcp.resource("law://admrul/{id}")
+@offload(mcp.resource("law://prec/{id}/sections/{sections}"))
+def read_precedent_sections_resource(id: str, sections: str) -> str:
+    """Read selected parts of a precedent (e.g. law://prec/123/sections/holding,summary)"""
+    logger.info(f"Reading precedent sections: {id} ({sections})")
+    return get_precedent_detail_internal(id, sections=sections)
+
+@offload(mcp.resource("law://admrul/{id}"))
 def read_admrul_resource(id: str) -> str:
     """Read content of an administrative rule"""
     logger.info(f"Reading admin rule resource: {id}")
     return get_admin_rule_detail_internal(id)
 
-@mcp.resource("law://term/{id}")
+@offload(mcp.resource("law://term/{id}"))
 def read_legal_term_resource(id: str) -> str:
     """Read definition of a legal term"""
     logger.info(f"Reading legal term resource: {id}")
     return get_legal_term_detail_internal(id)
 
-@mcp.resource("law://interp/{id}")
+@offload(mcp.resource("law://interp/{id}"))
 def read_interp_resource(id: str) -> str:
     """Read content of a statutory interpretation"""
     logger.info(f"Reading statutory interpretation resource: {id}")
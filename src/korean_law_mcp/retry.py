@@ -0,0 +1,257 @@
+import asyncio
+import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, FIRST_COMPLETED, wait
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+# Retry / deadline / hedging settings (override via environment)
+MAX_ATTEMPTS = int(os.getenv("KOREAN_LAW_RETRIES", "3"))
+DEADLINE = float(os.getenv("KOREAN_LAW_DEADLINE", "30"))
+HEDGE_ENABLED = os.getenv("KOREAN_LAW_HEDGE", "1").lower() not in ("0", "false", "off", "no")
+BACKOFF_BASE = 0.25
+BACKOFF_CAP = 4.0
+# Latency samples needed (per endpoint) before the p95 is trusted for hedging
+HEDGE_MIN_SAMPLES = 20
+LATENCY_WINDOW = 200
+
+class DeadlineExceeded(TimeoutError):
+    """
+    Raised when a call's total time budget runs out (across all attempts and hedges).
+    """
+
+class LatencyTracker:
+    """
+    Sliding window of successful call latencies per key (endpoint).
+    """
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._samples: Dict[str, Deque[float]] = {}
+        self._window = window
+        self._lock = threading.Lock()
+
+    def record(self, key: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self._window)
+            samples.append(seconds)
+
+    def percentile(self, key: str, pct: float = 0.95) -> Optional[float]:
+        with self._lock:
+            samples = self._samples.get(key)
+            if not samples or len(samples) < HEDGE_MIN_SAMPLES:
+                return None
+            ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+def hedged_call(executor: Executor, fn: Callable[[], Any], hedge_after: Optional[float],
+                timeout: float, sent: Optional[threading.Event] = None) -> Tuple[Any, bool, bool]:
+    """
+    Run fn on the executor and wait at most `timeout` seconds for it.
+    If it has not answered after `hedge_after` seconds, start a second copy and take
+    whichever succeeds first. Returns (result, hedged, hedge_won).
+    With `sent`, the hedge timer starts only once the first attempt sets it (has left
+    the throttle queue), so waiting in line never triggers a hedge.
+    Abandoned attempts keep running in the background until their socket timeout.
+    """
+    start = time.monotonic()
+    first = executor.submit(fn)
+    pending = {first}
+    hedged = False
+    if hedge_after is not None and hedge_after < timeout:
+        if sent is not None:
+            sent.wait(timeout)
+        wait_for = min(hedge_after, timeout - (time.monotonic() - start))
+        done, _ = wait(pending, timeout=max(0.0, wait_for))
+        if not done and time.monotonic() - start < timeout:
+            pending.add(executor.submit(fn))
+            hedged = True
+
+    error: Optional[BaseException] = None
+    while pending:
+        remaining = timeout - (time.monotonic() - start)
+        if remaining <= 0:
+            break
+        done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        if not done:
+            break
+        for future in done:
+            if future.exception() is None:
+                return future.result(), hedged, future is not first
+            error = future.exception()
+
+    if error is not None and not pending:
+        raise error
+    raise DeadlineExceeded(f"No response within {timeout:.1f}s")
+
+async def async_hedged_call(fn: Callable[[], Awaitable[Any]], hedge_after: Optional[float],
+                            timeout: float, sent: Optional[asyncio.Event] = None) -> Tuple[Any, bool, bool]:
+    """
+    asyncio counterpart of hedged_call. The losing attempt is cancelled.
+    """
+    start = time.monotonic()
+    first = asyncio.ensure_future(fn())
+    pending = {first}
+    hedged = False
+    try:
+        if hedge_after is not None and hedge_after < timeout:
+            if sent is not None:
+                try:
+                    await asyncio.wait_for(sent.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+            wait_for = min(hedge_after, timeout - (time.monotonic() - start))
+            done, _ = await asyncio.wait(pending, timeout=max(0.0, wait_for))
+            if not done and time.monotonic() - start < timeout:
+                pending.add(asyncio.ensure_future(fn()))
+                hedged = True
+
+        error: Optional[BaseException] = None
+        while pending:
+            remaining = timeout - (time.monotonic() - start)
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break
+            for task in done:
+                if task.exception() is None:
+                    return task.result(), hedged, task is not first
+                error = task.exception()
+
+        if error is not None and not pending:
+            raise error
+        raise DeadlineExceeded(f"No response within {timeout:.1f}s")
+    finally:
+        for task in pending:
+            task.cancel()
+
+class RetryPolicy:
+    """
+    Deadline budget + jittered exponential backoff + optional hedging for idempotent GETs.
+
+    `fn` receives the seconds left in the budget so it can cap its own socket timeout.
+    Only errors accepted by `is_retryable` are retried, and never past the deadline.
+    With `throttled=True`, fn is called as fn(remaining, sent) and calls sent() once it
+    holds its throttle slot: latency is measured from there, and the hedge timer only
+    starts then, so rate-limit queueing neither inflates the p95 nor triggers hedges.
+    `hedge=False` disables hedging for one call (e.g. when a losing result would hold
+    a resource such as an open streaming response).
+    """
+    def __init__(self, attempts: int = MAX_ATTEMPTS, deadline: float = DEADLINE, hedge: bool = HEDGE_ENABLED,
+                 base: float = BACKOFF_BASE, cap: float = BACKOFF_CAP):
+        self.attempts = max(1, attempts)
+        self.deadline = deadline
+        self.hedge = hedge
+        self.base = base
+        self.cap = cap
+        self.latency = LatencyTracker()
+        self.retries = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.deadline_exceeded = 0
+
+    def backoff(self, attempt: int) -> float:
+        """
+        "Full jitter" backoff: uniform in [0, min(cap, base * 2^(attempt-1))].
+        """
+        return random.uniform(0, min(self.cap, self.base * 2 ** (attempt - 1)))
+
+    def hedge_after(self, key: str) -> Optional[float]:
+        return self.latency.percentile(key) if self.hedge else None
+
+    def _record(self, hedged: bool, hedge_won: bool) -> None:
+        if hedged:
+            self.hedged += 1
+            if hedge_won:
+                self.hedge_wins += 1
+
+    def call(self, key: str, fn: Callable[..., Any], executor: Executor,
+             is_retryable: Callable[[BaseException], bool], throttled: bool = False,
+             hedge: bool = True) -> Any:
+        deadline = time.monotonic() + self.deadline
+        attempt = 1
+        while True:
+            remaining = deadline - time.monotonic()
+            sent = threading.Event() if throttled else None
+
+            def timed(remaining=remaining, sent=sent):
+                started = [time.monotonic()]
+                if sent is None:
+                    result = fn(remaining)
+                else:
+                    def mark():
+                        started[0] = time.monotonic()
+                        sent.set()
+                    try:
+                        result = fn(remaining, mark)
+                    finally:
+                        sent.set()
+                self.latency.record(key, time.monotonic() - started[0])
+                return result
+
+            try:
+                hedge_after = self.hedge_after(key) if hedge else None
+                result, hedged, hedge_won = hedged_call(executor, timed, hedge_after, remaining, sent)
+                self._record(hedged, hedge_won)
+                return result
+            except DeadlineExceeded:
+                self.deadline_exceeded += 1
+                raise
+            except Exception as e:
+                delay = self.backoff(attempt)
+                if attempt >= self.attempts or not is_retryable(e) or time.monotonic() + delay >= deadline:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+            self.retries += 1
+
+    async def acall(self, key: str, fn: Callable[..., Awaitable[Any]],
+                    is_retryable: Callable[[BaseException], bool], throttled: bool = False,
+                    hedge: bool = True) -> Any:
+        deadline = time.monotonic() + self.deadline
+        attempt = 1
+        while True:
+            remaining = deadline - time.monotonic()
+            sent = asyncio.Event() if throttled else None
+
+            async def timed(remaining=remaining, sent=sent):
+                started = [time.monotonic()]
+                if sent is None:
+                    result = await fn(remaining)
+                else:
+                    def mark():
+                        started[0] = time.monotonic()
+                        sent.set()
+                    try:
+                        result = await fn(remaining, mark)
+                    finally:
+                        sent.set()
+                self.latency.record(key, time.monotonic() - started[0])
+                return result
+
+            try:
+                hedge_after = self.hedge_after(key) if hedge else None
+                result, hedged, hedge_won = await async_hedged_call(timed, hedge_after, remaining, sent)
+                self._record(hedged, hedge_won)
+                return result
+            except DeadlineExceeded:
+                self.deadline_exceeded += 1
+                raise
+            except Exception as e:
+                delay = self.backoff(attempt)
+                if attempt >= self.attempts or not is_retryable(e) or time.monotonic() + delay >= deadline:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+            self.retries += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "retries": self.retries,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "deadline_exceeded": self.deadline_exceeded,
+        }
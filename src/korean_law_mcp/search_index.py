@@ -0,0 +1,171 @@
+import math
+import re
+import sys
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+# Snippet window (characters before / after the first hit)
+SNIPPET_BEFORE = 40
+SNIPPET_AFTER = 120
+
+_WORD = re.compile(r'\w+')
+# "exact phrase", "near words"~5, or a bare keyword
+_CLAUSE = re.compile(r'"([^"]+)"(?:~(\d+))?|(\S+)')
+# Postings pack (document, word position) into one integer
+_POS_BITS = 20
+_POS_MASK = (1 << _POS_BITS) - 1
+
+def _grams(word: str) -> List[str]:
+    """
+    Character bigrams of a word (the word itself if it is one character).
+    Bigrams match Korean stems regardless of the attached particle (권리 / 권리의 / 권리를).
+    """
+    if len(word) < 2:
+        return [word]
+    return [word[i:i + 2] for i in range(len(word) - 1)]
+
+def parse_query(query: str) -> List[Tuple[List[str], Optional[int]]]:
+    """
+    Split a query into clauses of (words, slop):
+    - keyword        -> (["keyword"], None)
+    - "a b c"        -> (["a", "b", "c"], 0)     adjacent words, in order
+    - "a b"~5        -> (["a", "b"], 5)          within 5 words of each other
+    A bare keyword with punctuation inside (권리·의무) is treated as a phrase.
+    """
+    clauses = []
+    for phrase, slop, word in _CLAUSE.findall(query):
+        words = _WORD.findall((phrase or word).lower())
+        if not words:
+            continue
+        if phrase:
+            clauses.append((words, int(slop) if slop else 0))
+        else:
+            clauses.append((words, None if len(words) == 1 else 0))
+    return clauses
+
+class ArticleSearchIndex:
+    """
+    Positional bigram index over the articles of one law, with BM25 ranking.
+    Built once per law; `texts` are the articles' full_text strings (shared, not copied).
+    """
+    def __init__(self, texts: Sequence[str]):
+        self.texts = texts
+        self.lengths = array('I')
+        postings: Dict[str, array] = {}
+        for doc, text in enumerate(texts):
+            words = _WORD.findall(text.lower())
+            self.lengths.append(len(words))
+            for pos, word in enumerate(words[:_POS_MASK]):
+                packed = doc << _POS_BITS | pos
+                for gram in set(_grams(word)):
+                    plist = postings.get(gram)
+                    if plist is None:
+                        plist = postings[gram] = array('Q')
+                    plist.append(packed)
+        self.postings = postings
+        self.avgdl = (sum(self.lengths) / len(self.lengths)) if self.lengths else 0.0
+        self.size = (sys.getsizeof(postings) + sys.getsizeof(self.lengths) +
+                     sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in postings.items()))
+
+    def _occurrences(self, word: str) -> Dict[int, List[int]]:
+        """
+        doc -> sorted word positions whose word contains `word`.
+        """
+        if len(word) < 2:
+            # Single characters are not indexed inside longer words; scan (rare in practice)
+            return self._scan(word)
+        grams = set(_grams(word))
+        lists = [self.postings.get(g) for g in grams]
+        if any(plist is None for plist in lists):
+            return {}
+        lists.sort(key=len)
+        hits = set(lists[0])
+        for plist in lists[1:]:
+            hits.intersection_update(plist)
+            if not hits:
+                return {}
+
+        occurrences: Dict[int, List[int]] = {}
+        for packed in sorted(hits):
+            occurrences.setdefault(packed >> _POS_BITS, []).append(packed & _POS_MASK)
+        if len(word) > 2:
+            # Bigrams co-occurring in one word do not guarantee the substring; confirm per doc
+            occurrences = {d: p for d, p in occurrences.items() if word in self.texts[d].lower()}
+        return occurrences
+
+    def _scan(self, word: str) -> Dict[int, List[int]]:
+        occurrences: Dict[int, List[int]] = {}
+        for doc, text in enumerate(self.texts):
+            text = text.lower()
+            if word in text:
+                occurrences[doc] = [i for i, w in enumerate(_WORD.findall(text)) if word in w]
+        return occurrences
+
+    def _clause_hits(self, words: List[str], slop: Optional[int]) -> Dict[int, int]:
+        """
+        doc -> term frequency of the clause.
+        """
+        occs = [self._occurrences(w) for w in words]
+        if not occs or any(not o for o in occs):
+            return {}
+        docs = set(occs[0]).intersection(*occs[1:])
+        if slop is None:
+            return {d: len(occs[0][d]) for d in docs}
+
+        tf: Dict[int, int] = {}
+        for doc in docs:
+            others = [set(o[doc]) for o in occs[1:]]
+            count = 0
+            for start in occs[0][doc]:
+                if slop == 0:
+                    ok = all(start + i + 1 in positions for i, positions in enumerate(others))
+                else:
+                    ok = all(any(abs(p - start) <= slop for p in positions) for positions in others)
+                if ok:
+                    count += 1
+            if count:
+                tf[doc] = count
+        return tf
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        Return (article position, BM25 score) for articles matching every clause, best first.
+        """
+        clauses = parse_query(query)
+        if not clauses or not self.texts:
+            return []
+        n = len(self.texts)
+        scores: Optional[Dict[int, float]] = None
+        for words, slop in clauses:
+            tf = self._clause_hits(words, slop)
+            if scores is not None:
+                tf = {d: f for d, f in tf.items() if d in scores}
+            if not tf:
+                return []
+            idf = math.log(1 + (n - len(tf) + 0.5) / (len(tf) + 0.5))
+            clause_scores = {}
+            for doc, f in tf.items():
+                norm = K1 * (1 - B + B * self.lengths[doc] / self.avgdl) if self.avgdl else K1
+                clause_scores[doc] = (scores or {}).get(doc, 0.0) + idf * f * (K1 + 1) / (f + norm)
+            scores = clause_scores
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:limit] if limit else ranked
+
+    def snippet(self, doc: int, query: str) -> str:
+        """
+        A short excerpt around the first hit, with query words in **bold**.
+        """
+        text = self.texts[doc]
+        words = sorted({w for ws, _ in parse_query(query) for w in ws}, key=len, reverse=True)
+        if not words:
+            return ""
+        pattern = re.compile("|".join(re.escape(w) for w in words), re.IGNORECASE)
+        first = pattern.search(text)
+        start = max(0, first.start() - SNIPPET_BEFORE) if first else 0
+        end = min(len(text), (first.end() if first else 0) + SNIPPET_AFTER)
+        excerpt = " ".join(text[start:end].split())
+        excerpt = pattern.sub(lambda m: f"**{m.group(0)}**", excerpt)
+        return ("…" if start > 0 else "") + excerpt + ("…" if end < len(text) else "")
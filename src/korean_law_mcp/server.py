@@ -1,4 +1,44 @@
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
 from mcp.server.fastmcp import FastMCP
 
 # Initialize FastMCP
 mcp = FastMCP("Korean Law MCP")
+
+# Handlers do blocking network I/O, so they run on worker pools instead of the event loop.
+# Expensive multi-fetch handlers (reference/delegation chains, attachments, full-law prompts)
+# get their own pool so they can never occupy every worker that cheap lookups need.
+# Single-document reads (precedents, terms, statute pages and articles) stay on "default".
+WORKERS = int(os.getenv("KOREAN_LAW_WORKERS", "16"))
+HEAVY_WORKERS = int(os.getenv("KOREAN_LAW_HEAVY_WORKERS", "4"))
+
+_pools = {
+    "default": ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="law-io"),
+    "heavy": ThreadPoolExecutor(max_workers=HEAVY_WORKERS, thread_name_prefix="law-heavy"),
+}
+
+def offload(register, pool: str = "default"):
+    """
+    Register a blocking handler with FastMCP as a coroutine that runs on a worker pool.
+
+    `register` is the decorator returned by mcp.tool() / mcp.resource(...) / mcp.prompt().
+    The plain function is returned unchanged, so modules can keep calling it directly.
+
+    Usage:
+        @offload(mcp.tool(), pool="heavy")
+        def explore_legal_chain(query: str) -> str: ...
+    """
+    executor = _pools[pool]
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def handler(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, functools.partial(fn, *args, **kwargs))
+
+        register(handler)
+        return fn
+
+    return decorator
@@ -0,0 +1,59 @@
+import xml.etree.ElementTree as ET
+from typing import Any, Iterable, Iterator, Tuple
+
+def element_to_dict(elem: ET.Element) -> Any:
+    """
+    Convert an element to the same shape xmltodict.parse would produce for it:
+    leaf text as str (None if empty), attributes as '@name', repeated children as lists,
+    and text alongside children as '#text'.
+    """
+    children = list(elem)
+    text = (elem.text or "").strip()
+    if not children and not elem.attrib:
+        return text or None
+    result = {f"@{k}": v for k, v in elem.attrib.items()}
+    for child in children:
+        value = element_to_dict(child)
+        if child.tag in result:
+            existing = result[child.tag]
+            if not isinstance(existing, list):
+                result[child.tag] = existing = [existing]
+            existing.append(value)
+        else:
+            result[child.tag] = value
+    if text:
+        result["#text"] = text
+    return result
+
+def iter_law_sections(chunks: Iterable[bytes], root: str = "법령", group: str = "조문",
+                      item: str = "조문단위") -> Iterator[Tuple[str, Any]]:
+    """
+    Incrementally decode a lawService.do document fed as byte chunks.
+
+    Yields (tag, value) for each child of the root element (기본정보, 개정문, 별표 ...),
+    except that the `group` section is not yielded as a whole: each of its `item`
+    children (조문단위) is yielded on its own as soon as it has been read.
+    Every element is discarded once yielded, so memory stays proportional to one
+    article rather than the whole law. Stops consuming `chunks` as soon as the
+    caller stops iterating. Yields nothing if the document root is not `root`.
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    stack = []
+    for chunk in chunks:
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            if event == "start":
+                stack.append(elem)
+                if len(stack) == 1 and elem.tag != root:
+                    return
+                continue
+
+            stack.pop()
+            depth = len(stack)
+            if depth == 1 and elem.tag != group:
+                yield elem.tag, element_to_dict(elem)
+                stack[0].remove(elem)
+            elif depth == 2 and elem.tag == item and stack[1].tag == group:
+                yield elem.tag, element_to_dict(elem)
+                stack[1].remove(elem)
+    parser.close()
@@ -0,0 +1,243 @@
+import asyncio
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Callable, Dict, Any, Optional
+
+# Client-side limits for law.go.kr (override via environment)
+RATE_LIMIT = float(os.getenv("KOREAN_LAW_RATE_LIMIT", "10"))      # requests/second per OC key
+RATE_BURST = float(os.getenv("KOREAN_LAW_RATE_BURST", "20"))
+MIN_CONCURRENCY = int(os.getenv("KOREAN_LAW_MIN_CONCURRENCY", "2"))
+MAX_CONCURRENCY = int(os.getenv("KOREAN_LAW_MAX_CONCURRENCY", "64"))
+INITIAL_CONCURRENCY = 8
+
+# AIMD tuning: back off by this factor on errors / latency spikes, at most once per cooldown
+BACKOFF_FACTOR = 0.7
+BACKOFF_COOLDOWN = 1.0
+# A short-term latency average this many times the long-term one counts as congestion
+LATENCY_TOLERANCE = 2.0
+
+class TokenBucket:
+    """
+    Token bucket that hands out reservations: callers are told how long to wait
+    for their token, so the same bucket serves thread and asyncio callers.
+    """
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take one token and return the seconds to wait before using it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+class _AIMD:
+    """
+    Additive-increase / multiplicative-decrease concurrency limit.
+    Grows by about one slot per limit's worth of healthy calls; shrinks on errors
+    or when recent latency rises well above its long-term average.
+    """
+    def __init__(self, initial: int = INITIAL_CONCURRENCY, min_limit: int = MIN_CONCURRENCY,
+                 max_limit: int = MAX_CONCURRENCY):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = float(max(min_limit, min(initial, max_limit)))
+        self.in_flight = 0
+        self.waiting = 0
+        self._short_latency: Optional[float] = None
+        self._long_latency: Optional[float] = None
+        self._last_backoff = 0.0
+
+    def _update(self, latency: float, ok: bool) -> None:
+        if self._short_latency is None:
+            self._short_latency = self._long_latency = latency
+        else:
+            self._short_latency += 0.3 * (latency - self._short_latency)
+            self._long_latency += 0.02 * (latency - self._long_latency)
+
+        congested = not ok or self._short_latency > self._long_latency * LATENCY_TOLERANCE
+        now = time.monotonic()
+        if congested:
+            if now - self._last_backoff >= BACKOFF_COOLDOWN:
+                self.limit = max(self.min_limit, self.limit * BACKOFF_FACTOR)
+                self._last_backoff = now
+        else:
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+
+    def _has_slot(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    def _free_slots(self) -> int:
+        return max(0, int(self.limit) - self.in_flight)
+
+class AdaptiveLimiter(_AIMD):
+    """
+    AIMD concurrency limiter for thread-based callers.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._cond:
+            self.waiting += 1
+            self._cond.wait_for(self._has_slot)
+            self.waiting -= 1
+            self.in_flight += 1
+
+    def release(self, latency: float, ok: bool) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            self._update(latency, ok)
+            # Wake only as many waiters as can proceed; waking all of them is quadratic in queue depth
+            self._cond.notify(self._free_slots())
+
+class AsyncAdaptiveLimiter(_AIMD):
+    """
+    AIMD concurrency limiter for asyncio callers.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cond = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            self.waiting += 1
+            try:
+                await self._cond.wait_for(self._has_slot)
+            except asyncio.CancelledError:
+                # A waiter cancelled after being woken must pass its wake-up on
+                if self._has_slot():
+                    self._cond.notify(1)
+                raise
+            finally:
+                self.waiting -= 1
+            self.in_flight += 1
+
+    async def release(self, latency: float, ok: bool) -> None:
+        async with self._cond:
+            self.in_flight -= 1
+            self._update(latency, ok)
+            # Wake only as many waiters as can proceed (see AdaptiveLimiter.release)
+            self._cond.notify(self._free_slots())
+
+class _Throttle:
+    """
+    Queueing metrics shared by the sync and async throttles.
+    """
+    def __init__(self, bucket: TokenBucket, limiter: _AIMD, is_congestion: Callable[[BaseException], bool]):
+        self.bucket = bucket
+        self.limiter = limiter
+        self.is_congestion = is_congestion
+        self.calls = 0
+        self.delayed = 0
+        self.errors = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _record_wait(self, waited: float) -> None:
+        self.calls += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        if waited > 0.001:
+            self.delayed += 1
+
+    def _ok(self, exc: Optional[BaseException]) -> bool:
+        if exc is not None and self.is_congestion(exc):
+            self.errors += 1
+            return False
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": round(self.limiter.limit, 2),
+            "in_flight": self.limiter.in_flight,
+            "waiting": self.limiter.waiting,
+            "calls": self.calls,
+            "delayed": self.delayed,
+            "errors": self.errors,
+            "avg_wait_ms": round(self.total_wait / self.calls * 1000, 2) if self.calls else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 2),
+            "rate_limit": self.bucket.rate,
+        }
+
+class Throttle(_Throttle):
+    """
+    Rate limit + adaptive concurrency for thread-based callers.
+
+    Usage:
+        with throttle.slot():
+            response = session.get(...)
+    """
+    @contextmanager
+    def slot(self):
+        queued = time.monotonic()
+        delay = self.bucket.reserve()
+        if delay:
+            time.sleep(delay)
+        self.limiter.acquire()
+        started = time.monotonic()
+        self._record_wait(started - queued)
+        exc = None
+        try:
+            yield
+        except BaseException as e:
+            exc = e
+            raise
+        finally:
+            self.limiter.release(time.monotonic() - started, self._ok(exc))
+
+class AsyncThrottle(_Throttle):
+    """
+    Rate limit + adaptive concurrency for asyncio callers.
+    """
+    @asynccontextmanager
+    async def slot(self):
+        queued = time.monotonic()
+        delay = self.bucket.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+        await self.limiter.acquire()
+        started = time.monotonic()
+        self._record_wait(started - queued)
+        exc = None
+        try:
+            yield
+        except BaseException as e:
+            exc = e
+            raise
+        finally:
+            await self.limiter.release(time.monotonic() - started, self._ok(exc))
+
+# One bucket per OC key: every client using the same key shares its upstream quota
+_buckets: Dict[str, TokenBucket] = {}
+_throttles: Dict[str, Throttle] = {}
+_registry_lock = threading.Lock()
+
+def get_bucket(oc_key: str) -> TokenBucket:
+    with _registry_lock:
+        bucket = _buckets.get(oc_key)
+        if bucket is None:
+            bucket = _buckets[oc_key] = TokenBucket(RATE_LIMIT, RATE_BURST)
+        return bucket
+
+def get_throttle(oc_key: str, is_congestion: Callable[[BaseException], bool]) -> Throttle:
+    """
+    Return the process-wide thread throttle for an OC key.
+    """
+    bucket = get_bucket(oc_key)
+    with _registry_lock:
+        throttle = _throttles.get(oc_key)
+        if throttle is None:
+            throttle = _throttles[oc_key] = Throttle(bucket, AdaptiveLimiter(), is_congestion)
+        return throttle
@@ -1,12 +1,13 @@
 import logging
 import re
-from .server import mcp
+from .server import mcp, offload
+from .hotset import hot_laws
 from .utils import (
     client, 
     search_statute_internal, 
     smart_search_statute_internal, 
     search_integrated_internal,
-    get_statute_detail_internal,
+    get_statute_page_internal,
     get_precedent_detail_internal,
     get_admin_rule_detail_internal,
     get_prec_const_detail_internal,
@@ -16,13 +17,17 @@ from .utils import (
     get_law_history_internal,
     get_old_new_comparison_internal,
     resolve_references,
-    _parse_articles
+    load_law,
+    law_names
 )
 
 logger = logging.getLogger("korean-law-mcp")
 
-@mcp.tool()
-def search_korean_law(query: str) -> str:
+# Ranked hits shown by search_law_articles
+MAX_ARTICLE_RESULTS = 20
+
+@offload(mcp.tool())
+def search_korean_law(query: str, fresh: bool = False) -> str:
     """
     Primary interface for searching Korean laws, precedents, and administrative rules.
     It is a "Smart Search" that adapts to the query type.
@@ -38,6 +43,10 @@ def search_korean_law(query: str) -> str:
        - Behavior: Returns a summarized list of top results across Statutes, Precedents, and Admin Rules.
        - Output: Includes **Typed IDs** (e.g., `statute:12345`, `prec:67890`) which MUST be used with `read_legal_resource` to get full text.
 
+       - Answered from a local index of previously fetched documents when it has enough
+         ranked matches (marked "local index"); set `fresh=True` to always query the live API
+         (e.g. for newly promulgated laws or recent cases).
+
     Usage Tips:
     - ALWAYS try to be specific if you know the law name and article number.
     - If searching for a case by number, just enter it (e.g., "2010다102991").
@@ -70,19 +79,21 @@ def search_korean_law(query: str) -> str:
         return smart_search_statute_internal(query)
     
     # 2. Otherwise default to integrated search
-    return search_integrated_internal(query)
+    return search_integrated_internal(query, fresh=fresh)
 
-@mcp.tool()
+@offload(mcp.tool())
 def search_law_articles(law_id: str, keywords: str) -> str:
     """
     Search for specific keywords within the articles of a statute.
     
     Args:
         law_id: The ID of the law (e.g., "statute:12345" or just "12345").
-        keywords: Space-separated keywords to search for within article text.
+        keywords: Space-separated keywords; every keyword must appear. Also supports
+                  "exact phrase" and "words near each other"~5 (within 5 words).
         
     Returns:
-        Markdown formatted text containing the articles that match the keywords.
+        Markdown list of matching articles ranked by relevance (BM25), each with a
+        highlighted snippet.
     """
     # Remove prefix if present
     if ":" in law_id:
@@ -90,41 +101,38 @@ def search_law_articles(law_id: str, keywords: str) -> str:
         
     logger.info(f"Searching articles in law {law_id} for: {keywords}")
     
-    data = client.get_law_detail(law_id)
-    if '법령' not in data: 
+    law = load_law(law_id)
+    if law is None: 
         return "Error: Law not found or invalid ID."
         
-    law_info = data['법령']
-    law_name = law_info.get('기본정보', {}).get('법령명_한글', 'Unknown')
-    parsed_articles = _parse_articles(law_info)
-    
-    if not parsed_articles: 
+    law_name = law.name
+    hot_laws.record(law_name)
+    if not law.articles: 
         return f"# {law_name}\n\n(No articles found to search)"
     
-    matches = []
-    keywords_list = keywords.split()
-    
-    for art in parsed_articles:
-        # Check if all keywords are in the article text
-        # Simple case-insensitive match
-        text_to_search = art['full_text']
-        if all(k in text_to_search for k in keywords_list):
-            matches.append(art)
+    # BM25 over the law's cached inverted index (built on the first search)
+    index = law.search_index()
+    ranked = index.search(keywords)
             
-    if not matches:
+    if not ranked:
         return f"# {law_name}\n\nNo articles found matching keywords: '{keywords}'"
         
     output = [f"# {law_name} - Search Results for '{keywords}'", ""]
-    output.append(f"Found {len(matches)} matching articles.\n")
+    output.append(f"Found {len(ranked)} matching articles.\n")
     
-    for art in matches:
-        output.append(f"## 제{art['no']}조 {art['title'] if art['title'] else ''}")
-        output.append(art['full_text'])
+    for pos, score in ranked[:MAX_ARTICLE_RESULTS]:
+        art = law.articles[pos]
+        output.append(f"## {art.label} {art.title if art.title else ''} (score {score:.2f})")
+        output.append(index.snippet(pos, keywords))
         output.append("")
+    
+    if len(ranked) > MAX_ARTICLE_RESULTS:
+        output.append(f"... and {len(ranked) - MAX_ARTICLE_RESULTS} more articles.")
+    output.append(f"Read an article in full with law://statute/{law_id}/art/{{article_no}}.")
         
     return "\n".join(output)
 
-@mcp.tool()
+@offload(mcp.tool())
 def search_legal_terms(query: str) -> str:
     """
     Search for legal terms (definitions).
@@ -149,7 +157,7 @@ def search_legal_terms(query: str) -> str:
         
     return "\n".join(output)
 
-@mcp.tool()
+@offload(mcp.tool())
 def search_statutory_interpretations(query: str) -> str:
     """
     Search for statutory interpretations (authoritative interpretations by Ministry of Government Legislation).
@@ -173,7 +181,7 @@ def search_statutory_interpretations(query: str) -> str:
         
     return "\n".join(output)
 
-@mcp.tool()
+@offload(mcp.tool(), pool="heavy")
 def get_statute_attachments(law_id: str) -> str:
     """
     Get a list of attached forms and tables (별표/서식) for a specific statute.
@@ -183,11 +191,11 @@ def get_statute_attachments(law_id: str) -> str:
     if ":" in law_id: law_id = law_id.split(":")[-1]
     logger.info(f"Getting attachments for law: {law_id}")
     
-    data = client.get_law_detail(law_id)
-    if '법령' not in data: return "Error: Law not found."
+    law = load_law(law_id)
+    if law is None: return "Error: Law not found."
     
-    law_info = data['법령']
-    name = law_info.get('기본정보', {}).get('법령명_한글', 'Unknown')
+    law_info = law.info
+    name = law.name
     
     # Parse images/files (Byulpyo / Seosik)
     attachments = []
@@ -222,20 +230,28 @@ def get_statute_attachments(law_id: str) -> str:
     return "\n".join(output)
 
 
-@mcp.tool()
-def read_legal_resource(resource_id: str) -> str:
+# Statutes come in bounded pages and references within a time budget, so a read stays cheap
+@offload(mcp.tool())
+def read_legal_resource(resource_id: str, cursor: str = None, articles: str = None, sections: str = None) -> str:
     """
     Reads the full content of a specific legal resource using its Typed ID.
     
     Args:
         resource_id: A string strictly in the format `type:id` (e.g., "statute:12345", "prec:98765", "admrul:54321").
                      The ID is obtained from the `search_korean_law` output.
+        cursor: (Statutes) Continuation cursor printed at the end of the previous page.
+        articles: (Statutes) Only read this article range, e.g. "100-120" or "20의2-30".
+        sections: (prec/const/interp/admrul) Comma-separated parts to return, e.g. "holding,summary".
+                  prec: holding, summary, text, references; const: holding, summary, text;
+                  interp: question, answer, reason; admrul: text, addenda. Default: everything.
 
     Features:
     - **Full Text Retrieval**: Fetches the complete text of statutes, precedents, or rules.
     - **Reference Resolution**: Automatically detects references to other laws (e.g., "refer to Article 5") within the text
       and appends their content to the response, saving you extra round-trips.
     - **Robustness**: Automatically handles ID formatting issues or outdated IDs by trying fallbacks (ID -> MST -> Detc).
+    - **Paging**: Long statutes come in pages of whole articles; pass the printed `cursor` to read the next one.
+    - **Sections**: Ask only for the parts you need (e.g. a precedent's holding and summary) to skip long full texts.
 
     Return:
     - Markdown formatted text containing the resource metadata, body content, and resolved references.
@@ -247,20 +263,22 @@ def read_legal_resource(resource_id: str) -> str:
             return "Error: Invalid ID format. Expected 'type:id' (e.g. statute:12345)."
             
         r_type, r_id = resource_id.split(":", 1)
+        if sections and r_type not in ("prec", "admrul", "const", "interp"):
+            return f"Error: 'sections' is not supported for '{r_type}' resources (only prec, admrul, const, interp)."
         
         content = ""
         
         if r_type == "statute":
-            content = get_statute_detail_internal(r_id)
+            content = get_statute_page_internal(r_id, cursor=cursor, article_range=articles)
             
         elif r_type == "prec":
-            content = get_precedent_detail_internal(r_id)
+            content = get_precedent_detail_internal(r_id, sections=sections)
             
         elif r_type == "admrul":
-            content = get_admin_rule_detail_internal(r_id)
+            content = get_admin_rule_detail_internal(r_id, sections=sections)
             
         elif r_type == "const":
-            content = get_prec_const_detail_internal(r_id)
+            content = get_prec_const_detail_internal(r_id, sections=sections)
             
         elif r_type == "ordin":
             content = get_autonomous_law_detail_internal(r_id)
@@ -269,26 +287,25 @@ def read_legal_resource(resource_id: str) -> str:
             content = get_legal_term_detail_internal(r_id)
             
         elif r_type == "interp":
-            content = get_statutory_interpretation_detail_internal(r_id)
+            content = get_statutory_interpretation_detail_internal(r_id, sections=sections)
             
         else:
             return f"Error: Unknown resource type '{r_type}'."
             
         # Auto-resolve references for statutes and maybe others
-        # We only resolve if content was successfully retrieved
-        if content and not content.startswith("Error"):
-             refs = resolve_references(content)
-             if "No specific cross-references" not in refs:
+        # We only resolve if content was successfully retrieved, and only on the first page
+        if content and not content.startswith("Error") and not cursor:
+             # A statute's external references come from its reference graph, not a rescan
+             refs = resolve_references(content, context_law_id=r_id if r_type == "statute" else None)
+             if refs:
                  content += "\n\n" + refs
                  
         return content
             
-        return content
-            
     except Exception as e:
         return f"Error reading resource: {e}"
 
-@mcp.tool()
+@offload(mcp.tool(), pool="heavy")
 def explore_legal_chain(query: str) -> str:
     """
     Perform a 'Deep Search' (Legal Graph).
@@ -304,7 +321,7 @@ def explore_legal_chain(query: str) -> str:
     Returns:
     - A comprehensive markdown document containing the main article and all connected legal texts.
     """
-    from .utils import smart_search_statute_internal, client, _parse_articles, resolve_references, resolve_delegation
+    from .utils import smart_search_statute_internal, client, resolve_references, resolve_delegation
     
     logger.info(f"Exploring legal chain for: {query}")
     
@@ -330,19 +347,17 @@ def explore_legal_chain(query: str) -> str:
         law_query = match.group(1).strip()
         art_no = match.group(2)
 
-    # Search Law ID
-    data = client.search_law(law_query)
-    if 'LawSearch' not in data or 'law' not in data['LawSearch']:
+    # Resolve Law ID (cached by name)
+    found = law_names.resolve(law_query)
+    if found is None:
          return f"Could not find law: {law_query}"
-         
-    items = data['LawSearch']['law']
-    if not isinstance(items, list): items = [items]
-    target_law = items[0] # Best guess
-    law_id = target_law.get('법령일련번호')
-    law_name = target_law.get('법령명한글')
+    law_id, law_name = found
     
     # 2. Get Main Article Content
+    # Reference resolution below reads other articles of the same law, so parse it
+    # in full once up front instead of streaming it for the main article first.
     from .utils import get_statute_article_internal
+    if law_id: load_law(law_id)
     main_text = get_statute_article_internal(law_id, art_no)
     
     if "not found" in main_text: return main_text
@@ -353,7 +368,7 @@ def explore_legal_chain(query: str) -> str:
     output.append(main_text)
     
     # Internal/External Refs
-    refs = resolve_references(main_text, context_law_name=law_name, context_law_id=law_id)
+    refs = resolve_references(main_text, context_law_name=law_name, context_law_id=law_id, article_no=art_no)
     if refs:
         output.append("\n" + refs)
         
@@ -364,6 +379,7 @@ def explore_legal_chain(query: str) -> str:
         
     return "\n".join(output)
 
+# Pure string formatting with no I/O, so it runs directly on the event loop.
 @mcp.tool()
 def get_external_links(resource_id: str) -> str:
     """
@@ -436,7 +452,7 @@ def get_external_links(resource_id: str) -> str:
     
     return "\n".join(output)
 
-@mcp.tool()
+@offload(mcp.tool())
 def get_article_history(law_name_or_id: str) -> str:
     """
     Get the revision history (연혁) of a law.
@@ -460,27 +476,19 @@ def get_article_history(law_name_or_id: str) -> str:
     if ":" in law_name_or_id:
         law_id = law_name_or_id.split(":")[-1]
     
-    # If it's a name (contains Korean), search for ID first
+    # If it's a name (contains Korean), resolve it to an ID first (cached by name)
     if re.search(r'[가-힣]', law_id):
         try:
-            data = client.search_law(law_id)
-            if 'LawSearch' in data and 'law' in data['LawSearch']:
-                items = data['LawSearch']['law']
-                if not isinstance(items, list):
-                    items = [items]
-                # Get the first (best) match
-                law_id = items[0].get('법령일련번호', '')
-                law_name = items[0].get('법령명한글', '')
-                if not law_id:
-                    return f"Error: Could not find ID for '{law_name_or_id}'"
-            else:
-                return f"Error: Law not found: '{law_name_or_id}'"
+            found = law_names.resolve(law_id)
         except Exception as e:
             return f"Error searching for law: {e}"
+        if found is None:
+            return f"Error: Law not found: '{law_name_or_id}'"
+        law_id = found[0]
     
     return get_law_history_internal(law_id)
 
-@mcp.tool()
+@offload(mcp.tool())
 def compare_old_new(law_name_or_id: str) -> str:
     """
     Get the old/new article comparison (신구조문대비) for a law.
@@ -504,23 +512,15 @@ def compare_old_new(law_name_or_id: str) -> str:
     if ":" in law_name_or_id:
         law_id = law_name_or_id.split(":")[-1]
     
-    # If it's a name (contains Korean), search for ID first
+    # If it's a name (contains Korean), resolve it to an ID first (cached by name)
     if re.search(r'[가-힣]', law_id):
         try:
-            data = client.search_law(law_id)
-            if 'LawSearch' in data and 'law' in data['LawSearch']:
-                items = data['LawSearch']['law']
-                if not isinstance(items, list):
-                    items = [items]
-                # Get the first (best) match
-                law_id = items[0].get('법령일련번호', '')
-                law_name = items[0].get('법령명한글', '')
-                if not law_id:
-                    return f"Error: Could not find ID for '{law_name_or_id}'"
-            else:
-                return f"Error: Law not found: '{law_name_or_id}'"
+            found = law_names.resolve(law_id)
         except Exception as e:
             return f"Error searching for law: {e}"
+        if found is None:
+            return f"Error: Law not found: '{law_name_or_id}'"
+        law_id = found[0]
     
     return get_old_new_comparison_internal(law_id)
 
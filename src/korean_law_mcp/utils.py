@@ -1,9 +1,25 @@
+import base64
 import logging
+import os
 import re
+import sys
+import threading
+import time
 import concurrent.futures
-import xmltodict
-import requests
+from contextlib import closing
+from typing import Iterator, Optional
 from .api_client import KoreanLawClient
+from .streaming import iter_law_sections
+from .cache import LRUCache, LAW_CACHE_MAX_MB, estimate_size
+from .singleflight import SingleFlight
+from .search_index import ArticleSearchIndex
+from .corpus import get_default_corpus, CORPUS_MIN_HITS
+from .article_store import get_default_store
+from .family import LawFamilyIndex
+from .hotset import hot_laws
+from .law_ids import LawIdResolver, NAME_TTL
+from .resource_ids import ResourceIdMemory, race, FALLBACK_HEDGE_AFTER, FALLBACK_WORKERS
+from .references import ReferenceGraph, DelegationIndex, extract_references, REFERENCE_BUDGET, REFERENCE_WORKERS, REFERENCE_TIMEOUT
 
 # Configure logging
 logger = logging.getLogger("korean-law-mcp")
@@ -11,8 +27,135 @@ logger = logging.getLogger("korean-law-mcp")
 # Initialize Client
 client = KoreanLawClient()
 
+# Parsed laws shared by every *_internal function (keyed by MST)
+law_cache = LRUCache(int(LAW_CACHE_MAX_MB * 1024 * 1024))
+# Concurrent misses for the same law share one fetch and one parse
+_law_loads = SingleFlight()
+# MSTs being streamed by scan_law right now; a second reader joins a full load instead
+_law_scans: set = set()
+_law_scans_lock = threading.Lock()
+# Act -> decree / rule / admin rules, learned from law search listings
+law_families = LawFamilyIndex(client.search_law)
+# Law name -> current MST, shared by every tool that starts from a name
+law_names = LawIdResolver(client.search_law, observers=[law_families.observe])
+# Parsed smart-search queries: query -> (law MST, law name, article number or None)
+_smart_plans = LRUCache(1024 * 1024)
+# Shared by every resolve_references call, so concurrent requests stay bounded together
+_reference_pool = concurrent.futures.ThreadPoolExecutor(max_workers=REFERENCE_WORKERS, thread_name_prefix="law-refs")
+# Loads the decree and rule of resolve_delegation calls, bounded across concurrent requests
+_delegation_pool = concurrent.futures.ThreadPoolExecutor(max_workers=REFERENCE_WORKERS, thread_name_prefix="law-delegation")
+# Which ID kind found each resource, and which IDs were recently not found
+resource_ids = ResourceIdMemory()
+# Runs the competing lookups of _fetch_with_fallbacks
+_fallback_pool = concurrent.futures.ThreadPoolExecutor(max_workers=FALLBACK_WORKERS, thread_name_prefix="law-fallback")
+
 # --- Helpers ---
 
+def observe_law_listing(items: list) -> None:
+    """
+    Let the name and family caches learn from a lawSearch.do listing the caller already has.
+    """
+    law_names.observe(items)
+    law_families.observe(items)
+
+def index_document(kind: str, doc_id: str, title: str, body: str, meta: Optional[dict] = None) -> None:
+    """
+    Add a fetched document to the local search corpus (no-op when it is disabled).
+    Indexing problems are logged, never raised to the caller.
+    """
+    corpus = get_default_corpus()
+    if corpus is None or not doc_id:
+        return
+    try:
+        corpus.add(kind, doc_id, title, body, meta)
+    except Exception as e:
+        logger.warning(f"Could not index {kind}:{doc_id}: {e}")
+
+def _has_root(root: str):
+    return lambda kind, data: isinstance(data, dict) and root in data
+
+def _fetch_with_fallbacks(r_type: str, r_id: str, strategies: list, valid) -> tuple[Optional[str], Optional[dict]]:
+    """
+    (kind, data) from the first of `strategies` ((kind, fetch) pairs in preference order)
+    whose response `valid(kind, data)` accepts, or (None, None) if the ID is not found.
+
+    IDs recently not found are answered from resource_ids without a fetch. With several
+    strategies, the kind that worked last time is tried alone; otherwise the first is
+    tried and the others are hedged in after FALLBACK_HEDGE_AFTER seconds or as soon as
+    it comes back empty (see resource_ids.race). If none is found and a fetch failed,
+    the first error is raised rather than reporting the ID as not found.
+    """
+    if resource_ids.missing(r_type, r_id):
+        logger.info(f"{r_type}:{r_id} was not found recently; skipping the fetch")
+        return None, None
+    if len(strategies) == 1:
+        kind, fetch = strategies[0]
+        data = fetch()
+        if valid(kind, data):
+            return kind, data
+        resource_ids.not_found(r_type, r_id)
+        return None, None
+
+    remembered = resource_ids.kind(r_type, r_id)
+    for kind, fetch in strategies:
+        if kind == remembered:
+            try:
+                data = fetch()
+                if valid(kind, data):
+                    return kind, data
+            except Exception as e:
+                logger.warning(f"Lookup of {r_type}:{r_id} by {kind} failed: {e}")
+            resource_ids.forget(r_type, r_id)
+            # The kind just tried is not fetched again
+            strategies = [s for s in strategies if s[0] != kind]
+    kind, data, error = race(strategies, valid, _fallback_pool, hedge_after=FALLBACK_HEDGE_AFTER)
+    if kind is not None:
+        resource_ids.found(r_type, r_id, kind)
+    elif error is not None:
+        raise error
+    else:
+        resource_ids.not_found(r_type, r_id)
+    return kind, data
+
+def index_law(law: "ParsedLaw") -> None:
+    """
+    Add a statute version to the local search corpus, replacing the law's older MSTs.
+    An MST's text never changes, so one already indexed (e.g. reloaded after an LRU
+    eviction) only has its freshness renewed.
+    """
+    corpus = get_default_corpus()
+    if corpus is None:
+        return
+    try:
+        if corpus.touch('statute', law.law_id):
+            return
+        date = law.basic_info.get('시행일자') or ''
+        # 법령ID stays the same across amendments; the MST (law_id) does not
+        series = law.basic_info.get('법령ID') or law.name
+        # Newer enforcement date first, then the later MST of the same date
+        version = f"{date}:{law.law_id.zfill(12)}"
+        corpus.add('statute', law.law_id, law.name, "\n".join(a.full_text for a in law.articles),
+                   {'date': date}, series=series, version=version)
+    except Exception as e:
+        logger.warning(f"Could not index statute:{law.law_id}: {e}")
+
+def store_law(law: "ParsedLaw") -> None:
+    """
+    Write a parsed law's articles to the on-disk article store (no-op when disabled
+    or already stored). Problems are logged, never raised to the caller.
+    """
+    store = get_default_store()
+    if store is None:
+        return
+    try:
+        # Same ordering as the corpus: a later enforcement date (then MST) supersedes the stored version
+        version = f"{law.basic_info.get('시행일자') or ''}:{law.law_id.zfill(12)}"
+        store.put_law(law.law_id, law.name, (
+            (art.key, (art.no, art.title, art.full_text, art.kind, art.branch)) for art in law.articles
+        ), version=version)
+    except Exception as e:
+        logger.warning(f"Could not store articles of {law.law_id}: {e}")
+
 def clean_html(text):
     if not text: return ""
     text = str(text)
@@ -20,10 +163,59 @@ def clean_html(text):
     text = text.replace("<![CDATA[", "").replace("]]>", "")
     return text.strip()
 
-def _parse_articles(law_info: dict) -> list[dict]:
+_ARTICLE_NO = re.compile(r'^\s*제?\s*(\d+)\s*(?:조)?\s*(?:(?:의|-|_)\s*(\d+))?\s*$')
+
+def normalize_article_no(article_no) -> Optional[tuple[int, int]]:
+    """
+    Normalise an article reference to (조문번호, 조문가지번호).
+    "20", "제20조" -> (20, 0); "20-2", "20의2", "제20조의2" -> (20, 2).
+    Returns None if it is not an article number.
+    """
+    m = _ARTICLE_NO.match(str(article_no))
+    if not m:
+        return None
+    return int(m.group(1)), int(m.group(2) or 0)
+
+class Article:
+    """
+    One parsed article. Slotted, with interned number/title/kind strings:
+    a hot statute holds thousands of these and the same numbers and headings
+    (e.g. '삭제', '목적', '정의') recur across laws.
+    kind is '조문' for content articles and '전문' for chapter/section headers;
+    branch is the 조문가지번호 ('' for none, '2' for 제20조의2).
+    """
+    __slots__ = ('no', 'branch', 'title', 'full_text', 'kind')
+
+    def __init__(self, no: str, title: str, full_text: str, kind: str, branch: str = ''):
+        self.no = sys.intern(no)
+        self.branch = sys.intern(branch)
+        self.title = sys.intern(title)
+        self.full_text = full_text
+        self.kind = sys.intern(kind)
+
+    @property
+    def key(self) -> Optional[tuple[int, int]]:
+        if not self.no.isdigit() or (self.branch and not self.branch.isdigit()):
+            return None
+        return int(self.no), int(self.branch or 0)
+
+    @property
+    def label(self) -> str:
+        return f"제{self.no}조의{self.branch}" if self.branch else f"제{self.no}조"
+
+    def __eq__(self, other):
+        if not isinstance(other, Article):
+            return NotImplemented
+        return ((self.no, self.branch, self.title, self.full_text, self.kind) ==
+                (other.no, other.branch, other.title, other.full_text, other.kind))
+
+    def __repr__(self):
+        return f"Article(no={self.no!r}, branch={self.branch!r}, title={self.title!r}, kind={self.kind!r})"
+
+def _parse_articles(law_info: dict) -> list[Article]:
     """
     Helper to parse articles from law info dictionary.
-    Returns a list of dicts: {'no': str, 'title': str, 'full_text': str}
+    Returns a list of Article records.
     """
     articles = []
     # Articles are in '조문' -> '조문단위'
@@ -37,75 +229,7 @@ def _parse_articles(law_info: dict) -> list[dict]:
             body = [body]
             
         for item in body:
-            # Check for '조문내용' (Article Content)
-            content = item.get('조문내용', '')
-            # If empty, sometimes content is in text node or formatted differently
-            if not content and '#text' in item:
-                content = item['#text']
-            
-            content = content.strip()
-            
-            article_no = item.get('조문번호', '?')
-            title = item.get('조문제목', '')
-            
-            full_text_lines = []
-            
-            if title:
-                header_text = f"제{article_no}조({title})"
-            else:
-                header_text = f"제{article_no}조"
-            
-            # Prevent duplication if content already starts with the header
-            # Normalize spaces for comparison
-            normalized_content = content.replace(" ", "")
-            normalized_header = header_text.replace(" ", "")
-            
-            if normalized_content.startswith(normalized_header):
-                # formatting: "Title: Title content..."
-                # If content is exactly the header, maybe it's just a title line?
-                # We'll just use the content as is, but often we want to format it nicely.
-                # If we prepended header, it would be "Title: Title content..." -> Duplicate.
-                # So we just use content.
-                full_text_lines.append(content)
-            else:
-                full_text_lines.append(f"{header_text}: {content}")
-            
-            # Sub-paragraphs (항)
-            paragraphs = item.get('항', [])
-            if not isinstance(paragraphs, list):
-                paragraphs = [paragraphs]
-            
-            for p in paragraphs:
-                p_content = p.get('항내용', '').strip()
-                p_no = p.get('항번호', '')
-                if p_content:
-                    # Sometimes p_content also starts with p_no (e.g. "① Text")
-                    if p_content.startswith(p_no):
-                        full_text_lines.append(f"  {p_content}")
-                    else:
-                        full_text_lines.append(f"  {p_no}. {p_content}")
-                    
-                # Sub-sub-paragraphs (호) are inside '항' -> '호'
-                hos = p.get('호', [])
-                if not isinstance(hos, list):
-                    hos = [hos]
-                for h in hos:
-                    h_content = h.get('호번호', '') + " " + h.get('호내용', '').strip()
-                    h_content = h_content.strip()
-                    full_text_lines.append(f"    {h_content}")
-            
-            # Deduplicate items in TOC generation
-            # We can't easily dedupe here, but we can ensure we don't produce empty entries
-            
-            # Extract '조문여부' to distinguish between headers ("전문") and content ("조문")
-            art_type = item.get('조문여부', '')
-            
-            articles.append({
-                'no': str(article_no),
-                'title': title,
-                'full_text': "\n".join(full_text_lines),
-                'type': art_type
-            })
+            articles.append(_parse_article_item(item))
 
     except Exception as e:
         logger.error(f"Error parsing articles: {e}")
@@ -113,6 +237,316 @@ def _parse_articles(law_info: dict) -> list[dict]:
         
     return articles
 
+def _parse_article_item(item: dict) -> Article:
+    """
+    Parse a single '조문단위' entry (as produced by xmltodict or streaming.iter_law_sections).
+    """
+    # Check for '조문내용' (Article Content)
+    content = item.get('조문내용') or ''
+    # If empty, sometimes content is in text node or formatted differently
+    if not content and '#text' in item:
+        content = item['#text']
+    
+    content = content.strip()
+    
+    article_no = item.get('조문번호', '?')
+    # Branch articles (제20조의2) carry the branch in '조문가지번호'
+    branch = str(item.get('조문가지번호') or '').strip()
+    label = f"제{article_no}조의{branch}" if branch else f"제{article_no}조"
+    title = item.get('조문제목') or ''
+    
+    full_text_lines = []
+    
+    if title:
+        header_text = f"{label}({title})"
+    else:
+        header_text = label
+    
+    # Prevent duplication if content already starts with the header
+    # Normalize spaces for comparison
+    normalized_content = content.replace(" ", "")
+    normalized_header = header_text.replace(" ", "")
+    
+    if normalized_content.startswith(normalized_header):
+        # formatting: "Title: Title content..."
+        # If content is exactly the header, maybe it's just a title line?
+        # We'll just use the content as is, but often we want to format it nicely.
+        # If we prepended header, it would be "Title: Title content..." -> Duplicate.
+        # So we just use content.
+        full_text_lines.append(content)
+    else:
+        full_text_lines.append(f"{header_text}: {content}")
+    
+    # Sub-paragraphs (항)
+    paragraphs = item.get('항') or []
+    if not isinstance(paragraphs, list):
+        paragraphs = [paragraphs]
+    
+    for p in paragraphs:
+        if not isinstance(p, dict): continue
+        p_content = (p.get('항내용') or '').strip()
+        p_no = p.get('항번호') or ''
+        if p_content:
+            # Sometimes p_content also starts with p_no (e.g. "① Text")
+            if p_content.startswith(p_no):
+                full_text_lines.append(f"  {p_content}")
+            else:
+                full_text_lines.append(f"  {p_no}. {p_content}")
+            
+        # Sub-sub-paragraphs (호) are inside '항' -> '호'
+        hos = p.get('호') or []
+        if not isinstance(hos, list):
+            hos = [hos]
+        for h in hos:
+            h_content = (h.get('호번호') or '') + " " + (h.get('호내용') or '').strip()
+            h_content = h_content.strip()
+            full_text_lines.append(f"    {h_content}")
+    
+    # Extract '조문여부' to distinguish between headers ("전문") and content ("조문")
+    art_type = item.get('조문여부') or ''
+    
+    return Article(str(article_no), title, "\n".join(full_text_lines), art_type, branch)
+
+class ParsedLaw:
+    """
+    A statute fetched once and parsed once: metadata plus parsed articles.
+    Instances are shared through law_cache, so treat them as read-only.
+    """
+    def __init__(self, law_id: str, basic_info: dict, info: dict, articles: list[Article]):
+        self.law_id = str(law_id)
+        self.basic_info = basic_info or {}
+        self.name = self.basic_info.get('법령명_한글', 'Unknown')
+        self.articles = articles
+        # (조문번호, 조문가지번호) -> [content article, header article]; see lookup()
+        self.index = {}
+        for art in articles:
+            key = art.key
+            if key is None:
+                continue
+            slot = self.index.setdefault(key, [None, None])
+            pos = 0 if art.kind == '조문' else 1
+            if slot[pos] is None:
+                slot[pos] = art
+        # Remaining sections (개정문, 제개정이유, 별표, 서식 ...) but not the raw article tree
+        self.info = info
+        self.size = estimate_size(self.info) + estimate_size(self.articles) + estimate_size(self.index)
+        self._search_index = None
+        self._references = None
+        self._delegations = None
+        # Serialises the lazy builders below: the law is shared by every thread reading it
+        self._build_lock = threading.Lock()
+
+    def _built(self, size: int) -> None:
+        """
+        Account for a structure just attached to the law (caller holds _build_lock).
+        Only a law still in law_cache is re-weighed; an evicted one is not put back.
+        """
+        self.size += size
+        law_cache.reweigh(self.law_id, self, self.size)
+
+    def search_index(self) -> ArticleSearchIndex:
+        """
+        Full-text index over the articles, built on first use and kept with the law.
+        The law is re-weighed in law_cache to account for it.
+        """
+        if self._search_index is None:
+            with self._build_lock:
+                if self._search_index is None:
+                    index = ArticleSearchIndex([art.full_text for art in self.articles])
+                    self._search_index = index
+                    self._built(index.size)
+        return self._search_index
+
+    def references(self) -> ReferenceGraph:
+        """
+        Article-to-article reference graph, extracted on first use and kept with the law
+        (re-weighed in law_cache like the search index).
+        """
+        if self._references is None:
+            with self._build_lock:
+                if self._references is None:
+                    graph = ReferenceGraph(self.articles, self.name)
+                    self._references = graph
+                    self._built(graph.size)
+        return self._references
+
+    def delegations(self, parent: str = "법") -> DelegationIndex:
+        """
+        For a decree or rule: which of its articles cite each article of the act
+        (parent "법") or, for a rule, of the decree (parent "영").
+        Built on first use and kept with the law (re-weighed in law_cache).
+        """
+        index = self._delegations.get(parent) if self._delegations is not None else None
+        if index is None:
+            with self._build_lock:
+                if self._delegations is None:
+                    self._delegations = {}
+                index = self._delegations.get(parent)
+                if index is None:
+                    index = self._delegations[parent] = DelegationIndex(self.articles, parent)
+                    self._built(index.size)
+        return index
+
+    def lookup(self, article_no) -> Optional[Article]:
+        """
+        The content article for a number ("20", "20-2", "20의2", "제20조의2"),
+        or the header with that number if there is no content article.
+        """
+        key = normalize_article_no(article_no)
+        slot = self.index.get(key) if key else None
+        if slot is None:
+            return None
+        return slot[0] or slot[1]
+
+    @classmethod
+    def from_law_info(cls, law_id: str, law_info: dict) -> "ParsedLaw":
+        """
+        Build from an already-parsed xmltodict '법령' tree.
+        """
+        info = {k: v for k, v in law_info.items() if k != '조문'}
+        return cls(law_id, law_info.get('기본정보', {}), info, _parse_articles(law_info))
+
+def load_law(law_id: str) -> Optional[ParsedLaw]:
+    """
+    Return the parsed law for an MST, fetching and parsing it only on a cache miss.
+    Returns None if the API has no such law.
+    """
+    law_id = str(law_id)
+    law = law_cache.get(law_id)
+    if law is not None:
+        return law
+    return _law_loads.do(law_id, _load_law_uncached, law_id)
+
+def _load_law_uncached(law_id: str) -> Optional[ParsedLaw]:
+    # Decode the response one article at a time instead of building the whole XML tree
+    found = False
+    basic_info = {}
+    info = {}
+    articles = []
+    for tag, value in iter_law_sections(client.stream_law_detail(law_id)):
+        found = True
+        if tag == '조문단위':
+            try:
+                articles.append(_parse_article_item(value))
+            except Exception as e:
+                logger.error(f"Error parsing article in {law_id}: {e}")
+        elif tag == '기본정보':
+            basic_info = value or {}
+        else:
+            info[tag] = value
+    if not found:
+        return None
+    info['기본정보'] = basic_info
+    law = ParsedLaw(law_id, basic_info, info, articles)
+    law_cache.put(law_id, law, law.size)
+    store_law(law)
+    index_law(law)
+    return law
+
+def scan_law(law_id: str) -> Iterator[tuple[str, Optional[Article]]]:
+    """
+    Yield (law_name, article) for each article of a law, in order.
+    Uses the cached parse if the law is hot, then the on-disk article store; otherwise
+    streams the response and parses one article at a time, so a caller that stops early
+    also stops the download.
+    A law with no articles yields a single (law_name, None); an unknown law yields nothing.
+    """
+    law_id = str(law_id)
+    law = law_cache.get(law_id)
+    if law is not None:
+        yield from _law_rows(law)
+        return
+
+    store = get_default_store()
+    name = store.law_name(law_id) if store is not None else None
+    if name is not None:
+        any_article = False
+        for row in store.articles(law_id):
+            any_article = True
+            yield name, Article(*row)
+        if not any_article:
+            yield name, None
+        return
+
+    # Someone is already downloading this law: share one full load rather than
+    # opening another stream for it
+    with _law_scans_lock:
+        shared = law_id in _law_scans or _law_loads.in_flight(law_id)
+        if not shared:
+            _law_scans.add(law_id)
+    if shared:
+        law = load_law(law_id)
+        if law is not None:
+            yield from _law_rows(law)
+        return
+
+    name = None
+    any_article = False
+    try:
+        with closing(iter_law_sections(client.stream_law_detail(law_id))) as sections:
+            for tag, value in sections:
+                if tag == '기본정보':
+                    name = (value or {}).get('법령명_한글', 'Unknown')
+                elif tag == '조문단위':
+                    any_article = True
+                    yield name or 'Unknown', _parse_article_item(value)
+    finally:
+        with _law_scans_lock:
+            _law_scans.discard(law_id)
+    if name is not None and not any_article:
+        yield name, None
+
+def _law_rows(law: ParsedLaw) -> Iterator[tuple[str, Optional[Article]]]:
+    for art in law.articles:
+        yield law.name, art
+    if not law.articles:
+        yield law.name, None
+
+def find_article(law_id: str, article_no: str) -> tuple[Optional[str], Optional[Article]]:
+    """
+    Find an article (see _find_article) and count the read towards the law's hot-set score.
+    """
+    name, art = _find_article(law_id, article_no)
+    hot_laws.record(name)
+    return name, art
+
+def _find_article(law_id: str, article_no: str) -> tuple[Optional[str], Optional[Article]]:
+    """
+    Find an article, preferring a content article ('조문') over a header with the same number.
+    "20-2" and "20의2" both mean 제20조의2.
+    Returns (law_name, article); law_name is None if the law does not exist.
+    A cached law answers from its index, a stored law with one read from the article
+    store; otherwise the law is streamed and reading stops as soon as the content
+    article is found. A law the API recently did not know is answered from resource_ids.
+    """
+    law = law_cache.get(str(law_id))
+    if law is not None:
+        return law.name, law.lookup(article_no)
+
+    key = normalize_article_no(article_no)
+    store = get_default_store()
+    if store is not None and key is not None:
+        name, row = store.get(law_id, key)
+        if name is not None:
+            return name, Article(*row) if row is not None else None
+    if resource_ids.missing('statute', law_id):
+        return None, None
+    name = None
+    header = None
+    with closing(scan_law(law_id)) as articles:
+        for name, art in articles:
+            if key is None:
+                break
+            if art is None or art.key != key:
+                continue
+            if art.kind == '조문':
+                return name, art
+            if header is None:
+                header = art
+    if name is None:
+        resource_ids.not_found('statute', law_id)
+    return name, header
+
 # --- Internal Implementations ---
 
 def search_statute_internal(query: str) -> str:
@@ -123,6 +557,7 @@ def search_statute_internal(query: str) -> str:
         return "No results found."
     laws = data['LawSearch']['law']
     if not isinstance(laws, list): laws = [laws]
+    observe_law_listing(laws)
     output = []
     for law in laws:
         name = law.get('법령명한글', 'Unknown')
@@ -133,15 +568,131 @@ def search_statute_internal(query: str) -> str:
 
 def get_statute_detail_internal(law_id: str) -> str:
     logger.info(f"Getting details for ID: {law_id}")
-    data = client.get_law_detail(law_id)
-    if '법령' not in data: return "Error: Law not found."
-    law_info = data['법령']
-    name = law_info.get('기본정보', {}).get('법령명_한글', 'Unknown')
-    parsed_articles = _parse_articles(law_info)
+    if law_cache.get(str(law_id)) is None:
+        # A stored law is one contiguous read, with no fetch or parse
+        store = get_default_store()
+        name, text = store.law_text(law_id) if store is not None else (None, None)
+        if name is not None:
+            hot_laws.record(name)
+            if not text: return f"# {name}\n\n(No articles found)"
+            return f"# {name}\n\n" + text
+    law = load_law(law_id)
+    if law is None: return "Error: Law not found."
+    name = law.name
+    hot_laws.record(name)
+    parsed_articles = law.articles
     if not parsed_articles: return f"# {name}\n\n(No articles found)"
-    articles_text = [a['full_text'] for a in parsed_articles]
+    articles_text = [a.full_text for a in parsed_articles]
     return f"# {name}\n\n" + "\n".join(articles_text)
 
+# Characters of article text per page of a paged statute read
+PAGE_CHARS = int(os.getenv("KOREAN_LAW_PAGE_CHARS", "40000"))
+
+_ARTICLE_RANGE = re.compile(r'^\s*(제?\s*\d+\s*조?(?:\s*의\s*\d+)?)\s*[-~]\s*(제?\s*\d+\s*조?(?:\s*의\s*\d+)?)\s*$')
+
+def parse_article_range(spec: str) -> Optional[tuple[tuple[int, int], tuple[int, int]]]:
+    """
+    "100-120", "제100조~제120조", "20의2-30" -> inclusive (first key, last key).
+    A last article without a branch number includes its branch articles (120 covers 120의2).
+    None if the spec is not a valid range.
+    """
+    m = _ARTICLE_RANGE.match(spec or '')
+    if not m:
+        return None
+    first, last = normalize_article_no(m.group(1)), normalize_article_no(m.group(2))
+    if first is None or last is None:
+        return None
+    if last[1] == 0:
+        last = (last[0], sys.maxsize)
+    return (first, last) if first <= last else None
+
+def _encode_cursor(law_id: str, article_range: str, pos: int) -> str:
+    raw = f"{law_id}|{article_range}|{pos}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def _decode_cursor(cursor: str) -> Optional[tuple[str, str, int]]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        law_id, article_range, pos = raw.split("|")
+        return law_id, article_range, int(pos)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+def _statute_articles(law_id: str) -> tuple[Optional[str], list]:
+    """
+    (name, articles) from the cached parse: law_cache, else the article store, else a
+    single fetch that then stays in law_cache for the following pages.
+    """
+    law = law_cache.get(str(law_id))
+    if law is None:
+        store = get_default_store()
+        name = store.law_name(law_id) if store is not None else None
+        if name is not None:
+            return name, [Article(*row) for row in store.articles(law_id)]
+        law = load_law(law_id)
+    if law is None:
+        return None, []
+    return law.name, law.articles
+
+def get_statute_page_internal(law_id: str, cursor: str = None, article_range: str = None,
+                              max_chars: int = PAGE_CHARS) -> str:
+    """
+    One page of a statute: whole articles, in order, up to max_chars of text.
+    Args:
+        law_id: The ID of the law (from search_statute).
+        cursor: Continuation cursor from the previous page (carries the law and range).
+        article_range: Only these articles, e.g. "100-120" or "20의2-30".
+        max_chars: Page size budget; a single longer article still makes up a page.
+    """
+    if cursor:
+        decoded = _decode_cursor(cursor)
+        if decoded is None or decoded[0] != str(law_id):
+            return "Error: Invalid cursor for this law."
+        _, article_range, pos = decoded
+    else:
+        pos = 0
+    bounds = None
+    if article_range:
+        bounds = parse_article_range(article_range)
+        if bounds is None:
+            return f"Error: Invalid article range '{article_range}'. Expected e.g. '100-120' or '20의2-30'."
+
+    if resource_ids.missing('statute', law_id): return "Error: Law not found."
+    logger.info(f"Getting page of {law_id} (range={article_range}, pos={pos})")
+    name, articles = _statute_articles(law_id)
+    if name is None:
+        resource_ids.not_found('statute', law_id)
+        return "Error: Law not found."
+    hot_laws.record(name)
+    if bounds is not None:
+        articles = [a for a in articles if a.key is not None and bounds[0] <= a.key <= bounds[1]]
+    if not articles: return f"# {name}\n\n(No articles found)"
+    if pos >= len(articles): return f"# {name}\n\n(No more articles)"
+
+    texts = []
+    used = 0
+    end = pos
+    while end < len(articles):
+        text = articles[end].full_text
+        if texts and used + len(text) > max_chars:
+            break
+        texts.append(text)
+        used += len(text) + 1
+        end += 1
+
+    output = f"# {name}\n\n" + "\n".join(texts)
+    if pos > 0 or end < len(articles):
+        scope = f" in range {article_range}" if article_range else ""
+        output += (f"\n\n---\n(Showing {articles[pos].label} – {articles[end - 1].label}: "
+                   f"{pos + 1}-{end} of {len(articles)} articles{scope}.")
+        if end < len(articles):
+            next_cursor = _encode_cursor(str(law_id), article_range or '', end)
+            output += (f" To continue, call read_legal_resource(\"statute:{law_id}\", cursor=\"{next_cursor}\")"
+                       f" or read law://statute/{law_id}/page/{next_cursor}.)")
+        else:
+            output += " End of range.)" if article_range else " End of law.)"
+    return output
+
 def get_statute_article_internal(law_id: str, article_no: str) -> str:
     """
     Get the full text of a specific article from a statute.
@@ -150,84 +701,111 @@ def get_statute_article_internal(law_id: str, article_no: str) -> str:
         article_no: The article number (e.g., "20", "20-2").
     """
     logger.info(f"Getting article {article_no} for law ID: {law_id}")
-    data = client.get_law_detail(law_id)
+    # Content article ('조문') wins over a header with the same number; stops reading once found
+    name, art = find_article(law_id, article_no)
     
-    if '법령' not in data:
+    if name is None:
         return "Error: Invalid response structure (Missing '법령')"
         
-    law_info = data['법령']
-    name = law_info.get('기본정보', {}).get('법령명_한글', 'Unknown')
-    
-    parsed_articles = _parse_articles(law_info)
-    
-    for art in parsed_articles:
-        if art['no'] == article_no:
-            # If we find a content article, return immediately. 
-            # If we find a header, store it but keep looking.
-            if art.get('type') == '조문':
-                return f"# {name} 제{article_no}조\n\n" + art['full_text']
-            
-            # If we haven't found a content article yet, maybe this header is the best we got?
-            # But usually we want to keep looking.
-            pass
-            
-    # Second pass: if we are here, we didn't find "조문". Return the first match (header) if any.
-    for art in parsed_articles:
-        if art['no'] == article_no:
-             return f"# {name} 제{article_no}조\n\n" + art['full_text']
+    if art is not None:
+        return f"# {name} {art.label}\n\n" + art.full_text
 
     return f"Article {article_no} not found in {name}."
 
-def get_precedent_detail_internal(prec_id: str) -> str:
+# Sections each detail reader can return on its own: (name, source fields, heading).
+# A section is selected by its name or by one of its source field names.
+PREC_SECTIONS = (
+    ("holding", ("판시사항",), "판시사항 (Holding)"),
+    ("summary", ("판결요지",), "판결요지 (Summary)"),
+    ("text", ("판례내용",), "전문 (Full Text)"),
+    ("references", ("참조조문", "참조판례"), "참조 정보 (Related Resources)"),
+)
+CONST_SECTIONS = (
+    ("holding", ("판시사항",), "판시사항 (Holding)"),
+    ("summary", ("결정요지",), "결정요지 (Summary)"),
+    ("text", ("전문",), "전문 (Full Text)"),
+)
+INTERP_SECTIONS = (
+    ("question", ("질의요지",), "질의요지 (Question)"),
+    ("answer", ("회답",), "회답 (Answer)"),
+    ("reason", ("이유",), "이유 (Reasoning)"),
+)
+ADMRUL_SECTIONS = (
+    ("text", ("조문내용", "전문"), None),
+    ("addenda", ("부칙",), "부칙"),
+)
+
+def select_sections(sections: Optional[str], table: tuple) -> Optional[set]:
+    """
+    Parse a comma-separated section list ("holding,summary", "판결요지") against a
+    reader's section table into a set of section names; None/empty selects all.
+    Raises ValueError naming the available sections for an unknown one.
+    """
+    if not sections or not sections.strip():
+        return None
+    by_alias = {}
+    for name, fields, _ in table:
+        by_alias[name] = name
+        for field in fields:
+            by_alias[field] = name
+    selected = set()
+    for part in sections.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if part.lower() not in by_alias and part not in by_alias:
+            available = ", ".join(name for name, _, _ in table)
+            raise ValueError(f"Unknown section '{part}'. Available: {available}")
+        selected.add(by_alias.get(part.lower(), by_alias.get(part)))
+    return selected or None
+
+def _wanted(selected: Optional[set], name: str) -> bool:
+    return selected is None or name in selected
+
+def get_precedent_detail_internal(prec_id: str, sections: Optional[str] = None) -> str:
+    """
+    Precedent text; `sections` (see PREC_SECTIONS) limits which parts are cleaned and
+    returned, e.g. "holding,summary" skips the full judgment.
+    """
+    try:
+        selected = select_sections(sections, PREC_SECTIONS)
+    except ValueError as e:
+        return f"Error: {e}"
     logger.info(f"Getting precedent details for ID: {prec_id}")
-    data = client.get_precedent_detail(prec_id)
-    
-    if 'PrecService' not in data:
-        # Fallback: Try with MST parameter
-        # Some older precedents or specific IDs require MST instead of ID
-        logger.info(f"Standard fetch failed for {prec_id}. Trying MST fallback...")
-        try:
-            url = f"{client.BASE_URL}/DRF/lawService.do"
-            params = {
-                "OC": client.user_id,
-                "target": "prec",
-                "type": "XML",
-                "MST": prec_id 
-            }
-            resp = requests.get(url, params=params)
-            data = xmltodict.parse(resp.content)
-        except Exception as e:
-            logger.error(f"MST fallback failed: {e}")
-    
-    if 'PrecService' not in data:
-        # Fallback: Try with MST parameter again (Redundant block in original, but keeping logic safe)
-        logger.info(f"Standard fetch failed (ID={prec_id}). Trying MST fallback...")
-        # (Skipping duplicate try-except block, assuming previous one covered it or intention was retry)
-        # Actually in original code it was duplicated. I'll just check once effectively.
-        pass
-            
-    if 'PrecService' not in data:
-        # Final Fallback: Check if it's actually a Constitutional Court decision (target='detc')
-        # Sometimes 'prec' search returns const court cases but they must be fetched via 'detc'.
-        logger.info(f"Prec fetch failed. Checking if ID={prec_id} is a Constitutional Court decision...")
-        detc_content = get_prec_const_detail_internal(prec_id)
-        if "Error" not in detc_content[:20]:
-            return detc_content
-            
+    # Some older precedents are only addressable by MST, and some 'prec' search hits are
+    # Constitutional Court decisions that must be fetched as 'detc'. The ID is tried first
+    # and the other two hedged in; the ID kind that worked is remembered for the next read.
+    kind, data = _fetch_with_fallbacks('prec', prec_id, [
+        ("ID", lambda: client.get_precedent_detail(prec_id)),
+        ("MST", lambda: client.get_precedent_detail(prec_id, key="MST")),
+        ("detc", lambda: client.get_prec_const_detail(prec_id)),
+    ], lambda kind, data: isinstance(data, dict) and ('DetcService' if kind == "detc" else 'PrecService') in data)
+
+    if data is None:
         return "Error: Law/Precedent not found or Invalid ID. (Tried ID, MST, and Detc conversion)"
+    if kind == "detc":
+        # Show the same parts under the names the decision reader knows
+        const_names = [name for name, _, _ in CONST_SECTIONS]
+        missing = sorted(selected - set(const_names)) if selected is not None else []
+        if missing and not selected & set(const_names):
+            return (f"Error: {prec_id} is a Constitutional Court decision, which has no section "
+                    f"{', '.join(missing)}. Available: {', '.join(const_names)}")
+        output = _format_const_decision(data['DetcService'], selected)
+        if missing:
+            output += f"\n\n(Not available for a Constitutional Court decision: {', '.join(missing)})"
+        return output
         
     info = data['PrecService']
     title = info.get('사건명', 'Unknown')
     case_no = info.get('사건번호', 'Unknown')
     date = info.get('선고일자', 'Unknown')
     court = info.get('법원명', 'Unknown')
-    summary = info.get('판결요지', '')
-    content = info.get('판례내용', '')
-    holding = info.get('판시사항', '')
-    
-    # --- Knowledge Graph: Relationships ---
-    ref_articles = info.get('참조조문', '')
-    ref_cases = info.get('참조판례', '')
+
+    # Only the complete document goes into the corpus; a projection would index a fragment
+    if selected is None:
+        index_document('prec', prec_id, title,
+                       "\n".join(clean_html(info.get(k, '')) for k in ('판시사항', '판결요지', '판례내용')),
+                       {'case_no': case_no, 'date': date})
 
     output = [
         f"# {title}",
@@ -235,32 +813,38 @@ def get_precedent_detail_internal(prec_id: str) -> str:
         f"**Court:** {court}",
         f"**Date:** {date}",
         f"**ID:** {prec_id}",
-        "",
-        "## 판시사항 (Holding)",
-        clean_html(holding),
-        "",
-        "## 판결요지 (Summary)",
-        clean_html(summary),
-        "",
-        "## 전문 (Full Text)",
-        clean_html(content)
     ]
+    for name, fields, heading in PREC_SECTIONS[:3]:
+        if _wanted(selected, name):
+            output += ["", f"## {heading}", clean_html(info.get(fields[0], ''))]
     
-    # Append Knowledge Graph Links
-    if ref_articles or ref_cases:
-        output.append("")
-        output.append("## 참조 정보 (Related Resources)")
-        if ref_articles:
-            output.append(f"### 참조 조문 (Referenced Articles)\n{clean_html(ref_articles)}")
-        if ref_cases:
-            output.append(f"### 참조 판례 (Referenced Cases)\n{clean_html(ref_cases)}")
+    # --- Knowledge Graph: Relationships ---
+    if _wanted(selected, "references"):
+        ref_articles = info.get('참조조문', '')
+        ref_cases = info.get('참조판례', '')
+        if ref_articles or ref_cases:
+            output.append("")
+            output.append("## 참조 정보 (Related Resources)")
+            if ref_articles:
+                output.append(f"### 참조 조문 (Referenced Articles)\n{clean_html(ref_articles)}")
+            if ref_cases:
+                output.append(f"### 참조 판례 (Referenced Cases)\n{clean_html(ref_cases)}")
             
     return "\n".join(output)
 
-def get_admin_rule_detail_internal(adm_id: str) -> str:
+def get_admin_rule_detail_internal(adm_id: str, sections: Optional[str] = None) -> str:
+    """
+    Admin rule text; `sections` (see ADMRUL_SECTIONS) picks the body ("text") and/or
+    the addenda ("addenda"). By default the addenda are shown only when there is no body.
+    """
+    try:
+        selected = select_sections(sections, ADMRUL_SECTIONS)
+    except ValueError as e:
+        return f"Error: {e}"
     logger.info(f"Getting admin rule details for ID: {adm_id}")
-    data = client.get_admin_rule_detail(adm_id)
-    if 'AdmRulService' not in data: return "Error: Invalid response structure (Missing 'AdmRulService')"
+    _, data = _fetch_with_fallbacks('admrul', adm_id, [("ID", lambda: client.get_admin_rule_detail(adm_id))],
+                                    _has_root('AdmRulService'))
+    if data is None: return "Error: Invalid response structure (Missing 'AdmRulService')"
     root = data['AdmRulService']
     info = root.get('행정규칙기본정보', {})
     name = info.get('행정규칙명', 'Unknown')
@@ -268,57 +852,67 @@ def get_admin_rule_detail_internal(adm_id: str) -> str:
     
     content_acc = []
 
-    if '조문내용' in root:
-        content = root['조문내용']
-        if isinstance(content, str): content_acc.append(clean_html(content))
-        elif isinstance(content, list):
-             for c in content: content_acc.append(clean_html(str(c)))
-    
-    if not content_acc:
-        full_text = root.get('전문', '')
-        if full_text: content_acc.append(clean_html(full_text))
-            
-    if not content_acc:
+    if _wanted(selected, "text"):
+        if '조문내용' in root:
+            content = root['조문내용']
+            if isinstance(content, str): content_acc.append(clean_html(content))
+            elif isinstance(content, list):
+                 for c in content: content_acc.append(clean_html(str(c)))
+        
+        if not content_acc:
+            full_text = root.get('전문', '')
+            if full_text: content_acc.append(clean_html(full_text))
+
+        if content_acc and selected is None:
+            index_document('admrul', adm_id, name, "\n".join(content_acc), {'dept': dept})
+
+    if (selected is not None and "addenda" in selected) or (selected is None and not content_acc):
         buchik = root.get('부칙')
         if buchik: content_acc.append("\n[부칙]\n" + clean_html(str(buchik)))
-        else: content_acc.append("(No content found.)")
+
+    if not content_acc:
+        content_acc.append("(No content found.)")
         
     return f"# {name} ({dept})\n\n" + "\n".join(content_acc)
 
-def get_prec_const_detail_internal(detc_id: str) -> str:
+def get_prec_const_detail_internal(detc_id: str, sections: Optional[str] = None) -> str:
+    """
+    Constitutional Court decision text; `sections` (see CONST_SECTIONS) limits which
+    parts are cleaned and returned.
+    """
+    try:
+        selected = select_sections(sections, CONST_SECTIONS)
+    except ValueError as e:
+        return f"Error: {e}"
     logger.info(f"Getting const. decision details for ID: {detc_id}")
-    data = client.get_prec_const_detail(detc_id)
-    if 'DetcService' not in data: return "Error: Invalid response structure (Missing 'DetcService')"
-    info = data['DetcService']
+    _, data = _fetch_with_fallbacks('const', detc_id, [("ID", lambda: client.get_prec_const_detail(detc_id))],
+                                    _has_root('DetcService'))
+    if data is None: return "Error: Invalid response structure (Missing 'DetcService')"
+    return _format_const_decision(data['DetcService'], selected)
+
+def _format_const_decision(info: dict, selected: Optional[set]) -> str:
     title = info.get('사건명', 'Unknown')
     case_no = info.get('사건번호', 'Unknown')
     date = info.get('종국일자', 'Unknown')
     type_name = info.get('사건종류명', '')
-    holding = info.get('판시사항', '')
-    summary = info.get('결정요지', '') # Constitutional Court uses 결정요지
-    content = info.get('전문', '') # Constitutional Court uses 전문
     
+    # Constitutional Court uses 결정요지 and 전문 for the summary and full text
     output = [
         f"# {title}",
         f"**Case No:** {case_no}",
         f"**Type:** {type_name}",
         f"**Date:** {date}",
-        "",
-        "## 판시사항 (Holding)",
-        clean_html(holding),
-        "",
-        "## 결정요지 (Summary)",
-        clean_html(summary),
-        "",
-        "## 전문 (Full Text)",
-        clean_html(content)
     ]
+    for name, fields, heading in CONST_SECTIONS:
+        if _wanted(selected, name):
+            output += ["", f"## {heading}", clean_html(info.get(fields[0], ''))]
     return "\n".join(output)
 
 def get_autonomous_law_detail_internal(law_id: str) -> str:
     logger.info(f"Getting autonomous law details for ID: {law_id}")
-    data = client.get_autonomous_law_detail(law_id)
-    if 'LawService' not in data: return "Error: Invalid response structure (Missing 'LawService')"
+    _, data = _fetch_with_fallbacks('ordin', law_id, [("ID", lambda: client.get_autonomous_law_detail(law_id))],
+                                    _has_root('LawService'))
+    if data is None: return "Error: Invalid response structure (Missing 'LawService')"
     
     root = data['LawService']
     info = root.get('자치법규기본정보', {})
@@ -350,9 +944,10 @@ def get_autonomous_law_detail_internal(law_id: str) -> str:
 
 def get_legal_term_detail_internal(term_id: str) -> str:
     logger.info(f"Getting legal term details for ID: {term_id}")
-    data = client.get_legal_term_detail(term_id)
+    _, data = _fetch_with_fallbacks('term', term_id, [("ID", lambda: client.get_legal_term_detail(term_id))],
+                                    _has_root('LawTermService'))
     
-    if 'LawTermService' not in data: return "Error: Law Term not found."
+    if data is None: return "Error: Law Term not found."
     
     info = data['LawTermService']
     name = info.get('법령용어명', 'Unknown')
@@ -364,36 +959,35 @@ def get_legal_term_detail_internal(term_id: str) -> str:
     
     return f"# {name}\n\n**Source:** {source}\n**Ref:** {article_ref}\n\n## Definition\n{desc}"
 
-def get_statutory_interpretation_detail_internal(interp_id: str) -> str:
+def get_statutory_interpretation_detail_internal(interp_id: str, sections: Optional[str] = None) -> str:
+    """
+    Statutory interpretation text; `sections` (see INTERP_SECTIONS) limits which parts
+    are cleaned and returned, e.g. "question,answer" skips the reasoning.
+    """
+    try:
+        selected = select_sections(sections, INTERP_SECTIONS)
+    except ValueError as e:
+        return f"Error: {e}"
     logger.info(f"Getting interpretation details for ID: {interp_id}")
-    data = client.get_statutory_interpretation_detail(interp_id)
+    _, data = _fetch_with_fallbacks('interp', interp_id, [("ID", lambda: client.get_statutory_interpretation_detail(interp_id))],
+                                    _has_root('ExpcService'))
     
-    if 'ExpcService' not in data: return "Error: Interpretation not found."
+    if data is None: return "Error: Interpretation not found."
     
     info = data['ExpcService']
     title = info.get('안건명', 'Unknown')
     no = info.get('안건번호', '')
     date = info.get('회신일자', '')
     
-    # Content fields
-    question = info.get('질의요지', '')
-    answer = info.get('회답', '')
-    reason = info.get('이유', '')
-    
     output = [
         f"# {title}",
         f"**Case No:** {no}",
         f"**Date:** {date}",
-        "",
-        "## 질의요지 (Question)",
-        clean_html(question),
-        "",
-        "## 회답 (Answer)",
-        clean_html(answer),
-        "",
-        "## 이유 (Reasoning)",
-        clean_html(reason)
     ]
+    # Content fields
+    for name, fields, heading in INTERP_SECTIONS:
+        if _wanted(selected, name):
+            output += ["", f"## {heading}", clean_html(info.get(fields[0], ''))]
     
     return "\n".join(output)
 
@@ -406,16 +1000,16 @@ def get_law_history_internal(law_id: str, article_no: str = None) -> str:
     
     try:
         # Use the regular law detail API which contains revision info
-        data = client.get_law_detail(law_id)
+        law = load_law(law_id)
     except Exception as e:
         logger.error(f"Error fetching law detail: {e}")
         return f"Error: Failed to fetch law information. {e}"
     
-    if '법령' not in data:
+    if law is None:
         return "Error: Law not found."
     
-    law_info = data['법령']
-    basic_info = law_info.get('기본정보', {})
+    law_info = law.info
+    basic_info = law.basic_info
     
     law_name = basic_info.get('법령명_한글', 'Unknown')
     enforcement_date = basic_info.get('시행일자', '')
@@ -467,16 +1061,16 @@ def get_old_new_comparison_internal(law_id: str) -> str:
     
     # Use the regular law detail API to get amendment info
     try:
-        data = client.get_law_detail(law_id)
+        law = load_law(law_id)
     except Exception as e:
         logger.error(f"Error fetching law detail: {e}")
         return f"Error: Failed to fetch law information. {e}"
     
-    if '법령' not in data:
+    if law is None:
         return "Error: Law not found."
     
-    law_info = data['법령']
-    basic_info = law_info.get('기본정보', {})
+    law_info = law.info
+    basic_info = law.basic_info
     
     law_name = basic_info.get('법령명_한글', 'Unknown')
     enforcement_date = basic_info.get('시행일자', '')
@@ -514,228 +1108,319 @@ def get_old_new_comparison_internal(law_id: str) -> str:
     
     return "\n".join(output)
 
-def resolve_references(content: str, context_law_name: str = None, context_law_id: str = None) -> str:
+def law_references(law_id: str) -> Optional[ReferenceGraph]:
     """
-    Analyze legal text to resolve:
-    1. Internal References ("Article 5") - Uses context_law_id
-    2. External References ("Article 10 of Building Act")
-    3. Delegations ("Presidential Decree") - Finds linked Enforcement Decree
-    
+    The reference graph of a law: from the parsed law if it is cached, else from the
+    article store, else by loading the law (the graph is then saved to the store).
+    None if the law does not exist.
+    """
+    law_id = str(law_id)
+    store = get_default_store()
+    if law_cache.get(law_id) is None and store is not None:
+        edges = store.get_references(law_id)
+        if edges is not None:
+            return ReferenceGraph.from_edges(edges)
+    law = load_law(law_id)
+    if law is None:
+        return None
+    fresh = law._references is None
+    graph = law.references()
+    if fresh and store is not None:
+        try:
+            store.put_references(law_id, graph.pairs())
+        except Exception as e:
+            logger.warning(f"Could not store references of {law_id}: {e}")
+    return graph
+
+def _find_law_id(law_name: str) -> Optional[str]:
+    """
+    Current MST of the law with this name, through the shared name cache.
+    """
+    try:
+        found = law_names.resolve(law_name)
+    except Exception as e:
+        logger.error(f"External ref search error for {law_name}: {e}")
+        return None
+    return found[0] if found else None
+
+def _reference_label(law_name: Optional[str], key: tuple[int, int]) -> str:
+    label = f"제{key[0]}조의{key[1]}" if key[1] else f"제{key[0]}조"
+    return f"{law_name} {label}" if law_name else label
+
+def resolve_references(content: str, context_law_name: str = None, context_law_id: str = None,
+                       article_no: str = None, budget: int = REFERENCE_BUDGET,
+                       timeout: float = REFERENCE_TIMEOUT) -> str:
+    """
+    Append the text of articles referred to by:
+    1. Internal References ("제5조", "이 법 제5조") - in the law context_law_id
+    2. External References ("건축법 제10조", "「...법률」 제3조", "같은 법 제2조")
+
+    With context_law_id and article_no, the references come from the law's precomputed
+    reference graph (no rescan of the text). With context_law_id alone the content is the
+    whole law, so only its external references are resolved. Otherwise the content is scanned.
+
+    References are fetched concurrently on a bounded pool but reported in order of
+    mention, until `budget` characters are used or `timeout` seconds have passed;
+    a note lists whatever was left out.
+
     Args:
         content: The text to analyze
         context_law_name: Name of the law the content belongs to (e.g. "Higher Education Act")
         context_law_id: ID of the law
+        article_no: The article the content is, within context_law_id
+        budget: Maximum characters of referenced text to append
+        timeout: Seconds to spend fetching referenced articles
     """
     logger.info(f"Resolving references (Context: {context_law_name})...")
-    output = []
-    
-    # --- 1. explicit External References (XX Act Article YY) ---
-    ext_pattern = r'([가-힣]+법)\s*제(\d+)조'
-    ext_matches = list(set(re.findall(ext_pattern, content)))
-    
-    # --- 2. Internal References (Article YY) ---
-    # Look for "Article YY" NOT preceded by a law name
-    # We use a negative lookbehind or just simple parsing if we strictly exclude the external ones
-    # Simplified regex: "제\d+조"
-    int_pattern = r'(?<![가-힣])제(\d+)조' 
-    int_matches = []
-    if context_law_id:
-        raw_int_matches = re.findall(int_pattern, content)
-        # Filter out those that were part of external matches
-        # This is a heuristic. Ideally we'd tokenize. 
-        # For now, let's just collect them.
-        for art_no in raw_int_matches:
-            # Check if this "Article X" was captured as "Act Article X"
-            is_external = False
-            for ext_law, ext_art in ext_matches:
-                 if ext_art == art_no and f"{ext_law} 제{ext_art}조" in content:
-                     # This check is weak but acceptable for MVP
-                     pass
-            int_matches.append(art_no)
-        int_matches = list(set(int_matches))
-
-    # --- 3. Gather Content ---
-    
-    resolved_count = 0
-    max_refs = 5
-    
-    # Resolve Internal
-    for art_no in int_matches:
-        if resolved_count >= max_refs: break
-        # Avoid recursion if resolving the article itself
-        # (Caller handles this, but good to be safe)
-        if f"제{art_no}조" in content.split('\n')[0]: continue
-        
-        try:
-            art_text = get_statute_article_internal(context_law_id, art_no)
-            if "not found" not in art_text and "Error" not in art_text:
-                output.append(f"### [Internal] Je{art_no}jo\n{art_text}")
-                resolved_count += 1
-        except Exception as e:
-            logger.error(f"Internal ref error: {e}")
+    graph = law_references(context_law_id) if context_law_id else None
+    if graph is not None:
+        key = normalize_article_no(article_no) if article_no else None
+        refs = list(graph.targets(key)) if key else graph.external()
+    else:
+        # Unqualified references mean nothing without the law they belong to
+        refs = [ref for ref in extract_references(content, context_law_name) if ref[0] is not None]
+    if not refs:
+        return ""
 
-    # Resolve External
-    for law_name, art_no in ext_matches:
-        if resolved_count >= max_refs: break
-        if context_law_name and law_name in context_law_name: continue # Skip self-reference if name matches
-        
-        try:
-            # Search for law ID
-            search_res = client.search_law(law_name)
-            if 'LawSearch' in search_res and 'law' in search_res['LawSearch']:
-                 items = search_res['LawSearch']['law']
-                 if not isinstance(items, list): items = [items]
-                 target_law = items[0] # Best guess
-                 
-                 ext_id = target_law.get('법령일련번호')
-                 art_text = get_statute_article_internal(ext_id, art_no)
-                 output.append(f"### [External] {law_name} Article {art_no}\n{art_text}")
-                 resolved_count += 1
-        except Exception as e:
-             logger.error(f"External ref error: {e}")
+    def fetch(law_name, key):
+        ref_no = f"{key[0]}-{key[1]}" if key[1] else str(key[0])
+        if law_name is None:
+            return find_article(context_law_id, ref_no)
+        target_id = _find_law_id(law_name)
+        return find_article(target_id, ref_no) if target_id else (None, None)
 
+    # The pool runs references in submission order, so stopping early leaves only
+    # the few already in flight behind; they finish in the background and warm the caches.
+    futures = [_reference_pool.submit(fetch, law_name, key) for law_name, key in refs]
+    deadline = time.monotonic() + timeout
+    output = []
+    used = 0
+    stopped = None
+    skipped = []
+    for (law_name, key), future in zip(refs, futures):
+        if stopped is None and used >= budget:
+            stopped = f"character budget of {budget} reached"
+        if stopped is None:
+            try:
+                name, art = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except concurrent.futures.TimeoutError:
+                stopped = f"time budget of {timeout:g}s reached"
+            except Exception as e:
+                logger.error(f"Reference error for {_reference_label(law_name or context_law_name, key)}: {e}")
+                continue
+        if stopped is not None:
+            future.cancel()
+            skipped.append(_reference_label(law_name, key))
+            continue
+        if art is None:
+            continue
+        heading = f"### [External] {_reference_label(law_name, key)}" if law_name else f"### [Internal] {_reference_label(None, key)}"
+        text = f"# {name} {art.label}\n\n" + art.full_text
+        output.append(f"{heading}\n{text}")
+        used += len(text)
+
+    if skipped:
+        logger.info(f"Reference resolution stopped ({stopped}); {len(skipped)} left unresolved")
+        output.append(f"_({len(skipped)} more referenced articles not included, {stopped}: {', '.join(skipped)})_")
     if not output:
         return ""
         
     final_output = ["## Referenced Articles"] + output
     return "\n\n".join(final_output)
 
+# Words by which an act delegates details to a decree, rule or notice
+_DELEGATION_WORDS = re.compile(r'대통령령|총리령|부령|국회규칙|대법원규칙|고시')
+
+def _render_citations(heading: str, matches: list) -> list[str]:
+    output = [heading]
+    for m, provision in matches:
+        output.append(f"### Article {m.no} ({m.title}) — {provision}")
+        output.append(m.full_text)
+    return output
+
 def resolve_delegation(content: str, context_law_name: str, context_law_id: str, current_article_no: str) -> str:
     """
-    If content mentions "Presidential Decree" (대통령령), find the corresponding Enforcement Decree article.
+    If content delegates to a "Presidential Decree" (대통령령) or a ministerial rule (부령),
+    find the implementing articles down the act's family.
     Strategy:
-    1. Identify target decree name: "X Act" -> "X Act Enforcement Decree"
-    2. Search/Fetch that Decree.
-    3. Look for articles in that Decree that reference "Act Article {current_article_no}"
-       (e.g. "Pursuant to Article 20 of the Act")
+    1. Look up the act's family (시행령 / 시행규칙 / 행정규칙) in law_families, which is
+       learned from search listings and refreshed only when stale.
+    2. Load the decree and the rule concurrently.
+    3. Look up the articles in the decree that reference "Act Article {current_article_no}"
+       (e.g. "Pursuant to Article 20 of the Act") in its cached delegation index, then the
+       rule articles citing that act article or those decree articles ("영 제X조").
+    4. List the act's related admin rules.
     """
-    if "대통령령" not in content and "국회규칙" not in content and "대법원규칙" not in content:
+    if not context_law_name or not _DELEGATION_WORDS.search(content):
         return ""
         
     logger.info(f"Checking delegations for {context_law_name} Art {current_article_no}")
-    
-    # 1. Guess Decree Name
-    # Usually: Law Name + " 시행령" (Enforcement Decree)
-    # Caution: Some laws just change "Act" to "Act Enforcement Decree"
-    # But appending " 시행령" is safe for search smarts usually
-    target_decree_name = context_law_name + " 시행령"
-    
-    # 2. Find Decree ID
-    deg_id = None
+    key = normalize_article_no(current_article_no)
     try:
-        data = client.search_law(target_decree_name)
-        if 'LawSearch' in data and 'law' in data['LawSearch']:
-            items = data['LawSearch']['law']
-            if not isinstance(items, list): items = [items]
-            # Precise match preferred
-            for item in items:
-                if item.get('법령명한글', '').replace(' ', '') == target_decree_name.replace(' ', ''):
-                    deg_id = item.get('법령일련번호')
-                    break
-            if not deg_id and items: deg_id = items[0].get('법령일련번호')
+        family = law_families.get(context_law_name)
     except Exception as e:
         logger.error(f"Delegation search error: {e}")
         return ""
-        
-    if not deg_id: return ""
-    
-    # 3. Scan Decree for Back-References
-    # "법 제X조" where X is current_article_no
-    target_ref_pattern = f"법 제{current_article_no}조"
-    
-    # We fetch ALL articles of the decree to scan them. 
-    # This might be heavy if decree is huge, but necessary for accurate linking.
-    decree_detail = client.get_law_detail(deg_id)
-    if '법령' not in decree_detail: return ""
-    
-    decree_info = decree_detail['법령']
-    real_decree_name = decree_info.get('기본정보', {}).get('법령명_한글', target_decree_name)
-    parsed = _parse_articles(decree_info)
-    
-    matches = []
-    for art in parsed:
-        if target_ref_pattern in art['full_text']:
-            matches.append(art)
-            
-    if not matches:
-        return f"\n\n## Delegated Legislation ({real_decree_name})\n(No specific article found referencing Act Article {current_article_no}.)"
-        
-    output = [f"\n\n## Delegated Legislation ({real_decree_name})"]
-    for m in matches:
-        output.append(f"### Article {m['no']} ({m['title']})")
-        output.append(m['full_text'])
-    
+    levels = [family.decree, family.rule]
+    if not any(levels) and not family.admin_rules:
+        return ""
+
+    # Decree and rule are independent downloads
+    decree, rule = _delegation_pool.map(lambda law: load_law(law[0]) if law else None, levels)
+
+    output = []
+    decree_matches = decree.delegations().citing(key) if decree is not None and key else []
+    if decree is not None:
+        decree_name = decree.basic_info.get('법령명_한글', family.decree[1])
+        if decree_matches:
+            output.extend(_render_citations(f"\n\n## Delegated Legislation ({decree_name})", decree_matches))
+        else:
+            output.append(f"\n\n## Delegated Legislation ({decree_name})\n(No specific article found referencing Act Article {current_article_no}.)")
+
+    if rule is not None and key:
+        rule_matches = list(rule.delegations().citing(key))
+        by_decree = rule.delegations("영")
+        for art, _ in decree_matches:
+            if art.key is not None:
+                rule_matches.extend(by_decree.citing(art.key))
+        seen = set()
+        unique = []
+        for art, provision in rule_matches:
+            if id(art) not in seen:
+                seen.add(id(art))
+                unique.append((art, provision))
+        if unique:
+            rule_name = rule.basic_info.get('법령명_한글', family.rule[1])
+            output.extend(_render_citations(f"\n## Delegated Legislation ({rule_name})", unique))
+
+    if family.admin_rules:
+        output.append("\n## Related Administrative Rules (행정규칙)")
+        output.extend(f"- ID: admrul:{rule_id} | Name: {name}" for rule_id, name in family.admin_rules)
+
     return "\n".join(output)
 
-def search_integrated_internal(query: str) -> str:
-    logger.info(f"Integrated search for: {query}")
-    results = {}
-    def search_target(target, label):
-        try:
-            res = client.search_law(query, target=target)
-            return label, res
-        except Exception as e:
-            logger.error(f"Error searching {label}: {e}")
-            return label, None
+# (search target, label, heading, corpus kind)
+_INTEGRATED_CATEGORIES = [
+    ("law", "Statutes", "## 1. Statutes (법령)", "statute"),
+    ("prec", "Precedents", "## 2. Precedents (판례)", "prec"),
+    ("admrul", "AdminRules", "## 3. Administrative Rules (행정규칙)", "admrul"),
+]
 
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        futures = [
-            executor.submit(search_target, "law", "Statutes"),
-            executor.submit(search_target, "prec", "Precedents"),
-            executor.submit(search_target, "admrul", "AdminRules")
-        ]
-        for future in concurrent.futures.as_completed(futures):
-            label, res = future.result()
-            results[label] = res
-            
-    output = [f"# Integrated Search Results for '{query}'\n"]
-    
-    statutes = results.get("Statutes", {})
-    output.append("## 1. Statutes (법령)")
-    if statutes and 'LawSearch' in statutes and 'law' in statutes['LawSearch']:
-        items = statutes['LawSearch']['law']
+def _render_live_results(label: str, res) -> list[str]:
+    lines = []
+    if label == "Statutes" and res and 'LawSearch' in res and 'law' in res['LawSearch']:
+        items = res['LawSearch']['law']
         if not isinstance(items, list): items = [items]
         for item in items[:3]:
             name = item.get('법령명한글', '')
             id = item.get('법령일련번호', '')
             date = item.get('시행일자', '')
-            output.append(f"- **{name}** (Date: {date}) [ID: statute:{id}]")
-    else: output.append("(No results)")
-    output.append("")
-        
-    precs = results.get("Precedents", {})
-    output.append("## 2. Precedents (판례)")
-    if precs and 'PrecSearch' in precs and 'prec' in precs['PrecSearch']:
-        items = precs['PrecSearch']['prec']
+            lines.append(f"- **{name}** (Date: {date}) [ID: statute:{id}]")
+    elif label == "Precedents" and res and 'PrecSearch' in res and 'prec' in res['PrecSearch']:
+        items = res['PrecSearch']['prec']
         if not isinstance(items, list): items = [items]
         for item in items[:3]:
             name = item.get('사건명', '')
             case_no = item.get('사건번호', '')
             id = item.get('판례일련번호', '')
-            output.append(f"- **{case_no} {name}** [ID: prec:{id}]")
-    else: output.append("(No results)")
-    output.append("")
-
-    rules = results.get("AdminRules", {})
-    output.append("## 3. Administrative Rules (행정규칙)")
-    if rules and 'AdmRulSearch' in rules and 'admrul' in rules['AdmRulSearch']:
-        items = rules['AdmRulSearch']['admrul']
+            lines.append(f"- **{case_no} {name}** [ID: prec:{id}]")
+    elif label == "AdminRules" and res and 'AdmRulSearch' in res and 'admrul' in res['AdmRulSearch']:
+        items = res['AdmRulSearch']['admrul']
         if not isinstance(items, list): items = [items]
         for item in items[:3]:
             name = item.get('행정규칙명', '')
             id = item.get('행정규칙일련번호', '')
             dept = item.get('소관부처명', '')
-            output.append(f"- **{name}** ({dept}) [ID: admrul:{id}]")
-    else: output.append("(No results)")
-    return "\n".join(output)
+            lines.append(f"- **{name}** ({dept}) [ID: admrul:{id}]")
+    return lines
 
-def smart_search_statute_internal(query: str) -> str:
-    # Logic from previous smart_search_statute
-    logger.info(f"Smart searching for: {query}")
+def _render_local_results(hits: list[dict]) -> list[str]:
+    lines = []
+    for hit in hits:
+        meta = hit['meta']
+        kind, doc_id, title = hit['kind'], hit['doc_id'], hit['title']
+        if kind == 'statute':
+            lines.append(f"- **{title}** (Date: {meta.get('date', '')}) [ID: statute:{doc_id}]")
+        elif kind == 'prec':
+            lines.append(f"- **{meta.get('case_no', '')} {title}** [ID: prec:{doc_id}]")
+        else:
+            lines.append(f"- **{title}** ({meta.get('dept', '')}) [ID: admrul:{doc_id}]")
+        if hit['snippet']:
+            lines.append(f"  > {' '.join(hit['snippet'].split())}")
+    return lines
+
+def _names_query(kind: str, query: str, hits: list[dict]) -> bool:
+    """
+    True if a local hit is what the query names rather than a document that merely
+    mentions it: a statute titled exactly the query ("근로기준법", not its 시행령 or a law
+    citing it), or a precedent / admin rule whose title contains the whole query.
+    """
+    wanted = query.replace(' ', '')
+    if not wanted:
+        return False
+    titles = [(hit['title'] or '').replace(' ', '') for hit in hits]
+    if kind == 'statute':
+        return wanted in titles
+    return any(wanted in title for title in titles)
+
+def search_integrated_internal(query: str, fresh: bool = False) -> str:
+    """
+    Top 3 statutes / precedents / admin rules for a keyword query.
+    Each category is answered from the local corpus (documents fetched earlier) when it
+    has at least CORPUS_MIN_HITS ranked hits and either the corpus covers the whole
+    category (after a mirror sync) or a hit is named by the query (see _names_query);
+    otherwise, or when fresh=True, from the live API.
+    """
+    logger.info(f"Integrated search for: {query}")
+    corpus = None if fresh else get_default_corpus()
+    local = {}
+    if corpus is not None:
+        for _, label, _, kind in _INTEGRATED_CATEGORIES:
+            hits = corpus.search(query, kind=kind, limit=3)
+            if len(hits) >= CORPUS_MIN_HITS and (corpus.covers(kind) or _names_query(kind, query, hits)):
+                local[label] = hits
+
+    results = {}
+    def search_target(target, label):
+        try:
+            res = client.search_law(query, target=target)
+            if target == "law":
+                laws = (res.get('LawSearch') or {}).get('law') or []
+                observe_law_listing(laws if isinstance(laws, list) else [laws])
+            return label, res
+        except Exception as e:
+            logger.error(f"Error searching {label}: {e}")
+            return label, None
+
+    live = [(target, label) for target, label, _, _ in _INTEGRATED_CATEGORIES if label not in local]
+    if live:
+        # One worker per target; all share the client's pooled keep-alive session.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(live)) as executor:
+            futures = [executor.submit(search_target, target, label) for target, label in live]
+            for future in concurrent.futures.as_completed(futures):
+                label, res = future.result()
+                results[label] = res
+            
+    output = [f"# Integrated Search Results for '{query}'\n"]
+    for _, label, heading, _ in _INTEGRATED_CATEGORIES:
+        if label in local:
+            output.append(heading + " (local index)")
+            lines = _render_local_results(local[label])
+        else:
+            output.append(heading)
+            lines = _render_live_results(label, results.get(label))
+        output.extend(lines or ["(No results)"])
+        output.append("")
+    return "\n".join(output).rstrip("\n")
+
+def _plan_smart_search(query: str) -> tuple[str, Optional[str]]:
+    """
+    Split a smart-search query into (law name query, article number or None).
+    """
     article_no = None
     
-    # 1. Pattern: "제103조" or "제 103 조"
-    kr_match = re.search(r'제\s*(\d+(?:의\d+)?)', query)
+    # 1. Pattern: "제103조" or "제 103 조", including branch articles ("제20조의2")
+    kr_match = re.search(r'제\s*(\d+)\s*조?\s*(?:의\s*(\d+))?', query)
     
     # 2. Pattern: "Article 103"
     en_match = re.search(r'(?:Article|Art\.?)\s*(\d+(?:-\d+)?)', query, re.IGNORECASE)
@@ -746,10 +1431,9 @@ def smart_search_statute_internal(query: str) -> str:
     relaxed_match = re.search(r'(?:\s|^)(\d+(?:-\d+)?)(?:\s|$)', query)
 
     if kr_match:
-        article_no = kr_match.group(1)
-        clean_query = re.sub(r'제\s*(\d+(?:의\d+)?)', '', query).strip()
-        # Remove trailing '조' if valid
-        clean_query = clean_query.replace('조', '').strip()
+        article_no = f"{kr_match.group(1)}의{kr_match.group(2)}" if kr_match.group(2) else kr_match.group(1)
+        # The match already consumed '조', so law names containing 조 (조세특례제한법) survive
+        clean_query = (query[:kr_match.start()] + query[kr_match.end():]).strip()
     elif en_match:
         article_no = en_match.group(1)
         clean_query = re.sub(r'(?:Article|Art\.?)\s*(\d+(?:-\d+)?)', '', query, flags=re.IGNORECASE).strip()
@@ -765,60 +1449,49 @@ def smart_search_statute_internal(query: str) -> str:
         clean_query = query
             
     clean_query = re.sub(r'\bof\b', '', clean_query, flags=re.IGNORECASE).strip()
-    data = client.search_law(clean_query)
-    if 'LawSearch' not in data or 'law' not in data['LawSearch']:
-        return f"No laws found for query: '{clean_query}'"
-    items = data['LawSearch']['law']
-    if not isinstance(items, list): items = [items]
-    
-    best_match = None
-    exact_matches = [i for i in items if i.get('법령명한글', '').replace(' ', '') == clean_query.replace(' ', '')]
-    statute_matches = [i for i in items if i.get('법령구분명') == '법률']
-    
-    if exact_matches:
-        best_match = exact_matches[0]
-        for m in exact_matches:
-            if m.get('현행연혁코드') == '현행':
-                best_match = m
-                break
-    elif statute_matches: best_match = statute_matches[0]
-    else: best_match = items[0]
-        
-    law_name = best_match.get('법령명한글', 'Unknown')
-    law_id = best_match.get('법령일련번호')
-    if not law_id: return "Error: Selected law has no ID."
+    return clean_query, article_no
+
+def smart_search_statute_internal(query: str) -> str:
+    # Logic from previous smart_search_statute
+    logger.info(f"Smart searching for: {query}")
+    # A repeated query ("민법 제103조") skips parsing and the law search entirely
+    plan_key = query.strip()
+    plan = _smart_plans.get(plan_key)
+    if plan is None:
+        clean_query, article_no = _plan_smart_search(query)
+        found = law_names.resolve(clean_query)
+        if found is None:
+            return f"No laws found for query: '{clean_query}'"
+        plan = (found[0], found[1], article_no)
+        _smart_plans.put(plan_key, plan, 256, NAME_TTL)
+    law_id, law_name, article_no = plan
     
     logger.info(f"Selected law: {law_name} ({law_id})")
-    detail_data = client.get_law_detail(law_id)
-    if '법령' not in detail_data: return "Error: Could not retrieve law details."
-    law_info = detail_data['법령']
-    parsed_articles = _parse_articles(law_info)
     
     if article_no:
-        # Priority Search for Content
-        for art in parsed_articles:
-            if art['no'] == article_no and art.get('type') == '조문':
-                return f"# {law_name} 제{article_no}조\n\n{art['full_text']}"
-        
-        # Fallback to any match
-        for art in parsed_articles:
-             if art['no'] == article_no:
-                return f"# {law_name} 제{article_no}조\n\n{art['full_text']}"
+        # Content article first, header as fallback; stops reading the law once found
+        name, art = find_article(law_id, article_no)
+        if name is None: return "Error: Could not retrieve law details."
+        if art is not None:
+            return f"# {law_name} {art.label}\n\n{art.full_text}"
                 
         return f"Article {article_no} not found in {law_name}."
     else:
+        law = load_law(law_id)
+        if law is None: return "Error: Could not retrieve law details."
+        parsed_articles = law.articles
         output = [f"# {law_name}"]
-        enforce_date = law_info.get('기본정보', {}).get('시행일자', '')
+        enforce_date = law.basic_info.get('시행일자', '')
         output.append(f"Enforcement Date: {enforce_date}")
         output.append("")
         output.append("## Table of Contents (First 30 Articles)")
         last_no = None
         count = 0
         for art in parsed_articles:
-            if art['no'] == last_no and not art['title']: continue
-            display_title = art['title'] if art['title'] else "(No Title)"
-            output.append(f"- 제{art['no']}조: {display_title}")
-            last_no = art['no']
+            if art.key == last_no and not art.title: continue
+            display_title = art.title if art.title else "(No Title)"
+            output.append(f"- {art.label}: {display_title}")
+            last_no = art.key
             count += 1
             if count >= 30:
                 output.append(f"... and {len(parsed_articles) - 30} more articles.")
@@ -0,0 +1,87 @@
+import concurrent.futures
+import logging
+import os
+import threading
+import time
+from typing import List, Optional
+
+from .hotset import hot_laws
+from .utils import law_names, law_families, load_law, law_references
+
+logger = logging.getLogger("korean-law-mcp")
+
+# Background warm-up at server start (override via environment)
+WARMUP_ENABLED = os.getenv("KOREAN_LAW_WARMUP", "1").lower() not in ("0", "false", "off", "no")
+# Laws warmed when there is no hot set from an earlier run yet
+WARMUP_LAWS = [name.strip() for name in os.getenv(
+    "KOREAN_LAW_WARMUP_LAWS", "대한민국헌법,민법,형법,상법,민사소송법,형사소송법,행정절차법,근로기준법"
+).split(",") if name.strip()]
+# How many of last run's most-read laws to warm
+WARMUP_TOP = int(os.getenv("KOREAN_LAW_WARMUP_TOP", "20"))
+WARMUP_WORKERS = int(os.getenv("KOREAN_LAW_WARMUP_WORKERS", "2"))
+
+def warmup_names() -> List[str]:
+    """
+    Last run's hot laws, topped up from the configured list.
+    """
+    names = hot_laws.top(WARMUP_TOP)
+    for name in WARMUP_LAWS:
+        if len(names) >= WARMUP_TOP:
+            break
+        if name not in names:
+            names.append(name)
+    return names
+
+def warm_law(name: str) -> bool:
+    """
+    Load a law with its article indexes, reference graph and decree/rule links.
+    Returns False if the name does not resolve.
+    """
+    found = law_names.resolve(name)
+    if found is None:
+        return False
+    law = load_law(found[0])
+    if law is None:
+        return False
+    law.search_index()
+    law_references(law.law_id)
+    family = law_families.get(law.name)
+    for member in (family.decree, family.rule):
+        if member is None:
+            continue
+        implementing = load_law(member[0])
+        if implementing is not None:
+            implementing.delegations()
+            implementing.delegations("영")
+    return True
+
+def warm_up(names: Optional[List[str]] = None, workers: int = WARMUP_WORKERS) -> int:
+    """
+    Warm the given laws (default: warmup_names()) on a small pool; returns how many loaded.
+    Failures are logged and skipped.
+    """
+    names = warmup_names() if names is None else names
+    if not names:
+        return 0
+    started = time.monotonic()
+    warmed = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="law-warmup") as executor:
+        futures = {executor.submit(warm_law, name): name for name in names}
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                warmed += bool(future.result())
+            except Exception as e:
+                logger.warning(f"Warm-up of {futures[future]} failed: {e}")
+    logger.info(f"Warm-up loaded {warmed}/{len(names)} laws in {time.monotonic() - started:.1f}s")
+    return warmed
+
+def start_warmup() -> Optional[threading.Thread]:
+    """
+    Run warm_up() on a daemon thread so the server starts accepting requests at once.
+    Disabled with KOREAN_LAW_WARMUP=0.
+    """
+    if not WARMUP_ENABLED:
+        return None
+    thread = threading.Thread(target=warm_up, name="law-warmup", daemon=True)
+    thread.start()
+    return thread
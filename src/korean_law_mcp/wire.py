@@ -0,0 +1,48 @@
+import json
+import os
+from typing import Any, Dict
+import xmltodict
+
+# Fastest available JSON decoder; orjson is optional (pip install orjson)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    JSON_DECODER = "orjson"
+except ImportError:
+    _json_loads = json.loads
+    JSON_DECODER = "json"
+
+FORMATS = ("XML", "JSON")
+# Wire format requested from the DRF API (`type=` parameter), override via environment
+WIRE_FORMAT = os.getenv("KOREAN_LAW_FORMAT", "XML").upper()
+if WIRE_FORMAT not in FORMATS:
+    WIRE_FORMAT = "XML"
+
+def normalize_json(value: Any) -> Any:
+    """
+    Reshape a decoded DRF JSON document into what xmltodict produces for the XML
+    version, so callers never need to know which format was on the wire:
+    - scalars become stripped strings, and empty strings become None
+    - a one-element list becomes the element itself (xmltodict only makes lists
+      for repeated tags; callers already handle both via isinstance(items, list))
+    - an empty list becomes None
+    """
+    if isinstance(value, dict):
+        return {k: normalize_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        items = [normalize_json(v) for v in value]
+        if not items:
+            return None
+        return items[0] if len(items) == 1 else items
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+def decode(body: bytes, fmt: str = "XML") -> Dict[str, Any]:
+    """
+    Decode a DRF response body in the given wire format into the xmltodict shape.
+    """
+    if fmt == "JSON":
+        return normalize_json(_json_loads(body))
+    return xmltodict.parse(body)
@@ -0,0 +1,105 @@
+import os
+import sys
+import tempfile
+import unittest
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from korean_law_mcp.article_store import ArticleStore
+
+CIVIL_ACT = [
+    ((1, 0), ("1", "", "제1장 통칙", "전문", "")),
+    ((1, 0), ("1", "법원", "제1조(법원) 민사에 관하여 법률에 규정이 없으면 관습법에 의하고", "조문", "")),
+    ((20, 2), ("20", "가지", "제20조의2(가지) 가지조문 본문", "조문", "2")),
+    (None, ("부칙", "", "부칙 본문", "조문", "")),
+]
+
+class TestArticleStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = ArticleStore(self.tmp.name)
+        self.assertTrue(self.store.put_law("1001", "민법", CIVIL_ACT))
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_get_prefers_content_article(self):
+        name, row = self.store.get("1001", (1, 0))
+        self.assertEqual(name, "민법")
+        self.assertEqual(row, CIVIL_ACT[1][1])
+        self.assertEqual(self.store.get("1001", (20, 2))[1][2], "제20조의2(가지) 가지조문 본문")
+        self.assertEqual(self.store.get("1001", (99, 0)), ("민법", None))
+        self.assertEqual(self.store.get("9999", (1, 0)), (None, None))
+
+    def test_law_text_is_one_contiguous_block(self):
+        name, text = self.store.law_text("1001")
+        self.assertEqual(name, "민법")
+        self.assertEqual(text, "\n".join(row[2] for _, row in CIVIL_ACT))
+        self.assertEqual(list(self.store.articles("1001")), [row for _, row in CIVIL_ACT])
+
+    def test_laws_are_written_once(self):
+        self.assertFalse(self.store.put_law("1001", "민법", []))
+        self.assertEqual(self.store.stats()["laws"], 1)
+
+    def test_second_reader_sees_appended_laws(self):
+        """A store opened on the same files (e.g. in another process) remaps as the file grows"""
+        other = ArticleStore(self.tmp.name)
+        try:
+            self.assertEqual(other.law_text("1001")[0], "민법")
+            self.store.put_law("1002", "형법", [((250, 0), ("250", "살인", "제250조(살인) 사람을 살해한 자는", "조문", ""))])
+            self.assertEqual(other.get("1002", (250, 0))[1][1], "살인")
+            self.assertEqual(self.store.put_law("1003", "빈 법", []), True)
+            self.assertEqual(other.law_text("1003"), ("빈 법", ""))
+        finally:
+            other.close()
+
+def law(name, size):
+    return [((1, 0), ("1", "목적", f"제1조(목적) {name} " + "가" * size, "조문", ""))]
+
+class TestArticleStoreLimit(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = ArticleStore(self.tmp.name, max_bytes=30000)
+        # Small segments so a test can fill and compact several
+        self.store.segment_bytes = 10000
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_newer_version_drops_the_superseded_one(self):
+        self.store.put_law("2001", "건축법", law("건축법", 10), version="20200101:000000002001")
+        self.store.put_references("2001", [((1, 0), (None, (2, 0)))])
+        self.store.put_law("2002", "건축법", law("건축법", 20), version="20240101:000000002002")
+        self.assertIsNone(self.store.law_name("2001"))
+        self.assertIsNone(self.store.get_references("2001"))
+        self.assertEqual(self.store.law_name("2002"), "건축법")
+        # An older version stored later does not remove the newer one
+        self.store.put_law("2000", "건축법", law("건축법", 5), version="20100101:000000002000")
+        self.assertEqual(self.store.law_name("2002"), "건축법")
+
+    def test_size_cap_evicts_least_recently_read_and_compacts(self):
+        # Each law is ~3KB of UTF-8 text; 30 of them are three times the limit
+        for i in range(30):
+            self.store.put_law(str(3000 + i), f"법{i}", law(f"법{i}", 1000))
+            # Keep the first law in use so it survives eviction
+            self.assertEqual(self.store.get("3000", (1, 0))[0], "법0")
+        stats = self.store.stats()
+        self.assertLessEqual(stats["live_bytes"], 30000)
+        self.assertLessEqual(stats["bytes"], 30000 + 2 * self.store.segment_bytes)
+        self.assertGreater(stats["evicted"], 0)
+        self.assertGreater(stats["compactions"], 0)
+        self.assertIsNone(self.store.law_name("3001"))
+        # Laws moved by compaction still read back whole, here and in a second reader
+        other = ArticleStore(self.tmp.name, max_bytes=30000)
+        try:
+            for reader in (self.store, other):
+                self.assertEqual(reader.law_text("3000")[1], law("법0", 1000)[0][1][2])
+                self.assertEqual(reader.law_text("3029")[1], law("법29", 1000)[0][1][2])
+        finally:
+            other.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import threading
+import unittest
+import sys
+import os
+from unittest import mock
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from korean_law_mcp import utils
+from korean_law_mcp.cache import LRUCache
+from korean_law_mcp.utils import ParsedLaw, normalize_article_no, _parse_article_item
+
+def unit(no, kind='조문', branch=None, title=None, content=None):
+    item = {'조문번호': no, '조문여부': kind, '조문제목': title, '조문내용': content or f"제{no}조 본문"}
+    if branch:
+        item['조문가지번호'] = branch
+    return item
+
+class TestArticleIndex(unittest.TestCase):
+    def test_normalize_article_no(self):
+        """Every spelling of a branch article maps to the same key"""
+        for spelling in ("20-2", "20의2", "제20조의2", "제 20 조의 2", "20_2"):
+            self.assertEqual(normalize_article_no(spelling), (20, 2), spelling)
+        self.assertEqual(normalize_article_no("20"), (20, 0))
+        self.assertEqual(normalize_article_no("제20조"), (20, 0))
+        self.assertIsNone(normalize_article_no("abc"))
+
+    def test_lookup_prefers_content_over_header(self):
+        """The index returns the content article, falling back to the header"""
+        articles = [
+            _parse_article_item(unit('1', kind='전문', content='제1장 총칙')),
+            _parse_article_item(unit('1', title='목적')),
+            _parse_article_item(unit('20', title='정의')),
+            _parse_article_item(unit('20', branch='2', title='특례', content='제20조의2(특례) 가지 본문')),
+            _parse_article_item(unit('30', kind='전문', content='제2장 보칙')),
+        ]
+        law = ParsedLaw("1", {'법령명_한글': '테스트법'}, {}, articles)
+
+        self.assertEqual(law.lookup("1").title, '목적')
+        self.assertEqual(law.lookup("20").title, '정의')
+        self.assertEqual(law.lookup("20의2").title, '특례')
+        self.assertEqual(law.lookup("20-2").label, '제20조의2')
+        self.assertEqual(law.lookup("30").kind, '전문')
+        self.assertIsNone(law.lookup("99"))
+        self.assertIsNone(law.lookup("abc"))
+
+    def test_branch_header_not_duplicated(self):
+        """Content that already starts with 제N조의M(...) is not prefixed again"""
+        art = _parse_article_item(unit('20', branch='2', title='특례', content='제20조의2(특례) 가지 본문'))
+        self.assertEqual(art.full_text, '제20조의2(특례) 가지 본문')
+
+class TestLazyBuilders(unittest.TestCase):
+    def setUp(self):
+        articles = [_parse_article_item(unit(str(i), content=f"제{i}조 법 제{i + 1}조에 따른 권리")) for i in range(1, 50)]
+        self.law = ParsedLaw("lazy-test", {'법령명_한글': '지연법'}, {}, articles)
+        self.cache = LRUCache(max_bytes=10 ** 9)
+        patch = mock.patch.object(utils, "law_cache", self.cache)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_concurrent_first_calls_build_once(self):
+        self.cache.put(self.law.law_id, self.law, self.law.size)
+        base = self.law.size
+        barrier = threading.Barrier(8)
+        built = []
+
+        def read():
+            barrier.wait()
+            built.append((self.law.search_index(), self.law.references(), self.law.delegations()))
+        threads = [threading.Thread(target=read) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len({tuple(map(id, b)) for b in built}), 1)
+        index, graph, delegations = built[0]
+        self.assertEqual(self.law.size, base + index.size + graph.size + delegations.size)
+        self.assertEqual(self.cache.stats()["bytes"], self.law.size)
+
+    def test_evicted_law_is_not_put_back(self):
+        self.law.search_index()
+        self.law.references()
+        self.law.delegations()
+        self.assertEqual(len(self.cache), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import asyncio
+import inspect
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+os.environ.setdefault("OPEN_LAW_ID", "test")
+
+import httpx
+from korean_law_mcp.api_client import KoreanLawClient
+from korean_law_mcp.async_client import AsyncKoreanLawClient
+from korean_law_mcp.throttle import TokenBucket
+from korean_law_mcp.retry import DeadlineExceeded
+
+SEARCH_XML = "<LawSearch><law><법령일련번호>265307</법령일련번호><법령명한글>민법</법령명한글></law></LawSearch>"
+
+class TestAsyncClient(unittest.TestCase):
+    def test_mirrors_sync_surface(self):
+        """Every public KoreanLawClient method has an async twin (streams are async generators)"""
+        sync_methods = {n for n in dir(KoreanLawClient) if not n.startswith("_") and callable(getattr(KoreanLawClient, n))}
+        for name in sync_methods:
+            method = getattr(AsyncKoreanLawClient, name)
+            self.assertTrue(asyncio.iscoroutinefunction(method) or inspect.isasyncgenfunction(method), name)
+
+    def test_bounded_concurrency(self):
+        """Many concurrent lookups never exceed max_concurrency in flight"""
+        state = {"now": 0, "peak": 0}
+
+        async def handler(request):
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+            await asyncio.sleep(0.001)
+            state["now"] -= 1
+            self.assertEqual(request.url.params["OC"], "test")
+            return httpx.Response(200, content=SEARCH_XML.encode())
+
+        async def run():
+            http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncKoreanLawClient(max_concurrency=8, http_client=http) as client:
+                # Lift the per-key rate limit so only the concurrency bound is exercised
+                client.throttle.bucket = TokenBucket(rate=100000, burst=100000)
+                return await asyncio.gather(*(client.search_law(f"민법 {i}") for i in range(500)))
+
+        results = asyncio.run(run())
+        self.assertEqual(len(results), 500)
+        self.assertEqual(results[0]['LawSearch']['law']['법령명한글'], "민법")
+        self.assertLessEqual(state["peak"], 8)
+        print(f"[PASS] 500 lookups, peak in-flight {state['peak']}")
+
+    def test_stream_retries_before_first_byte_and_frees_the_slot(self):
+        """A 503 on open is retried; the throttle slot is released once headers arrive"""
+        attempts = []
+
+        async def handler(request):
+            attempts.append(1)
+            if len(attempts) == 1:
+                return httpx.Response(503)
+
+            async def body():
+                for part in (b"<Law>", b"</Law>"):
+                    await asyncio.sleep(0.01)
+                    yield part
+            return httpx.Response(200, content=body())
+
+        async def run():
+            http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncKoreanLawClient(http_client=http) as client:
+                client.retry.base = 0.01
+                chunks, in_flight = [], []
+                async for chunk in client.stream_law_detail("1"):
+                    chunks.append(chunk)
+                    in_flight.append(client.throttle.limiter.in_flight)
+                return b"".join(chunks), in_flight
+
+        body, in_flight = asyncio.run(run())
+        self.assertEqual(body, b"<Law></Law>")
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(set(in_flight), {0})
+
+    def test_stream_body_is_bounded_by_the_deadline(self):
+        async def handler(request):
+            async def body():
+                yield b"<Law>"
+                await asyncio.sleep(5)
+                yield b"</Law>"
+            return httpx.Response(200, content=body())
+
+        async def run():
+            http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncKoreanLawClient(http_client=http) as client:
+                client.retry.deadline = 0.3
+                async for _ in client.stream_law_detail("1"):
+                    pass
+
+        with self.assertRaises(DeadlineExceeded):
+            asyncio.run(run())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import os
+import sys
+import tempfile
+import unittest
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from korean_law_mcp.cache import ResponseCache, LRUCache, ttl_for, estimate_size, TTL_IMMUTABLE, TTL_SEARCH
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "responses.sqlite")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_ttl_policy(self):
+        """MST-addressed law versions outlive search listings"""
+        self.assertEqual(ttl_for("lawService.do", {"target": "law", "MST": "265307"}), TTL_IMMUTABLE)
+        self.assertEqual(ttl_for("lawSearch.do", {"target": "law", "query": "민법"}), TTL_SEARCH)
+        self.assertLess(ttl_for("lawService.do", {"target": "prec", "ID": "1"}), TTL_IMMUTABLE)
+
+    def test_hit_miss_and_persistence(self):
+        params = {"OC": "a", "target": "law", "type": "XML", "MST": "265307"}
+        cache = ResponseCache(self.path)
+        self.assertIsNone(cache.get("lawService.do", params))
+        cache.put("lawService.do", params, "<법령/>".encode())
+        # OC is not part of the key
+        self.assertEqual(cache.get("lawService.do", {**params, "OC": "b"}), "<법령/>".encode())
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+        reopened = ResponseCache(self.path)
+        self.assertEqual(reopened.get("lawService.do", params), "<법령/>".encode())
+
+    def test_expired_entry_is_a_miss(self):
+        cache = ResponseCache(self.path)
+        params = {"target": "law", "query": "민법"}
+        cache.put("lawSearch.do", params, b"<LawSearch/>", ttl=-1)
+        self.assertIsNone(cache.get("lawSearch.do", params))
+
+    def test_size_bounded_eviction(self):
+        """Least recently used entries are evicted once max_bytes is exceeded"""
+        cache = ResponseCache(self.path, max_bytes=4000)
+        for i in range(20):
+            cache.put("lawService.do", {"target": "law", "MST": str(i)}, os.urandom(500))
+        stats = cache.stats()
+        self.assertLessEqual(stats["bytes"], 4000)
+        self.assertGreater(stats["evictions"], 0)
+        self.assertIsNotNone(cache.get("lawService.do", {"target": "law", "MST": "19"}))
+        self.assertIsNone(cache.get("lawService.do", {"target": "law", "MST": "0"}))
+
+class TestLRUCache(unittest.TestCase):
+    def test_byte_weighted_eviction(self):
+        """Entries are evicted by total weight, least recently used first"""
+        lru = LRUCache(max_bytes=100)
+        lru.put("민법", "a", 40)
+        lru.put("형법", "b", 40)
+        self.assertEqual(lru.get("민법"), "a")  # 민법 is now most recent
+        lru.put("상법", "c", 40)
+        self.assertIsNone(lru.get("형법"))
+        self.assertEqual(lru.get("민법"), "a")
+        self.assertEqual(lru.stats()["bytes"], 80)
+
+    def test_oversized_value_is_not_cached(self):
+        lru = LRUCache(max_bytes=10)
+        lru.put("huge", "x", 11)
+        self.assertEqual(len(lru), 0)
+
+    def test_expired_entry_is_a_miss(self):
+        lru = LRUCache(max_bytes=100)
+        lru.put("민법", "1001", 10, ttl=-1)
+        lru.put("형법", "1002", 10, ttl=60)
+        self.assertIsNone(lru.get("민법"))
+        self.assertEqual(lru.get("형법"), "1002")
+        self.assertEqual(lru.stats()["bytes"], 10)
+
+    def test_reweigh_only_resident_entries(self):
+        lru = LRUCache(max_bytes=100)
+        value = object()
+        lru.put("민법", value, 40)
+        self.assertTrue(lru.reweigh("민법", value, 60))
+        self.assertEqual(lru.stats()["bytes"], 60)
+        # An entry evicted (or replaced) meanwhile is not put back
+        lru.pop("민법")
+        self.assertFalse(lru.reweigh("민법", value, 70))
+        self.assertIsNone(lru.get("민법"))
+        lru.put("민법", "other", 10)
+        self.assertFalse(lru.reweigh("민법", value, 70))
+        self.assertEqual(lru.stats()["bytes"], 10)
+
+    def test_slotted_records_are_weighed(self):
+        """__slots__ records count their field values, and are lighter than the equivalent dict"""
+        class Record:
+            __slots__ = ('no', 'full_text')
+            def __init__(self, no, full_text):
+                self.no = no
+                self.full_text = full_text
+
+        text = "가" * 1000
+        record = Record("1", text)
+        self.assertGreater(estimate_size(record), sys.getsizeof(text))
+        self.assertLess(estimate_size(record), estimate_size({'no': "1", 'full_text': text}))
+
+if __name__ == '__main__':
+    unittest.main()
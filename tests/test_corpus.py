@@ -0,0 +1,151 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from korean_law_mcp.corpus import CorpusIndex, to_match_query
+from korean_law_mcp.mirror import Mirror, MirrorSync
+from korean_law_mcp import utils
+
+class TestCorpusIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.corpus = CorpusIndex(os.path.join(self.tmp.name, "corpus.sqlite"))
+        self.corpus.add("statute", "1", "민법", "제2조(신의성실) 권리의 행사와 의무의 이행은 신의에 좇아 성실히 하여야 한다.", {"date": "20240101"})
+        self.corpus.add("statute", "2", "학교폭력예방 및 대책에 관한 법률", "제1조(목적) 학교폭력의 예방과 대책에 필요한 사항을 규정한다.")
+        self.corpus.add("prec", "555", "손해배상", "신의성실의 원칙에 반하는 권리의 행사는 허용되지 않는다.", {"case_no": "2010다1"})
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_match_query(self):
+        self.assertEqual(to_match_query("신의성실 권리"), '"신의성실"* AND "권리"*')
+        self.assertIsNone(to_match_query("!!"))
+
+    def test_prefix_matches_particles_and_filters_kind(self):
+        """'권리' matches 권리의; kind restricts the category"""
+        hits = self.corpus.search("신의성실 권리")
+        self.assertEqual({(h["kind"], h["doc_id"]) for h in hits}, {("statute", "1"), ("prec", "555")})
+        precs = self.corpus.search("신의성실 권리", kind="prec")
+        self.assertEqual([h["doc_id"] for h in precs], ["555"])
+        self.assertEqual(precs[0]["meta"]["case_no"], "2010다1")
+        self.assertIn("**", precs[0]["snippet"])
+
+    def test_title_match_ranks_first(self):
+        self.corpus.add("statute", "3", "학교안전법", "학교폭력 관련 조항은 학교폭력예방법을 따른다. 학교폭력")
+        hits = self.corpus.search("학교폭력예방", kind="statute")
+        self.assertEqual(hits[0]["doc_id"], "2")
+
+    def test_readd_replaces_document(self):
+        self.corpus.add("statute", "1", "민법", "전부 개정된 본문")
+        self.assertEqual(self.corpus.search("신의성실", kind="statute"), [])
+        self.assertEqual(self.corpus.stats()["documents"]["statute"], 2)
+
+    def test_newer_version_replaces_older(self):
+        """A new MST of the same law drops the old one; an older MST loaded later is not indexed"""
+        self.corpus.add("statute", "10", "건축법", "종전 건축 허가 기준", series="A1", version="20200101")
+        self.assertTrue(self.corpus.add("statute", "11", "건축법", "개정 건축 허가 기준", series="A1", version="20240101"))
+        self.assertEqual([h["doc_id"] for h in self.corpus.search("건축 허가", kind="statute")], ["11"])
+        self.assertFalse(self.corpus.add("statute", "10", "건축법", "종전 건축 허가 기준", series="A1", version="20200101"))
+        self.assertEqual([h["doc_id"] for h in self.corpus.search("건축 허가", kind="statute")], ["11"])
+
+    def test_expired_documents_are_not_searched(self):
+        corpus = CorpusIndex(os.path.join(self.tmp.name, "short.sqlite"), ttl=0.2)
+        corpus.add("statute", "1", "민법", "신의성실")
+        self.assertEqual(len(corpus.search("신의성실")), 1)
+        time.sleep(0.3)
+        self.assertEqual(corpus.search("신의성실"), [])
+        # Seeing the document again makes it searchable without re-indexing
+        self.assertTrue(corpus.touch("statute", "1"))
+        self.assertFalse(corpus.touch("statute", "2"))
+        self.assertEqual(len(corpus.search("신의성실")), 1)
+
+    def test_expired_documents_are_pruned(self):
+        corpus = CorpusIndex(os.path.join(self.tmp.name, "short.sqlite"), ttl=0.2)
+        corpus.add("statute", "1", "민법", "신의성실")
+        corpus.add("statute", "2", "형법", "살인")
+        time.sleep(0.3)
+        self.assertEqual(corpus.touch_many("statute", ["2", "3"]), ["3"])
+        # The next add deletes what expired; the touched document stays
+        corpus.add("statute", "4", "상법", "회사")
+        self.assertEqual(corpus.stats()["documents"]["statute"], 2)
+        self.assertEqual(corpus.stats()["pruned"], 1)
+        self.assertEqual(len(corpus.search("살인")), 1)
+
+    def test_coverage_expires_with_the_ttl(self):
+        corpus = CorpusIndex(os.path.join(self.tmp.name, "short.sqlite"), ttl=0.2)
+        self.assertFalse(corpus.covers("prec"))
+        corpus.mark_covered("prec")
+        self.assertTrue(corpus.covers("prec"))
+        self.assertFalse(corpus.covers("statute"))
+        time.sleep(0.3)
+        self.assertFalse(corpus.covers("prec"))
+
+class FakeMirrorClient:
+    def __init__(self, listing):
+        self.listing = listing
+        self.bodies = 0
+
+    def _fetch_raw(self, endpoint, params):
+        if endpoint == "lawSearch.do":
+            items = "".join(f"<prec><판례일련번호>{i}</판례일련번호><사건명>{name}</사건명><선고일자>20200101</선고일자></prec>"
+                            for i, name in self.listing)
+            return f"<PrecSearch><totalCnt>{len(self.listing)}</totalCnt>{items}</PrecSearch>".encode()
+        self.bodies += 1
+        return f"<PrecService><사건명>사건{params['ID']}</사건명><판례내용>신의성실 본문</판례내용></PrecService>".encode()
+
+class TestMirrorSyncKeepsCorpusFresh(unittest.TestCase):
+    def test_unchanged_documents_are_touched(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            corpus = CorpusIndex(os.path.join(tmp, "corpus.sqlite"), ttl=0.5)
+            client = FakeMirrorClient([("1", "손해배상"), ("2", "부당이득")])
+            sync = MirrorSync(client, Mirror(os.path.join(tmp, "mirror.sqlite")), corpus, workers=2)
+            sync.sync_target("prec")
+            self.assertEqual(client.bodies, 2)
+            self.assertTrue(corpus.covers("prec"))
+            time.sleep(0.6)
+            self.assertEqual(corpus.search("신의성실"), [])
+            # A delta sync fetches nothing, yet the listed documents answer searches again
+            sync.sync_target("prec")
+            self.assertEqual(client.bodies, 2)
+            self.assertEqual(len(corpus.search("신의성실")), 2)
+            self.assertTrue(corpus.covers("prec"))
+
+class TestIntegratedSearchUsesCorpus(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.corpus = CorpusIndex(os.path.join(self.tmp.name, "corpus.sqlite"))
+        self.client = mock.Mock()
+        self.client.search_law.return_value = {}
+        for p in (mock.patch.object(utils, "get_default_corpus", lambda: self.corpus),
+                  mock.patch.object(utils, "client", self.client)):
+            p.start()
+            self.addCleanup(p.stop)
+
+    def live_targets(self, query):
+        self.client.search_law.reset_mock()
+        utils.search_integrated_internal(query)
+        return sorted(call.kwargs["target"] for call in self.client.search_law.call_args_list)
+
+    def test_mentions_alone_go_to_the_live_api(self):
+        for i, title in enumerate(["근로기준법 시행령", "최저임금법", "파견법"]):
+            self.corpus.add("statute", str(i), title, "근로기준법 제2조에 따른 근로자")
+        self.assertEqual(self.live_targets("근로기준법"), ["admrul", "law", "prec"])
+        self.corpus.add("statute", "9", "근로기준법", "제2조(정의) 근로자란")
+        self.assertEqual(self.live_targets("근로기준법"), ["admrul", "prec"])
+
+    def test_covered_category_answers_topic_queries(self):
+        for i in range(3):
+            self.corpus.add("prec", str(i), f"사건{i}", "신의성실의 원칙")
+        self.assertIn("prec", self.live_targets("신의성실"))
+        self.corpus.mark_covered("prec")
+        self.assertNotIn("prec", self.live_targets("신의성실"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import os
+import sys
+import threading
+import unittest
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from korean_law_mcp import family as family_module
+from korean_law_mcp.family import LawFamilyIndex, base_name
+
+LAWS = [
+    {"법령일련번호": "1", "법령명한글": "건축법"},
+    {"법령일련번호": "2", "법령명한글": "건축법 시행령"},
+    {"법령일련번호": "3", "법령명한글": "건축법 시행규칙"},
+    {"법령일련번호": "4", "법령명한글": "건축물관리법"},
+]
+
+class FakeSearch:
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, query, target="law"):
+        with self.lock:
+            self.calls.append((query, target))
+        if target == "admrul":
+            return {"AdmRulSearch": {"admrul": {"행정규칙일련번호": "77", "행정규칙명": "건축물의 설비기준 고시"}}}
+        return {"LawSearch": {"law": [law for law in LAWS if query in law["법령명한글"]]}}
+
+class TestLawFamilyIndex(unittest.TestCase):
+    def test_base_name(self):
+        self.assertEqual(base_name("건축법 시행규칙"), "건축법")
+        self.assertEqual(base_name("건축법시행령"), "건축법")
+        self.assertEqual(base_name("건축법"), "건축법")
+
+    def test_observe_groups_listing_by_act(self):
+        index = LawFamilyIndex(FakeSearch())
+        index.observe(LAWS)
+        family = index._families["건축법"]
+        self.assertEqual((family.act, family.decree, family.rule),
+                         (("1", "건축법"), ("2", "건축법 시행령"), ("3", "건축법 시행규칙")))
+        self.assertEqual(index._families["건축물관리법"].decree, None)
+
+    def test_get_refreshes_once_within_ttl(self):
+        search = FakeSearch()
+        index = LawFamilyIndex(search)
+        family = index.get("건축법 시행령")
+        self.assertEqual(family.decree, ("2", "건축법 시행령"))
+        self.assertEqual(family.admin_rules, [("77", "건축물의 설비기준 고시")])
+        self.assertEqual(sorted(search.calls), [("건축법", "admrul"), ("건축법", "law")])
+        index.get("건축법")
+        self.assertEqual(len(search.calls), 2)
+
+        index.ttl = 0
+        index.get("건축법")
+        self.assertEqual(len(search.calls), 4)
+
+    def test_concurrent_refreshes_share_one_search(self):
+        search = FakeSearch()
+        release = threading.Event()
+        slow = lambda query, target="law": release.wait(1) and search(query, target)
+        index = LawFamilyIndex(slow)
+        families = []
+        threads = [threading.Thread(target=lambda: families.append(index.get("건축법"))) for _ in range(4)]
+        for t in threads:
+            t.start()
+        # Let every caller reach the shared refresh before the searches answer
+        while index._refreshes.calls < 4:
+            threading.Event().wait(0.01)
+        release.set()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(search.calls), 2)
+        self.assertEqual(index.stats()["coalesced"], 3)
+        self.assertTrue(all(family is families[0] for family in families))
+
+    def test_failed_search_is_retried_before_the_ttl(self):
+        search = FakeSearch()
+        failing = [True]
+        def flaky(query, target="law"):
+            if target == "admrul" and failing[0]:
+                raise IOError("timeout")
+            return search(query, target)
+        index = LawFamilyIndex(flaky)
+        family = index.get("건축법")
+        self.assertEqual(family.decree, ("2", "건축법 시행령"))
+        self.assertEqual(family.admin_rules, [])
+        index.get("건축법")
+        self.assertEqual(index.refreshes, 1)
+        # Past the retry delay (far inside the TTL) the next read searches again
+        family.refreshed -= family_module.RETRY_AFTER + 1
+        failing[0] = False
+        self.assertEqual(index.get("건축법").admin_rules, [("77", "건축물의 설비기준 고시")])
+        self.assertEqual(index.refreshes, 2)
+
+    def test_historical_versions_are_ignored(self):
+        index = LawFamilyIndex(FakeSearch())
+        index.observe([{"법령일련번호": "9", "법령명한글": "건축법 시행령", "현행연혁코드": "연혁"},
+                       {"법령일련번호": "2", "법령명한글": "건축법 시행령", "현행연혁코드": "현행"},
+                       {"법령일련번호": "8", "법령명한글": "건축법 시행령", "현행연혁코드": "연혁"}])
+        self.assertEqual(index._families["건축법"].decree, ("2", "건축법 시행령"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from korean_law_mcp.hotset import HotSet
+from korean_law_mcp import warmup
+
+class TestHotSet(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "hot_laws.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_counts_survive_restart_with_decay(self):
+        first = HotSet(self.path)
+        for _ in range(4):
+            first.record("민법")
+        first.record("형법")
+        first.record(None)
+        first.record("Unknown")
+        self.assertEqual(first.top(5), [])  # top() reflects earlier runs only
+        first.save()
+
+        second = HotSet(self.path)
+        self.assertEqual(second.top(5), ["민법", "형법"])
+        for _ in range(3):
+            second.record("형법")
+        self.assertEqual(second.scores(), {"민법": 2.0, "형법": 3.5})
+        second.save()
+        self.assertEqual(HotSet(self.path).top(1), ["형법"])
+
+    def test_unreadable_file_is_ignored(self):
+        with open(self.path, "w") as f:
+            f.write("not json")
+        self.assertEqual(HotSet(self.path).top(5), [])
+
+    def test_autosave_writes_periodically(self):
+        hot = HotSet(self.path)
+        hot.record("민법")
+        hot.start_autosave(0.05)
+        self.addCleanup(hot.stop_autosave)
+        for _ in range(100):
+            if os.path.exists(self.path):
+                break
+            time.sleep(0.01)
+        self.assertEqual(HotSet(self.path).top(5), ["민법"])
+
+    def test_stop_signal_does_not_take_the_hot_set_lock(self):
+        """The handler only flags the stop; saving runs later on a thread, so a held lock cannot deadlock it"""
+        from korean_law_mcp import main
+        self.addCleanup(main._stopping.clear)
+        self.addCleanup(main._stop_signal.clear)
+        with main.hot_laws._lock:
+            main._on_stop_signal(15, None)
+        self.assertTrue(main._stopping.is_set())
+        self.assertEqual(main._stop_signal, [15])
+
+    def test_warmup_names_prefer_last_runs_hot_laws(self):
+        hot = HotSet(self.path)
+        hot.record("건축법")
+        hot.save()
+        with mock.patch.object(warmup, "hot_laws", HotSet(self.path)), \
+             mock.patch.object(warmup, "WARMUP_LAWS", ["민법", "건축법", "형법"]), \
+             mock.patch.object(warmup, "WARMUP_TOP", 2):
+            self.assertEqual(warmup.warmup_names(), ["건축법", "민법"])
+
+if __name__ == '__main__':
+    unittest.main()
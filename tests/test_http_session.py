@@ -0,0 +1,47 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from korean_law_mcp import api_client
+from korean_law_mcp.api_client import KoreanLawClient, create_session, get_session, CONNECT_TIMEOUT, READ_TIMEOUT
+
+class TestHttpSession(unittest.TestCase):
+    def test_pool_configuration(self):
+        session = create_session(pool_size=7)
+        adapter = session.get_adapter("https://www.law.go.kr")
+        self.assertIs(adapter, session.get_adapter("http://www.law.go.kr"))
+        self.assertEqual(adapter._pool_connections, 7)
+        self.assertEqual(adapter._pool_maxsize, 7)
+        # Callers wait for a pooled connection instead of opening extra sockets
+        self.assertTrue(adapter._pool_block)
+        self.assertEqual(session.headers["Connection"], "keep-alive")
+        self.assertIn("gzip", session.headers["Accept-Encoding"])
+
+    def test_clients_share_one_session(self):
+        with mock.patch.dict(os.environ, {"OPEN_LAW_ID": "test"}):
+            first = KoreanLawClient(cache=False)
+            second = KoreanLawClient(cache=False)
+        self.assertIs(first.session, get_session())
+        self.assertIs(second.session, first.session)
+        self.assertEqual(first.timeout, (CONNECT_TIMEOUT, READ_TIMEOUT))
+
+    def test_requests_go_through_the_shared_session(self):
+        response = mock.Mock(content=b"<LawSearch><totalCnt>0</totalCnt></LawSearch>")
+        session = mock.Mock()
+        session.get.return_value = response
+        with mock.patch.dict(os.environ, {"OPEN_LAW_ID": "test"}):
+            client = KoreanLawClient(session=session, cache=False, mirror=False)
+        client.search_law("민법")
+        client.search_law("형법")
+        self.assertEqual(session.get.call_count, 2)
+        # The socket timeout is (connect, read), the read part capped by the call's deadline
+        connect, read = session.get.call_args.kwargs["timeout"]
+        self.assertEqual(connect, CONNECT_TIMEOUT)
+        self.assertLessEqual(read, READ_TIMEOUT)
+
+if __name__ == '__main__':
+    unittest.main()
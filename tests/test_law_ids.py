@@ -0,0 +1,62 @@
+import os
+import sys
+import unittest
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from korean_law_mcp.law_ids import LawIdResolver, normalize_law_name, pick_law
+
+LISTING = [
+    {"법령일련번호": "11", "법령명한글": "민법 시행령", "법령구분명": "대통령령", "현행연혁코드": "현행"},
+    {"법령일련번호": "10", "법령명한글": "민법", "법령구분명": "법률", "현행연혁코드": "연혁"},
+    {"법령일련번호": "12", "법령명한글": "민법", "법령구분명": "법률", "현행연혁코드": "현행"},
+]
+
+class FakeSearch:
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, query, target="law"):
+        self.queries.append(query)
+        items = [i for i in LISTING if normalize_law_name(query) in normalize_law_name(i["법령명한글"])]
+        return {"LawSearch": {"law": items}} if items else {"LawSearch": {}}
+
+class TestLawIdResolver(unittest.TestCase):
+    def test_pick_law_prefers_current_exact_name(self):
+        self.assertEqual(pick_law(LISTING, "민 법")["법령일련번호"], "12")
+        self.assertEqual(pick_law(LISTING, "민")["법령일련번호"], "10")
+        self.assertIsNone(pick_law([], "민법"))
+
+    def test_resolve_caches_by_normalised_name(self):
+        search = FakeSearch()
+        seen = []
+        resolver = LawIdResolver(search, observers=[seen.append])
+        self.assertEqual(resolver.resolve("민법"), ("12", "민법"))
+        self.assertEqual(resolver.resolve("「민 법」"), ("12", "민법"))
+        # Names seen in the listing resolve without another search
+        self.assertEqual(resolver.resolve("민법시행령"), ("11", "민법 시행령"))
+        self.assertEqual(search.queries, ["민법"])
+        self.assertEqual(len(seen), 1)
+
+    def test_unknown_names_are_not_cached(self):
+        search = FakeSearch()
+        resolver = LawIdResolver(search)
+        self.assertIsNone(resolver.resolve("형법"))
+        self.assertIsNone(resolver.resolve("형법"))
+        self.assertEqual(search.queries, ["형법", "형법"])
+
+    def test_entries_expire(self):
+        search = FakeSearch()
+        resolver = LawIdResolver(search, ttl=-1)
+        resolver.resolve("민법")
+        resolver.resolve("민법")
+        self.assertEqual(search.queries, ["민법", "민법"])
+
+    def test_observed_listing_skips_superseded_versions(self):
+        resolver = LawIdResolver(FakeSearch())
+        resolver.observe(LISTING[1:2])
+        self.assertEqual(resolver.stats()["entries"], 0)
+
+if __name__ == '__main__':
+    unittest.main()
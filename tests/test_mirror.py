@@ -0,0 +1,63 @@
+import os
+import sys
+import tempfile
+import unittest
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from korean_law_mcp.mirror import Mirror, extract_text
+
+def listing(mst, name, promulgated="20231201"):
+    return {"법령일련번호": mst, "법령명한글": name, "공포일자": promulgated, "시행일자": "20240101"}
+
+class TestMirror(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.mirror = Mirror(os.path.join(self.tmp.name, "mirror.sqlite"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_delta_detection(self):
+        """Only new documents, documents without a body, and changed stamps are stale"""
+        stale = self.mirror.put_listings("law", [listing("1", "민법"), listing("2", "형법")])
+        self.assertEqual(sorted(stale), ["1", "2"])
+        self.mirror.put_body("law", "1", "<법령/>".encode())
+        self.mirror.put_body("law", "2", "<법령/>".encode())
+
+        self.assertEqual(self.mirror.put_listings("law", [listing("1", "민법"), listing("2", "형법")]), [])
+        stale = self.mirror.put_listings("law", [listing("1", "민법", "20250101"), listing("2", "형법"), listing("3", "상법")])
+        self.assertEqual(sorted(stale), ["1", "3"])
+        # A changed document loses its outdated body until re-fetched
+        self.assertIsNone(self.mirror.get_body("law", "1"))
+        self.assertEqual(self.mirror.get_body("law", "2"), "<법령/>".encode())
+
+    def test_lookup_matches_the_mirrored_key_only(self):
+        self.mirror.put_listings("prec", [{"판례일련번호": "555", "사건명": "손해배상", "선고일자": "20100101"}])
+        self.mirror.put_body("prec", "555", b"<PrecService/>")
+        self.assertEqual(self.mirror.lookup("lawService.do", {"target": "prec", "ID": "555"}), b"<PrecService/>")
+        # Precedent MSTs are a different numbering; never answer them from ID-keyed rows
+        self.assertIsNone(self.mirror.lookup("lawService.do", {"target": "prec", "MST": "555"}))
+        self.assertIsNone(self.mirror.lookup("lawSearch.do", {"target": "prec", "ID": "555"}))
+
+    def test_search_listing_shape(self):
+        """Listings answer lawSearch.do in the live response shape once a target is synced"""
+        self.mirror.put_listings("law", [listing("1", "민법"), listing("2", "민법 시행령"), listing("3", "형법")])
+        self.assertIsNone(self.mirror.search({"target": "law", "query": "민법"}))
+        self.mirror.mark_synced("law", 3)
+
+        data = self.mirror.search({"target": "law", "query": "민법"})
+        items = data["LawSearch"]["law"]
+        self.assertEqual([i["법령일련번호"] for i in items], ["1", "2"])
+        single = self.mirror.search({"target": "law", "query": "형법"})
+        self.assertEqual(single["LawSearch"]["law"]["법령명한글"], "형법")
+
+    def test_extract_text(self):
+        body = "<PrecService><사건명>손해배상</사건명><판례내용>내용&lt;br/&gt;본문</판례내용></PrecService>".encode()
+        text = extract_text(body)
+        self.assertIn("손해배상", text)
+        self.assertNotIn("<br/>", text)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+import re
+import sys
+import unittest
+from unittest import mock
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from korean_law_mcp import utils
+from korean_law_mcp.utils import ParsedLaw, _parse_article_item, get_statute_page_internal, parse_article_range
+
+LAW_ID = "paging-test"
+
+def unit(no, branch=None):
+    item = {'조문번호': no, '조문여부': '조문', '조문내용': f"제{no}조{'의' + branch if branch else ''} " + "가" * 90}
+    if branch:
+        item['조문가지번호'] = branch
+    return _parse_article_item(item)
+
+class TestStatutePaging(unittest.TestCase):
+    def setUp(self):
+        articles = [unit(str(i)) for i in range(1, 11)]
+        articles.insert(5, unit('5', branch='2'))
+        law = ParsedLaw(LAW_ID, {'법령명_한글': '페이지법'}, {}, articles)
+        utils.law_cache.put(LAW_ID, law, law.size)
+        self.addCleanup(utils.law_cache.pop, LAW_ID)
+
+    def pages(self, **kwargs):
+        """Follow cursors to the end; returns the article labels on each page"""
+        pages = []
+        cursor = None
+        while True:
+            page = get_statute_page_internal(LAW_ID, cursor=cursor, max_chars=300, **kwargs)
+            pages.append(re.findall(r'^(제\d+조(?:의\d+)?) ', page, re.M))
+            m = re.search(r'cursor="([^"]+)"', page)
+            if not m:
+                return pages
+            cursor = m.group(1)
+
+    def test_cursor_walks_whole_law_once(self):
+        pages = self.pages()
+        self.assertEqual(len(pages), 4)
+        self.assertTrue(all(len(p) <= 3 for p in pages))
+        flat = [label for page in pages for label in page]
+        self.assertEqual(flat[:7], ["제1조", "제2조", "제3조", "제4조", "제5조", "제5조의2", "제6조"])
+        self.assertEqual(len(flat), 11)
+
+    def test_article_range(self):
+        self.assertEqual(parse_article_range("제5조~제6조"), ((5, 0), (6, sys.maxsize)))
+        self.assertIsNone(parse_article_range("6-5"))
+        self.assertIsNone(parse_article_range("5"))
+        pages = self.pages(article_range="5의2-7")
+        self.assertEqual([label for page in pages for label in page], ["제5조의2", "제6조", "제7조"])
+
+    def test_short_law_has_no_cursor(self):
+        page = get_statute_page_internal(LAW_ID)
+        self.assertNotIn("cursor", page)
+        self.assertTrue(page.startswith("# 페이지법\n\n제1조 "))
+
+    def test_cursor_is_bound_to_its_law(self):
+        first = get_statute_page_internal(LAW_ID, max_chars=300)
+        cursor = re.search(r'cursor="([^"]+)"', first).group(1)
+        self.assertTrue(get_statute_page_internal("other", cursor=cursor).startswith("Error"))
+        self.assertTrue(get_statute_page_internal(LAW_ID, cursor="%%%").startswith("Error"))
+
+    def test_prompts_read_one_page(self):
+        from korean_law_mcp import prompts
+        with mock.patch.object(prompts, "PAGE_CHARS", 600):
+            summary = prompts.summarize_law(LAW_ID)
+            comparison = prompts.compare_laws(LAW_ID, LAW_ID)
+        self.assertIn("제1조", summary[0].content.text)
+        self.assertIn(f'read_legal_resource("statute:{LAW_ID}", cursor=', comparison[0].content.text)
+        # Half a page per law
+        self.assertEqual(len(re.findall(r'^제\d+조(?:의\d+)? ', comparison[0].content.text, re.M)), 6)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from korean_law_mcp.references import ReferenceGraph, DelegationIndex, extract_references
+from korean_law_mcp.article_store import ArticleStore
+from korean_law_mcp import utils
+from korean_law_mcp.utils import _parse_article_item, resolve_references
+
+def article(no, content, kind='조문'):
+    return _parse_article_item({'조문번호': no, '조문여부': kind, '조문내용': content})
+
+class TestExtractReferences(unittest.TestCase):
+    def test_internal_and_external(self):
+        """A named article is external only; the same number is not also taken as internal"""
+        refs = extract_references("제3조 및 건축법 제5조제1항, 이 법 제7조의2에 따른다")
+        self.assertEqual(refs, [(None, (3, 0)), ("건축법", (5, 0)), (None, (7, 2))])
+
+    def test_qualifiers(self):
+        text = "「학교폭력예방 및 대책에 관한 법률」 제5조, 같은 법 제6조, 건축법 시행령 제3조, 민법 제2조"
+        self.assertEqual(extract_references(text, law_name="민법"), [
+            ("학교폭력예방 및 대책에 관한 법률", (5, 0)),
+            ("학교폭력예방 및 대책에 관한 법률", (6, 0)),
+            ("건축법 시행령", (3, 0)),
+            (None, (2, 0)),
+        ])
+
+    def test_parent_act_reference_is_skipped(self):
+        """'법 제20조' in a decree names no law; it is neither internal nor resolvable yet"""
+        self.assertEqual(extract_references("법 제20조에 따라 제4조를 준용한다"), [(None, (4, 0))])
+
+class TestReferenceGraph(unittest.TestCase):
+    def setUp(self):
+        self.graph = ReferenceGraph([
+            article('1', '제1장 총칙', kind='전문'),
+            article('1', '제1조(목적) 제2조 및 건축법 제5조를 준용한다'),
+            article('2', '제2조(정의) 제2조의 용어는 건축법 제5조와 민법 제3조에 따른다'),
+            article('3', '제3조(적용) 본문'),
+        ], law_name="민법")
+
+    def test_adjacency(self):
+        self.assertEqual(self.graph.targets((1, 0)), ((None, (2, 0)), ("건축법", (5, 0))))
+        # Self references and a heading's own number are dropped
+        self.assertEqual(self.graph.targets((2, 0)), (("건축법", (5, 0)), (None, (3, 0))))
+        self.assertEqual(self.graph.targets((3, 0)), ())
+        self.assertEqual(self.graph.external(), [("건축법", (5, 0))])
+
+    def test_round_trip_through_store(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = ArticleStore(tmp)
+            try:
+                self.assertIsNone(store.get_references("1001"))
+                store.put_references("1001", self.graph.pairs())
+                restored = ReferenceGraph.from_edges(store.get_references("1001"))
+                self.assertEqual(restored.edges, self.graph.edges)
+                store.put_references("1002", ReferenceGraph().pairs())
+                self.assertEqual(store.get_references("1002"), [])
+            finally:
+                store.close()
+
+class TestDelegationIndex(unittest.TestCase):
+    def test_citations_by_act_article(self):
+        """Branches and 항/호 are keyed by the act article; 제2조 does not match 제20조"""
+        decree = [
+            article('1', '제1장 총칙', kind='전문'),
+            article('1', '제1조(목적) 이 영은 법 제2조 및 법 제20조에서 위임된 사항을 정한다.'),
+            article('2', '제2조(범위) 법 제20조의2제1항제3호에서 "대통령령으로 정하는 사항"이란'),
+            article('3', '제3조(기준) 법 제20조 제2항에 따른 기준은 별표와 같다. 법 제20조에 따라'),
+        ]
+        index = DelegationIndex(decree)
+        self.assertEqual([(a.no, p) for a, p in index.citing((2, 0))], [('1', '법 제2조')])
+        self.assertEqual([(a.no, p) for a, p in index.citing((20, 0))], [('1', '법 제20조'), ('3', '법 제20조제2항')])
+        self.assertEqual([(a.no, p) for a, p in index.citing((20, 2))], [('2', '법 제20조의2제1항제3호')])
+        self.assertEqual(index.citing((3, 0)), [])
+
+    def test_other_laws_named_before_are_not_the_act(self):
+        decree = [
+            article('1', '제1조(준용) 「건축법」 제5조 및 같은 법 제6조, 동 법 제7조와 「국토계획법」 법 제8조를 준용한다.'),
+            article('2', '제2조(위임) 법 제9조에 따른 사항'),
+        ]
+        index = DelegationIndex(decree)
+        for key in ((5, 0), (6, 0), (7, 0), (8, 0)):
+            self.assertEqual(index.citing(key), [])
+        self.assertEqual([(a.no, p) for a, p in index.citing((9, 0))], [('2', '법 제9조')])
+
+class TestResolveReferences(unittest.TestCase):
+    TEXT = "건축법 제5조, 건축법 제6조, 민법 제3조, 형법 제250조"
+
+    def setUp(self):
+        def find_article(law_id, article_no):
+            # 형법 is too slow for a short time budget
+            time.sleep(0.5 if law_id == "형법" else 0.05 if law_id == "건축법" else 0)
+            return law_id, article(article_no, f"제{article_no}조 {law_id} 본문")
+        patches = [
+            mock.patch.object(utils, "find_article", find_article),
+            mock.patch.object(utils.law_names, "resolve", lambda name: (name, name)),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def headings(self, text):
+        return [line for line in text.splitlines() if line.startswith(("###", "_("))]
+
+    def test_results_keep_mention_order(self):
+        self.assertEqual(self.headings(resolve_references(self.TEXT)), [
+            "### [External] 건축법 제5조", "### [External] 건축법 제6조",
+            "### [External] 민법 제3조", "### [External] 형법 제250조",
+        ])
+
+    def test_time_budget_gives_partial_output(self):
+        started = time.monotonic()
+        result = resolve_references(self.TEXT, timeout=0.3)
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(self.headings(result)[:3], [
+            "### [External] 건축법 제5조", "### [External] 건축법 제6조", "### [External] 민법 제3조",
+        ])
+        self.assertIn("time budget of 0.3s reached: 형법 제250조", result)
+
+    def test_character_budget(self):
+        result = resolve_references(self.TEXT, budget=1)
+        self.assertEqual(len(self.headings(result)), 2)
+        self.assertIn("3 more referenced articles not included, character budget of 1 reached", result)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import concurrent.futures
+import os
+import sys
+import time
+import unittest
+from unittest import mock
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from korean_law_mcp import utils
+from korean_law_mcp.resource_ids import ResourceIdMemory, race
+
+def slow(value, delay=0.0, error=None):
+    def fetch():
+        time.sleep(delay)
+        if error:
+            raise error
+        return value
+    return fetch
+
+class TestRace(unittest.TestCase):
+    def setUp(self):
+        self.pool = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+        self.addCleanup(self.pool.shutdown)
+        self.valid = lambda kind, data: data is not None
+
+    def test_preferred_strategy_wins_over_faster_fallback(self):
+        result = race([("ID", slow("by id", 0.1)), ("MST", slow("by mst"))], self.valid, self.pool)
+        self.assertEqual(result, ("ID", "by id", None))
+
+    def test_fallbacks_run_concurrently(self):
+        started = time.monotonic()
+        result = race([("ID", slow(None, 0.2)), ("MST", slow(None, 0.2)), ("detc", slow("found", 0.2))],
+                      self.valid, self.pool)
+        self.assertEqual(result, ("detc", "found", None))
+        self.assertLess(time.monotonic() - started, 0.5)
+
+    def test_hedged_fallbacks_wait_for_the_preferred_lookup(self):
+        started = []
+        def fetch(kind, value, delay=0.0):
+            def run():
+                started.append(kind)
+                time.sleep(delay)
+                return value
+            return run
+        # A quick answer by ID never starts the fallbacks
+        result = race([("ID", fetch("ID", "by id")), ("MST", fetch("MST", "by mst"))], self.valid, self.pool, hedge_after=1.0)
+        self.assertEqual((result, started), (("ID", "by id", None), ["ID"]))
+        # An empty answer starts them at once, without waiting out the delay
+        started.clear()
+        began = time.monotonic()
+        result = race([("ID", fetch("ID", None)), ("MST", fetch("MST", "by mst"))], self.valid, self.pool, hedge_after=1.0)
+        self.assertEqual(result, ("MST", "by mst", None))
+        self.assertLess(time.monotonic() - began, 0.5)
+        # A slow ID lookup is hedged after the delay and still wins if it turns out valid
+        started.clear()
+        result = race([("ID", fetch("ID", "by id", 0.3)), ("MST", fetch("MST", "by mst"))], self.valid, self.pool, hedge_after=0.1)
+        self.assertEqual(result, ("ID", "by id", None))
+        self.assertEqual(started, ["ID", "MST"])
+
+    def test_errors_make_a_miss_inconclusive(self):
+        self.assertEqual(race([("ID", slow(None))], self.valid, self.pool), (None, None, None))
+        error = IOError("timeout")
+        result = race([("ID", slow(None, error=error)), ("MST", slow(None))], self.valid, self.pool)
+        self.assertEqual(result, (None, None, error))
+
+class TestResourceIdMemory(unittest.TestCase):
+    def test_kind_and_not_found(self):
+        ids = ResourceIdMemory(not_found_ttl=0.1)
+        ids.found("prec", "1", "MST")
+        self.assertEqual(ids.kind("prec", "1"), "MST")
+        self.assertFalse(ids.missing("prec", "1"))
+        ids.not_found("prec", "2")
+        self.assertTrue(ids.missing("prec", "2"))
+        self.assertIsNone(ids.kind("prec", "2"))
+        self.assertFalse(ids.missing("admrul", "2"))
+        time.sleep(0.15)
+        self.assertFalse(ids.missing("prec", "2"))
+
+class TestPrecedentFallback(unittest.TestCase):
+    def setUp(self):
+        self.client = mock.Mock()
+        patches = [
+            mock.patch.object(utils, "client", self.client),
+            mock.patch.object(utils, "resource_ids", ResourceIdMemory()),
+            mock.patch.object(utils, "index_document"),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_detc_kind_is_remembered(self):
+        self.client.get_precedent_detail.return_value = {'Law': 'not found'}
+        self.client.get_prec_const_detail.return_value = {'DetcService': {'사건명': '헌법소원', '결정요지': '요지'}}
+        self.assertTrue(utils.get_precedent_detail_internal("900").startswith("# 헌법소원"))
+        self.assertEqual(self.client.get_precedent_detail.call_count, 2)
+        self.assertEqual(utils.resource_ids.kind("prec", "900"), "detc")
+        self.assertTrue(utils.get_precedent_detail_internal("900").startswith("# 헌법소원"))
+        # The second read goes straight to the decision
+        self.assertEqual(self.client.get_precedent_detail.call_count, 2)
+
+    def test_failed_remembered_kind_is_not_raced_again(self):
+        utils.resource_ids.found("prec", "903", "detc")
+        self.client.get_prec_const_detail.side_effect = IOError("connection reset")
+        self.client.get_precedent_detail.side_effect = [{'Law': 'not found'}, {'PrecService': {'사건명': '손해배상'}}]
+        self.assertTrue(utils.get_precedent_detail_internal("903").startswith("# 손해배상"))
+        self.assertEqual(self.client.get_prec_const_detail.call_count, 1)
+        self.assertEqual(utils.resource_ids.kind("prec", "903"), "MST")
+
+    def test_not_found_is_cached(self):
+        self.client.get_precedent_detail.return_value = {'Law': 'not found'}
+        self.client.get_prec_const_detail.return_value = {'Law': 'not found'}
+        for _ in range(2):
+            self.assertTrue(utils.get_precedent_detail_internal("901").startswith("Error: Law/Precedent not found"))
+        self.assertEqual(self.client.get_precedent_detail.call_count, 2)
+        self.assertEqual(self.client.get_prec_const_detail.call_count, 1)
+
+    def test_fetch_errors_are_not_cached(self):
+        self.client.get_precedent_detail.side_effect = IOError("connection reset")
+        self.client.get_prec_const_detail.return_value = {'Law': 'not found'}
+        with self.assertRaises(IOError):
+            utils.get_precedent_detail_internal("902")
+        self.assertFalse(utils.resource_ids.missing("prec", "902"))
+
+    def test_missing_statute_is_not_scanned_again(self):
+        scans = []
+        def scan_law(law_id):
+            scans.append(law_id)
+            yield from ()
+        with mock.patch.object(utils, "scan_law", scan_law), \
+             mock.patch.object(utils, "get_default_store", lambda: None):
+            for _ in range(2):
+                self.assertTrue(utils.get_statute_article_internal("904", "1").startswith("Error"))
+            self.assertEqual(scans, ["904"])
+            # The paged reader shares the same entry
+            self.assertEqual(utils.get_statute_page_internal("904"), "Error: Law not found.")
+            self.assertEqual(scans, ["904"])
+
+    def test_single_kind_resources_cache_not_found(self):
+        self.client.get_legal_term_detail.return_value = {'Law': 'not found'}
+        for _ in range(2):
+            self.assertEqual(utils.get_legal_term_detail_internal("5"), "Error: Law Term not found.")
+        self.assertEqual(self.client.get_legal_term_detail.call_count, 1)
+
+if __name__ == '__main__':
+    unittest.main()
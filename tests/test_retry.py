@@ -0,0 +1,123 @@
+import asyncio
+import time
+import unittest
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from korean_law_mcp.retry import RetryPolicy, DeadlineExceeded, hedged_call, HEDGE_MIN_SAMPLES
+
+class Flaky(Exception):
+    pass
+
+class TestRetryPolicy(unittest.TestCase):
+    def setUp(self):
+        self.pool = ThreadPoolExecutor(max_workers=4)
+
+    def tearDown(self):
+        self.pool.shutdown(wait=False)
+
+    def test_retries_retryable_errors(self):
+        policy = RetryPolicy(attempts=3, deadline=5, hedge=False, base=0.01)
+        calls = []
+
+        def fn(remaining):
+            calls.append(remaining)
+            if len(calls) < 3:
+                raise Flaky()
+            return "ok"
+
+        self.assertEqual(policy.call("lawService.do", fn, self.pool, lambda e: isinstance(e, Flaky)), "ok")
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(policy.stats()["retries"], 2)
+        # Each attempt is told how much of the budget is left
+        self.assertLess(calls[2], calls[0])
+
+    def test_non_retryable_error_is_raised_immediately(self):
+        policy = RetryPolicy(attempts=3, deadline=5, hedge=False)
+        calls = []
+
+        def fn(remaining):
+            calls.append(1)
+            raise ValueError("bad request")
+
+        with self.assertRaises(ValueError):
+            policy.call("lawService.do", fn, self.pool, lambda e: isinstance(e, Flaky))
+        self.assertEqual(len(calls), 1)
+
+    def test_deadline_bounds_a_stuck_call(self):
+        policy = RetryPolicy(attempts=3, deadline=0.2, hedge=False)
+        start = time.monotonic()
+        with self.assertRaises(DeadlineExceeded):
+            policy.call("lawService.do", lambda remaining: time.sleep(1), self.pool, lambda e: True)
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(policy.stats()["deadline_exceeded"], 1)
+
+    def test_hedge_fires_after_p95(self):
+        policy = RetryPolicy(attempts=1, deadline=2, hedge=True)
+        for _ in range(HEDGE_MIN_SAMPLES):
+            policy.latency.record("lawSearch.do", 0.05)
+        calls = []
+
+        def fn(remaining):
+            calls.append(1)
+            # First attempt is stuck, the hedge answers quickly
+            time.sleep(1.0 if len(calls) == 1 else 0.01)
+            return len(calls)
+
+        start = time.monotonic()
+        result = policy.call("lawSearch.do", fn, self.pool, lambda e: True)
+        self.assertEqual(result, 2)
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(policy.stats()["hedged"], 1)
+        self.assertEqual(policy.stats()["hedge_wins"], 1)
+
+    def test_throttle_queueing_neither_hedges_nor_counts(self):
+        """Time spent waiting for a throttle slot is not latency and does not start the hedge timer"""
+        policy = RetryPolicy(attempts=1, deadline=2, hedge=True)
+        for _ in range(HEDGE_MIN_SAMPLES):
+            policy.latency.record("lawSearch.do", 0.05)
+        calls = []
+
+        def fn(remaining, sent):
+            calls.append(1)
+            time.sleep(0.3)   # queued behind the rate limit
+            sent()
+            time.sleep(0.02)  # the request itself
+            return "ok"
+
+        self.assertEqual(policy.call("lawSearch.do", fn, self.pool, lambda e: True, throttled=True), "ok")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(policy.stats()["hedged"], 0)
+        self.assertLess(policy.latency.percentile("lawSearch.do", 1.0), 0.2)
+
+    def test_hedged_call_without_hedge(self):
+        result, hedged, _ = hedged_call(self.pool, lambda: "민법", None, 1.0)
+        self.assertEqual((result, hedged), ("민법", False))
+
+    def test_async_retry_and_deadline(self):
+        policy = RetryPolicy(attempts=2, deadline=0.3, hedge=False, base=0.01)
+        calls = []
+
+        async def flaky(remaining):
+            calls.append(1)
+            if len(calls) == 1:
+                raise Flaky()
+            return "ok"
+
+        async def stuck(remaining):
+            await asyncio.sleep(5)
+
+        async def run():
+            ok = await policy.acall("lawService.do", flaky, lambda e: isinstance(e, Flaky))
+            with self.assertRaises(DeadlineExceeded):
+                await policy.acall("lawService.do", stuck, lambda e: True)
+            return ok
+
+        self.assertEqual(asyncio.run(run()), "ok")
+
+if __name__ == '__main__':
+    unittest.main()
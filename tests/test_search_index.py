@@ -0,0 +1,53 @@
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from korean_law_mcp.search_index import ArticleSearchIndex, parse_query
+
+TEXTS = [
+    "제1조(목적) 이 법은 국민의 권리와 의무를 정함을 목적으로 한다.",
+    "제2조(신의성실) ① 권리의 행사와 의무의 이행은 신의에 좇아 성실히 하여야 한다.\n  ② 권리는 남용하지 못한다.",
+    "제3조(권리능력의 존속기간) 사람은 생존한 동안 권리와 의무의 주체가 된다.",
+    "제4조(성년) 사람은 19세로 성년에 이르게 된다.",
+]
+
+class TestArticleSearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = ArticleSearchIndex(TEXTS)
+
+    def test_parse_query(self):
+        self.assertEqual(parse_query('권리 "의무의 이행"'), [(["권리"], None), (["의무의", "이행"], 0)])
+        self.assertEqual(parse_query('"권리 남용"~3'), [(["권리", "남용"], 3)])
+
+    def test_all_keywords_required_and_ranked(self):
+        """Every keyword must match; results come best first"""
+        ranked = self.index.search("권리 의무")
+        self.assertEqual({doc for doc, _ in ranked}, {0, 1, 2})
+        scores = [score for _, score in ranked]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        # A rarer term outweighs a common one
+        self.assertEqual(self.index.search("권리 남용")[0][0], 1)
+        self.assertEqual(self.index.search("권리 성년"), [])
+
+    def test_matches_stem_with_particle(self):
+        """'권리' matches 권리의 / 권리는 / 권리와 (substring within a word)"""
+        self.assertIn(1, [doc for doc, _ in self.index.search("권리")])
+        self.assertEqual([doc for doc, _ in self.index.search("19세")], [3])
+        self.assertEqual([doc for doc, _ in self.index.search("9")], [3])
+
+    def test_phrase_and_proximity(self):
+        self.assertEqual([doc for doc, _ in self.index.search('"의무의 이행"')], [1])
+        self.assertEqual(self.index.search('"이행 의무의"'), [])
+        self.assertEqual([doc for doc, _ in self.index.search('"권리 남용"~2')], [1])
+        self.assertEqual(self.index.search('"목적 남용"~2'), [])
+
+    def test_snippet_highlights(self):
+        snippet = self.index.snippet(1, "남용")
+        self.assertIn("**남용**", snippet)
+        self.assertNotIn("\n", snippet)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from korean_law_mcp import utils
+from korean_law_mcp.utils import (
+    PREC_SECTIONS,
+    select_sections,
+    get_precedent_detail_internal,
+    get_statutory_interpretation_detail_internal,
+    get_admin_rule_detail_internal,
+)
+
+PREC = {'PrecService': {
+    '사건명': '손해배상', '사건번호': '2020다1234', '선고일자': '20210101', '법원명': '대법원',
+    '판시사항': '판시 내용', '판결요지': '요지 내용', '판례내용': '긴 판결 전문',
+    '참조조문': '민법 제750조',
+}}
+EXPC = {'ExpcService': {'안건명': '질의', '안건번호': '21-0001', '회신일자': '20210101',
+                        '질의요지': '묻는 내용', '회답': '답하는 내용', '이유': '긴 이유'}}
+ADMRUL = {'AdmRulService': {'행정규칙기본정보': {'행정규칙명': '고시', '소관부처명': '법무부'},
+                            '조문내용': '본문 내용', '부칙': '부칙 내용'}}
+
+def headings(text):
+    return [line for line in text.splitlines() if line.startswith("## ")]
+
+class TestSelectSections(unittest.TestCase):
+    def test_names_and_field_names(self):
+        self.assertIsNone(select_sections(None, PREC_SECTIONS))
+        self.assertIsNone(select_sections(" ", PREC_SECTIONS))
+        self.assertEqual(select_sections("Holding, 판결요지", PREC_SECTIONS), {"holding", "summary"})
+        self.assertEqual(select_sections("참조판례", PREC_SECTIONS), {"references"})
+
+    def test_unknown_section(self):
+        with self.assertRaisesRegex(ValueError, "Available: holding, summary, text, references"):
+            select_sections("holding,verdict", PREC_SECTIONS)
+
+class TestDetailProjection(unittest.TestCase):
+    def setUp(self):
+        client = mock.Mock()
+        client.get_precedent_detail.return_value = PREC
+        client.get_statutory_interpretation_detail.return_value = EXPC
+        client.get_admin_rule_detail.return_value = ADMRUL
+        patches = [mock.patch.object(utils, "client", client),
+                   mock.patch.object(utils, "index_document")]
+        self.index = patches[1].start()
+        self.addCleanup(patches[1].stop)
+        patches[0].start()
+        self.addCleanup(patches[0].stop)
+
+    def test_precedent_default_is_unchanged(self):
+        text = get_precedent_detail_internal("555")
+        self.assertEqual(headings(text), ["## 판시사항 (Holding)", "## 판결요지 (Summary)",
+                                          "## 전문 (Full Text)", "## 참조 정보 (Related Resources)"])
+        self.index.assert_called_once()
+
+    def test_precedent_summary_only(self):
+        text = get_precedent_detail_internal("555", sections="holding,summary")
+        self.assertEqual(headings(text), ["## 판시사항 (Holding)", "## 판결요지 (Summary)"])
+        self.assertNotIn("긴 판결 전문", text)
+        self.assertIn("**Case No:** 2020다1234", text)
+        # A fragment is not indexed as if it were the whole precedent
+        self.index.assert_not_called()
+
+    def test_unknown_section_is_reported_without_fetching(self):
+        self.assertTrue(get_precedent_detail_internal("555", sections="foo").startswith("Error: Unknown section"))
+        utils.client.get_precedent_detail.assert_not_called()
+
+    def test_interpretation_and_admin_rule(self):
+        text = get_statutory_interpretation_detail_internal("1", sections="answer")
+        self.assertEqual(headings(text), ["## 회답 (Answer)"])
+        self.assertNotIn("긴 이유", text)
+        self.assertNotIn("부칙 내용", get_admin_rule_detail_internal("777"))
+        text = get_admin_rule_detail_internal("777", sections="addenda")
+        self.assertIn("부칙 내용", text)
+        self.assertNotIn("본문 내용", text)
+
+    def test_precedent_sections_on_a_constitutional_decision(self):
+        utils.client.get_precedent_detail.return_value = {'Law': 'not found'}
+        utils.client.get_prec_const_detail.return_value = {'DetcService': {
+            '사건명': '헌법소원', '판시사항': '판시', '결정요지': '요지', '전문': '결정 전문'}}
+        with mock.patch.object(utils, "resource_ids", utils.ResourceIdMemory()):
+            text = get_precedent_detail_internal("900", sections="summary,references")
+            self.assertEqual(headings(text), ["## 결정요지 (Summary)"])
+            self.assertIn("Not available for a Constitutional Court decision: references", text)
+            text = get_precedent_detail_internal("900", sections="references")
+            self.assertTrue(text.startswith("Error: 900 is a Constitutional Court decision"))
+            self.assertIn("Available: holding, summary, text", text)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import asyncio
+import time
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from mcp.server.fastmcp import FastMCP
+from korean_law_mcp.server import offload
+
+class TestOffload(unittest.TestCase):
+    def test_slow_handler_does_not_block_cheap_one(self):
+        """A slow blocking tool on the heavy pool must not delay a cheap lookup"""
+        server = FastMCP("offload-test")
+
+        @offload(server.tool(), pool="heavy")
+        def slow_chain(query: str) -> str:
+            time.sleep(0.5)
+            return f"slow:{query}"
+
+        @offload(server.tool())
+        def cheap_lookup(query: str) -> str:
+            return f"cheap:{query}"
+
+        # The decorated names stay plain sync functions
+        self.assertEqual(cheap_lookup("x"), "cheap:x")
+
+        async def run():
+            timings = {}
+
+            async def timed(name):
+                start = time.perf_counter()
+                await server.call_tool(name, {"query": "q"})
+                timings[name] = time.perf_counter() - start
+
+            await asyncio.gather(timed("slow_chain"), timed("cheap_lookup"))
+            return timings
+
+        timings = asyncio.run(run())
+        self.assertGreaterEqual(timings["slow_chain"], 0.5)
+        self.assertLess(timings["cheap_lookup"], 0.2)
+        print(f"[PASS] cheap={timings['cheap_lookup']:.3f}s slow={timings['slow_chain']:.3f}s")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import asyncio
+import threading
+import time
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from korean_law_mcp.singleflight import SingleFlight, AsyncSingleFlight
+
+class TestSingleFlight(unittest.TestCase):
+    def test_threads_share_one_call(self):
+        """Concurrent callers for the same key share a single execution"""
+        flight = SingleFlight()
+        executions = []
+
+        def fetch(law_id):
+            executions.append(law_id)
+            time.sleep(0.2)
+            return {"법령": law_id}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do("265307", fetch, "265307"))) for _ in range(10)]
+        for t in threads: t.start()
+        for t in threads: t.join()
+
+        self.assertEqual(len(executions), 1)
+        self.assertEqual(len(results), 10)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual(flight.stats()["deduplicated"], 9)
+        self.assertEqual(flight.stats()["in_flight"], 0)
+
+    def test_exception_propagates_to_waiters(self):
+        flight = SingleFlight()
+        with self.assertRaises(ValueError):
+            flight.do("x", lambda: (_ for _ in ()).throw(ValueError("boom")))
+        # A later call runs again rather than reusing the failure
+        self.assertEqual(flight.do("x", lambda: 1), 1)
+
+    def test_async_callers_share_one_call(self):
+        flight = AsyncSingleFlight()
+        executions = []
+
+        async def fetch():
+            executions.append(1)
+            await asyncio.sleep(0.05)
+            return "민법"
+
+        async def run():
+            return await asyncio.gather(*(flight.do("k", fetch) for _ in range(50)))
+
+        results = asyncio.run(run())
+        self.assertEqual(results, ["민법"] * 50)
+        self.assertEqual(len(executions), 1)
+        self.assertEqual(flight.stats()["deduplicated"], 49)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+import unittest
+import sys
+import os
+import time
+from unittest import mock
+import requests
+import xmltodict
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from korean_law_mcp.streaming import iter_law_sections
+from korean_law_mcp.api_client import KoreanLawClient
+from korean_law_mcp.retry import RetryPolicy, DeadlineExceeded
+from korean_law_mcp import utils
+
+LAW_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<법령 법령키="0012345">
+  <기본정보><법령ID>001</법령ID><법령명_한글>민법</법령명_한글><시행일자>20240101</시행일자></기본정보>
+  <조문>
+    <조문단위 조문키="0001000">
+      <조문번호>1</조문번호><조문여부>조문</조문여부><조문제목>법원</조문제목>
+      <조문내용>제1조(법원) 민사에 관하여 법률에 규정이 없으면 관습법에 의한다.</조문내용>
+    </조문단위>
+    <조문단위 조문키="0002000">
+      <조문번호>2</조문번호><조문여부>조문</조문여부><조문제목>신의성실</조문제목>
+      <조문내용>제2조(신의성실)</조문내용>
+      <항><항번호>①</항번호><항내용>① 권리의 행사와 의무의 이행은 신의에 좇아 성실히 하여야 한다.</항내용></항>
+      <항><항번호>②</항번호><항내용>② 권리는 남용하지 못한다.</항내용>
+        <호><호번호>1.</호번호><호내용>호 내용</호내용></호>
+      </항>
+    </조문단위>
+  </조문>
+  <별표><별표단위><별표제목>별표 1</별표제목></별표단위></별표>
+</법령>
+""".encode("utf-8")
+
+def chunked(data, size):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+class TestIterLawSections(unittest.TestCase):
+    def test_matches_xmltodict(self):
+        """Streamed sections have the same shape as the xmltodict tree, whatever the chunk size"""
+        expected = xmltodict.parse(LAW_XML)['법령']
+        for size in (7, 64, len(LAW_XML)):
+            sections = list(iter_law_sections(chunked(LAW_XML, size)))
+            self.assertEqual([tag for tag, _ in sections], ['기본정보', '조문단위', '조문단위', '별표'])
+            self.assertEqual(sections[0][1], expected['기본정보'])
+            self.assertEqual([v for t, v in sections if t == '조문단위'], expected['조문']['조문단위'])
+            self.assertEqual(sections[3][1], expected['별표'])
+
+    def test_stops_reading_when_caller_stops(self):
+        """Breaking out of the loop stops consuming the byte stream"""
+        consumed = []
+
+        def source():
+            for chunk in chunked(LAW_XML, 16):
+                consumed.append(chunk)
+                yield chunk
+
+        for tag, _ in iter_law_sections(source()):
+            if tag == '조문단위':
+                break
+        self.assertLess(sum(len(c) for c in consumed), len(LAW_XML))
+
+    def test_error_document_yields_nothing(self):
+        """A non-법령 root (API error page) yields no sections"""
+        error = "<Law>일치하는 법령이 없습니다.</Law>".encode("utf-8")
+        self.assertEqual(list(iter_law_sections([error])), [])
+
+class FakeResponse:
+    def __init__(self, chunks, delay=0.0):
+        self.chunks = chunks
+        self.delay = delay
+        self.raw = mock.Mock()
+        self.closed = False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, size):
+        for chunk in self.chunks:
+            time.sleep(self.delay)
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class TestClientStream(unittest.TestCase):
+    def client(self, *responses, deadline=2.0):
+        session = mock.Mock()
+        session.get.side_effect = list(responses)
+        with mock.patch.dict(os.environ, {"OPEN_LAW_ID": "stream-test"}):
+            client = KoreanLawClient(session=session, cache=False, mirror=False)
+        client.retry = RetryPolicy(attempts=2, deadline=deadline, hedge=True, base=0.01)
+        return client
+
+    def test_retried_before_first_byte(self):
+        client = self.client(requests.ConnectionError("reset"), FakeResponse(list(chunked(LAW_XML, 64))))
+        self.assertEqual(b"".join(client.stream_law_detail("1")), LAW_XML)
+        self.assertEqual(client.session.get.call_count, 2)
+
+    def test_throttle_slot_released_at_headers(self):
+        response = FakeResponse(list(chunked(LAW_XML, 64)))
+        client = self.client(response)
+        chunks = client.stream_law_detail("1")
+        next(chunks)
+        # The caller is still reading the body, but no longer holds a concurrency slot
+        self.assertEqual(client.throttle.limiter.in_flight, 0)
+        chunks.close()
+        self.assertTrue(response.closed)
+
+    def test_trickling_body_hits_the_deadline(self):
+        response = FakeResponse(list(chunked(LAW_XML, 16)), delay=0.05)
+        client = self.client(response, deadline=0.3)
+        started = time.monotonic()
+        with self.assertRaises(DeadlineExceeded):
+            for _ in client.stream_law_detail("1"):
+                pass
+        self.assertLess(time.monotonic() - started, 1.0)
+        response.raw.shutdown.assert_called_once()
+
+class TestScanCoalescing(unittest.TestCase):
+    def test_second_reader_joins_a_full_load(self):
+        law = utils.ParsedLaw("scan-1", {'법령명_한글': '민법'}, {}, [
+            utils._parse_article_item({'조문번호': '1', '조문여부': '조문', '조문내용': '제1조 본문'}),
+        ])
+        utils._law_scans.add("scan-1")
+        self.addCleanup(utils._law_scans.discard, "scan-1")
+        with mock.patch.object(utils, "load_law", return_value=law) as load, \
+             mock.patch.object(utils.client, "stream_law_detail") as stream, \
+             mock.patch.object(utils, "get_default_store", return_value=None):
+            self.assertEqual([(name, art.no) for name, art in utils.scan_law("scan-1")], [("민법", "1")])
+        load.assert_called_once_with("scan-1")
+        stream.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+import asyncio
+import threading
+import time
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from korean_law_mcp.throttle import TokenBucket, AdaptiveLimiter, AsyncAdaptiveLimiter, Throttle
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_rate(self):
+        """The first `burst` calls are free; later ones are spaced at 1/rate"""
+        bucket = TokenBucket(rate=10, burst=3)
+        delays = [bucket.reserve() for _ in range(5)]
+        self.assertEqual(delays[:3], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(delays[3], 0.1, places=2)
+        self.assertAlmostEqual(delays[4], 0.2, places=2)
+
+class TestAdaptiveLimiter(unittest.TestCase):
+    def test_additive_increase_multiplicative_decrease(self):
+        limiter = AdaptiveLimiter(initial=4, min_limit=2, max_limit=10)
+        for _ in range(40):
+            limiter.acquire()
+            limiter.release(0.1, ok=True)
+        grown = limiter.limit
+        self.assertGreater(grown, 4)
+
+        limiter.acquire()
+        limiter.release(0.1, ok=False)
+        self.assertAlmostEqual(limiter.limit, grown * 0.7, places=5)
+
+        # Repeated errors inside the cooldown window do not collapse the limit further
+        limiter.acquire()
+        limiter.release(0.1, ok=False)
+        self.assertAlmostEqual(limiter.limit, grown * 0.7, places=5)
+
+    def test_latency_spike_backs_off(self):
+        limiter = AdaptiveLimiter(initial=8, min_limit=2, max_limit=8)
+        for _ in range(50):
+            limiter.acquire()
+            limiter.release(0.05, ok=True)
+        for _ in range(5):
+            limiter.acquire()
+            limiter.release(1.0, ok=True)
+        self.assertLess(limiter.limit, 8)
+
+class TestLimiterWakeups(unittest.TestCase):
+    def test_thousands_of_waiters_stay_linear(self):
+        """A release wakes only the waiters that can proceed, not the whole queue"""
+        async def run(n):
+            limiter = AsyncAdaptiveLimiter(initial=8, max_limit=8)
+            peak = [0]
+
+            async def one():
+                await limiter.acquire()
+                peak[0] = max(peak[0], limiter.in_flight)
+                await asyncio.sleep(0)
+                await limiter.release(0.01, ok=True)
+            started = time.monotonic()
+            await asyncio.gather(*(one() for _ in range(n)))
+            return time.monotonic() - started, peak[0], limiter.waiting
+
+        elapsed, peak, waiting = asyncio.run(run(4000))
+        self.assertLessEqual(peak, 8)
+        self.assertEqual(waiting, 0)
+        self.assertLess(elapsed, 1.0)
+
+    def test_cancelled_waiter_passes_its_wakeup_on(self):
+        async def run():
+            limiter = AsyncAdaptiveLimiter(initial=2, min_limit=1, max_limit=1)
+            await limiter.acquire()
+            first = asyncio.ensure_future(limiter.acquire())
+            second = asyncio.ensure_future(limiter.acquire())
+            await asyncio.sleep(0)
+            await limiter.release(0.01, ok=True)
+            first.cancel()
+            await asyncio.wait_for(second, 1.0)
+            return limiter.in_flight
+
+        self.assertEqual(asyncio.run(run()), 1)
+
+    def test_threads_are_woken_per_free_slot(self):
+        limiter = AdaptiveLimiter(initial=2, min_limit=2, max_limit=2)
+        done = []
+
+        def work():
+            limiter.acquire()
+            time.sleep(0.001)
+            limiter.release(0.01, ok=True)
+            done.append(1)
+        threads = [threading.Thread(target=work) for _ in range(50)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(5)
+        self.assertEqual((len(done), limiter.in_flight, limiter.waiting), (50, 0, 0))
+
+class TestThrottle(unittest.TestCase):
+    def test_queue_metrics_and_error_classification(self):
+        throttle = Throttle(TokenBucket(rate=20, burst=1), AdaptiveLimiter(), lambda e: isinstance(e, TimeoutError))
+        start = time.monotonic()
+        for _ in range(3):
+            with throttle.slot():
+                pass
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+        with self.assertRaises(TimeoutError):
+            with throttle.slot():
+                raise TimeoutError()
+        with self.assertRaises(KeyError):
+            with throttle.slot():
+                raise KeyError("not congestion")
+
+        stats = throttle.stats()
+        self.assertEqual(stats["calls"], 5)
+        self.assertEqual(stats["errors"], 1)
+        self.assertGreaterEqual(stats["delayed"], 2)
+        self.assertGreater(stats["max_wait_ms"], 0)
+        self.assertEqual(stats["in_flight"], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import asyncio
+import json
+import unittest
+import sys
+import os
+import httpx
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from korean_law_mcp.wire import decode
+from korean_law_mcp.async_client import AsyncKoreanLawClient
+from korean_law_mcp.utils import _parse_articles
+
+LAW_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<법령>
+  <기본정보><법령ID>001</법령ID><법령명_한글>민법</법령명_한글><소관부처>법무부</소관부처><공포번호/></기본정보>
+  <조문>
+    <조문단위>
+      <조문번호>2</조문번호><조문여부>조문</조문여부><조문제목>신의성실</조문제목>
+      <조문내용>제2조(신의성실)</조문내용>
+      <항><항번호>①</항번호><항내용>① 권리의 행사와 의무의 이행은 신의에 좇아 성실히 하여야 한다.</항내용></항>
+    </조문단위>
+  </조문>
+</법령>
+"""
+
+# The same document as DRF serves it with type=JSON: numbers unquoted, empty
+# values as "", and single items wrapped in lists
+LAW_JSON = json.dumps({
+    "법령": {
+        "기본정보": {"법령ID": "001", "법령명_한글": "민법", "소관부처": "법무부", "공포번호": ""},
+        "조문": {
+            "조문단위": [{
+                "조문번호": 2, "조문여부": "조문", "조문제목": "신의성실",
+                "조문내용": "제2조(신의성실)",
+                "항": [{"항번호": "①", "항내용": "① 권리의 행사와 의무의 이행은 신의에 좇아 성실히 하여야 한다."}],
+            }]
+        },
+    }
+}, ensure_ascii=False)
+
+class TestWireFormat(unittest.TestCase):
+    def test_json_normalised_to_xml_shape(self):
+        """A JSON body decodes to exactly what xmltodict gives for the XML body"""
+        from_xml = decode(LAW_XML.encode(), "XML")
+        from_json = decode(LAW_JSON.encode(), "JSON")
+        self.assertEqual(from_json, from_xml)
+        self.assertEqual(_parse_articles(from_json['법령']), _parse_articles(from_xml['법령']))
+
+    def test_async_client_requests_json(self):
+        """wire_format='JSON' sends type=JSON and returns the usual shape"""
+        seen = []
+
+        def handler(request):
+            seen.append(request.url.params["type"])
+            return httpx.Response(200, content=LAW_JSON.encode())
+
+        async def run():
+            http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncKoreanLawClient(http_client=http, wire_format="json") as client:
+                return await client.get_law_detail("12345")
+
+        data = asyncio.run(run())
+        self.assertEqual(seen, ["JSON"])
+        self.assertEqual(data['법령']['기본정보']['법령명_한글'], "민법")
+
+    def test_rejects_unknown_format(self):
+        with self.assertRaises(ValueError):
+            AsyncKoreanLawClient(wire_format="yaml")
+
+if __name__ == '__main__':
+    unittest.main()